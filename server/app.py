@@ -64,6 +64,9 @@ def create_app():
     scenario_controller = ScenarioController(nasa_api_manager, viz_manager)
     prediction_controller = PredictionController()
     
+    # Build the cached scenario detail bodies up front (once, before gunicorn forks)
+    scenario_controller.warm_scenario_details()
+    
     # Register blueprints
     app.register_blueprint(tsunami_bp)
     app.register_blueprint(asteroid_bp, url_prefix='/api')
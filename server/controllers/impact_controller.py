@@ -11,7 +11,8 @@ import logging
 from typing import Dict, Any, List, Optional
 import traceback
 
-from models.asteroid_impact import AsteroidImpact
+from models.asteroid_impact import AsteroidImpact, analyze_impacts_batch
+from utils.json_response import json_response
 from utils.nasa_apis import NASAAPIManager
 from utils.visualization import VisualizationManager
 
@@ -133,14 +134,15 @@ class ImpactController:
                         'energy_megatons': analysis['energy']['energy_tnt_megatons'],
                         'seismic_magnitude': analysis['seismic']['moment_magnitude'],
                         'crater_diameter_km': analysis['crater']['diameter_km'],
-                        'max_damage_range_km': max(analysis['air_blast_ranges'].values()) if analysis['air_blast_ranges'] else 0,
+                        'max_damage_range_km': max(analysis['air_blast_ranges'].values(), default=0),
                         'total_fatalities': casualties.get('totals', {}).get('fatalities', 0),
                         'total_injuries': casualties.get('totals', {}).get('injuries', 0)
                     }
                 }
             }
             
-            return jsonify(response_data)
+            # Regional data and shake map make this the largest impact payload
+            return json_response(response_data)
             
         except ValueError as e:
             logger.error(f"Value error in analyze_impact: {str(e)}")
@@ -276,38 +278,39 @@ class ImpactController:
             else:
                 values = data['values']
             
-            # Perform parameter study
-            results = []
+            # Perform parameter study: every value in one vectorized pass
             base_diameter = float(data['base_diameter_m'])
-            
-            for value in values:
-                if parameter == 'diameter':
-                    asteroid = AsteroidImpact(value, 20, 2600, 45)
-                elif parameter == 'velocity':
-                    asteroid = AsteroidImpact(base_diameter, value, 2600, 45)
-                elif parameter == 'angle':
-                    asteroid = AsteroidImpact(base_diameter, 20, 2600, value)
-                
-                analysis = asteroid.get_comprehensive_analysis()
-                blast = analysis['air_blast_ranges']
-                
-                result = {
+            n = len(values)
+            
+            if parameter == 'diameter':
+                diameters, velocities, angles = values, [20] * n, [45] * n
+            elif parameter == 'velocity':
+                diameters, velocities, angles = [base_diameter] * n, values, [45] * n
+            elif parameter == 'angle':
+                diameters, velocities, angles = [base_diameter] * n, [20] * n, values
+            
+            metrics = analyze_impacts_batch(diameters, velocities, [2600] * n, angles)
+            columns = zip(*[metrics[key].tolist() for key in (
+                'energy_tnt_megatons', 'moment_magnitude', 'crater_diameter_km',
+                'crater_depth_m', '20_psi_km', '1_psi_km'
+            )])
+            
+            results = [
+                {
                     'parameter_value': value,
-                    'energy_mt': analysis['energy']['energy_tnt_megatons'],
-                    'seismic_magnitude': analysis['seismic']['moment_magnitude'],
-                    'crater_diameter_km': analysis['crater']['diameter_km'],
-                    'crater_depth_m': analysis['crater']['depth_m'],
-                    'severe_damage_km': blast.get('20_psi_km', 0),
-                    'light_damage_km': blast.get('1_psi_km', 0),
-                    'analysis': analysis
+                    'energy_mt': energy_mt,
+                    'seismic_magnitude': magnitude,
+                    'crater_diameter_km': crater_km,
+                    'crater_depth_m': crater_depth_m,
+                    'severe_damage_km': severe_km,
+                    'light_damage_km': light_km
                 }
-                
-                results.append(result)
+                for value, (energy_mt, magnitude, crater_km, crater_depth_m, severe_km, light_km)
+                in zip(values, columns)
+            ]
             
             # Create chart data
-            chart_data = self.viz_manager.create_parameter_study_chart(
-                parameter, values, [r['analysis'] for r in results]
-            )
+            chart_data = self.viz_manager.create_parameter_study_chart(parameter, values, metrics)
             
             # Prepare response
             response_data = {
@@ -354,7 +357,7 @@ class ImpactController:
                 }
             }
             
-            return jsonify(response_data)
+            return json_response(response_data)
             
         except ValueError as e:
             logger.error(f"Value error in parameter_study: {str(e)}")
@@ -432,7 +435,7 @@ class ImpactController:
                 data.get('title', 'Asteroid Impact Shake Map')
             )
             
-            return jsonify({
+            return json_response({
                 'success': True,
                 'data': shake_map_data
             })
@@ -488,7 +491,7 @@ class ImpactController:
             # Generate chart data
             chart_data = self.viz_manager.create_impact_chart_data(asteroid)
             
-            return jsonify({
+            return json_response({
                 'success': True,
                 'data': chart_data
             })
@@ -68,10 +68,8 @@ class StrategicImpactGenerator:
                 if not (ast_state.get('success') and earth_state.get('success')):
                     continue
                 
-                # Calculate real distance
-                ast_pos = np.array(ast_state['position_km'])
-                earth_pos = np.array(earth_state['position_km'])
-                distance = np.linalg.norm(ast_pos - earth_pos)
+                # Calculate real distance (fused on the 3-element lists, no temporary arrays)
+                distance = math.dist(ast_state['position_km'], earth_state['position_km'])
                 
                 trajectory_points.append({
                     'date': check_date,
@@ -105,9 +103,7 @@ class StrategicImpactGenerator:
                     earth_state = self.orbital_mechanics.calculate_earth_position(current_time)
                     
                     if ast_state.get('success') and earth_state.get('success'):
-                        ast_pos = np.array(ast_state['position_km'])
-                        earth_pos = np.array(earth_state['position_km'])
-                        distance = np.linalg.norm(ast_pos - earth_pos)
+                        distance = math.dist(ast_state['position_km'], earth_state['position_km'])
                         
                         # Update closest approach if we found something closer
                         if distance < closest_approach['distance']:
@@ -432,9 +428,7 @@ class PredictionController:
                     refined_earth = self.orbital_mechanics.calculate_earth_position(refined_time)
                     
                     if refined_ast.get('success') and refined_earth.get('success'):
-                        refined_distance = np.linalg.norm(
-                            np.array(refined_ast['position_km']) - np.array(refined_earth['position_km'])
-                        )
+                        refined_distance = math.dist(refined_ast['position_km'], refined_earth['position_km'])
                         
                         if refined_distance < best_distance:
                             best_distance = refined_distance
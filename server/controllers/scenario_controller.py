@@ -6,17 +6,24 @@ Controller for handling pre-defined asteroid impact scenarios.
 Provides endpoints for scenario listing, execution, and comparison.
 """
 
-from flask import request, jsonify
+from flask import request, Response
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-import traceback
 
-from models.scenarios import ImpactScenarios
+from models import SCENARIOS
 from utils.nasa_apis import NASAAPIManager
 from utils.visualization import VisualizationManager
+from utils.json_response import json_dumps, json_response, stream_json_response
+from utils.schemas import SchemaError, CompareScenariosRequest, SearchScenariosRequest
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for overlapping network-bound lookups with local computation
+EXEC = ThreadPoolExecutor(max_workers=8)
+
 
 class ScenarioController:
     """Controller for scenario management endpoints."""
@@ -25,7 +32,21 @@ class ScenarioController:
         """Initialize controller with API and visualization managers."""
         self.nasa_api = nasa_api_manager
         self.viz_manager = viz_manager
-        self.scenarios = ImpactScenarios()
+        self.scenarios = SCENARIOS
+        
+        # Scenario details are deterministic in the scenario name, so build each
+        # response body once (on first request, or via warm_scenario_details)
+        self._build_scenario_details = lru_cache(maxsize=len(self.scenarios.get_scenarios()))(
+            self._build_scenario_details
+        )
+    
+    def warm_scenario_details(self) -> None:
+        """Precompute scenario details so the first request is served from cache (called at app startup)."""
+        for scenario_name in self.scenarios.get_scenarios().keys():
+            try:
+                self._build_scenario_details(scenario_name)
+            except Exception as e:
+                logger.warning(f"Failed to warm details for scenario {scenario_name}: {str(e)}")
     
     def get_scenarios(self) -> Dict[str, Any]:
         """
@@ -38,9 +59,13 @@ class ScenarioController:
             scenarios = self.scenarios.get_scenarios()
             categories = self.scenarios.get_scenario_categories()
             
-            # Organize scenarios for frontend
+            # Organize scenarios for frontend, counting in the same pass
             scenario_list = []
+            historical_count = 0
+            category_counts = Counter()
             for name, scenario in scenarios.items():
+                historical_count += bool(scenario.get('historical', False))
+                category_counts[scenario.get('category', 'unknown')] += 1
                 scenario_list.append({
                     'id': name,
                     'name': scenario['name'],
@@ -56,24 +81,24 @@ class ScenarioController:
                     }
                 })
             
-            return jsonify({
+            return json_response({
                 'success': True,
                 'data': {
                     'scenarios': scenario_list,
                     'categories': categories,
                     'total_scenarios': len(scenario_list),
-                    'historical_count': len([s for s in scenario_list if s['historical']]),
-                    'category_counts': {cat: len(scenarios) for cat, scenarios in categories.items()}
+                    'historical_count': historical_count,
+                    'category_counts': dict(category_counts)
                 }
             })
             
         except Exception as e:
             logger.error(f"Error in get_scenarios: {str(e)}")
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Failed to retrieve scenarios',
                 'details': str(e)
-            }), 500
+            }, 500)
     
     def get_scenario_details(self, scenario_name: str) -> Dict[str, Any]:
         """
@@ -86,68 +111,77 @@ class ScenarioController:
             JSON response with scenario details
         """
         try:
-            scenario = self.scenarios.get_scenario_by_name(scenario_name)
-            
-            if not scenario:
-                return jsonify({
+            if not self.scenarios.get_scenario_by_name(scenario_name):
+                return json_response({
                     'success': False,
                     'error': f'Scenario "{scenario_name}" not found'
-                }), 404
+                }, 404)
             
-            # Create asteroid for analysis preview
-            asteroid = self.scenarios.create_asteroid_from_scenario(scenario_name)
-            if not asteroid:
-                return jsonify({
+            body = self._build_scenario_details(scenario_name)
+            if body is None:
+                return json_response({
                     'success': False,
                     'error': 'Failed to create asteroid from scenario'
-                }), 500
-            
-            # Get basic analysis
-            analysis = asteroid.get_comprehensive_analysis()
-            
-            response_data = {
-                'success': True,
-                'data': {
-                    'scenario_info': {
-                        'id': scenario_name,
-                        'name': scenario['name'],
-                        'description': scenario['description'],
-                        'category': scenario.get('category', 'unknown'),
-                        'historical': scenario.get('historical', False),
-                        'location': scenario['location']
-                    },
-                    'asteroid_parameters': {
-                        'diameter_m': scenario['diameter_m'],
-                        'velocity_km_s': scenario['velocity_km_s'],
-                        'density_kg_m3': scenario['density_kg_m3'],
-                        'angle_degrees': scenario['angle_degrees']
-                    },
-                    'preview_analysis': {
-                        'energy_megatons': round(analysis['energy']['energy_tnt_megatons'], 3),
-                        'seismic_magnitude': round(analysis['seismic']['moment_magnitude'], 2),
-                        'crater_diameter_km': round(analysis['crater']['diameter_km'], 3),
-                        'crater_depth_m': round(analysis['crater']['depth_m'], 1),
-                        'max_damage_range_km': round(max(analysis['air_blast_ranges'].values()) if analysis['air_blast_ranges'] else 0, 2)
-                    },
-                    'damage_zones': {
-                        'severe_destruction_km': analysis['air_blast_ranges'].get('20_psi_km', 0),
-                        'heavy_damage_km': analysis['air_blast_ranges'].get('5_psi_km', 0),
-                        'light_damage_km': analysis['air_blast_ranges'].get('1_psi_km', 0),
-                        'thermal_burns_km': analysis['air_blast_ranges'].get('thermal_3rd_degree_km', 0)
-                    }
-                }
-            }
+                }, 500)
             
-            return jsonify(response_data)
+            return Response(body, mimetype='application/json')
             
         except Exception as e:
-            logger.error(f"Error in get_scenario_details: {str(e)}")
-            logger.error(traceback.format_exc())
-            return jsonify({
+            logger.exception(f"Error in get_scenario_details: {str(e)}")
+            return json_response({
                 'success': False,
                 'error': 'Failed to retrieve scenario details',
                 'details': str(e)
-            }), 500
+            }, 500)
+    
+    def _build_scenario_details(self, scenario_name: str) -> Optional[bytes]:
+        """
+        Build the serialized details response for a scenario.
+        
+        Args:
+            scenario_name (str): Name of an existing scenario
+            
+        Returns:
+            bytes: JSON response body, or None if the asteroid could not be created
+        """
+        scenario = self.scenarios.get_scenario_by_name(scenario_name)
+        
+        # Create asteroid for analysis preview
+        asteroid = self.scenarios.create_asteroid_from_scenario(scenario_name)
+        if not asteroid:
+            return None
+        
+        # Get basic analysis
+        analysis = asteroid.get_comprehensive_analysis()
+        
+        response_data = {
+            'success': True,
+            'data': {
+                'scenario_info': {
+                    'id': scenario_name,
+                    'name': scenario['name'],
+                    'description': scenario['description'],
+                    'category': scenario.get('category', 'unknown'),
+                    'historical': scenario.get('historical', False),
+                    'location': scenario['location']
+                },
+                'asteroid_parameters': {
+                    'diameter_m': scenario['diameter_m'],
+                    'velocity_km_s': scenario['velocity_km_s'],
+                    'density_kg_m3': scenario['density_kg_m3'],
+                    'angle_degrees': scenario['angle_degrees']
+                },
+                'preview_analysis': analysis['preview'],
+                'damage_zones': {
+                    'severe_destruction_km': analysis['air_blast_ranges'].get('20_psi_km', 0),
+                    'heavy_damage_km': analysis['air_blast_ranges'].get('5_psi_km', 0),
+                    'light_damage_km': analysis['air_blast_ranges'].get('1_psi_km', 0),
+                    'thermal_burns_km': analysis['air_blast_ranges'].get('thermal_3rd_degree_km', 0)
+                }
+            }
+        }
+        
+        return json_dumps(response_data)
     
     def run_scenario(self, scenario_name: str, request) -> Dict[str, Any]:
         """
@@ -171,10 +205,10 @@ class ScenarioController:
             scenario = self.scenarios.get_scenario_by_name(scenario_name)
             
             if not scenario:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': f'Scenario "{scenario_name}" not found'
-                }), 404
+                }, 404)
             
             # Check for custom location
             custom_location = None
@@ -190,39 +224,28 @@ class ScenarioController:
                         )
                         
                         if not coord_validation['valid']:
-                            return jsonify({
+                            return json_response({
                                 'success': False,
                                 'error': 'Invalid custom location coordinates',
                                 'details': coord_validation['errors']
-                            }), 400
+                            }, 400)
             
             # Run scenario analysis
-            scenario_results = self.scenarios.run_scenario_analysis(scenario_name, custom_location)
+            scenario_results, asteroid = self.scenarios.run_scenario_analysis(scenario_name, custom_location)
             
             if not scenario_results:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': 'Failed to analyze scenario'
-                }), 500
+                }, 500)
             
-            # Get regional impact data
+            # Get regional impact data in the background while local work runs
             location = scenario_results['impact_location']
-            regional_data = self.nasa_api.get_regional_impact_data(
+            regional_future = EXEC.submit(
+                self.nasa_api.get_regional_impact_data,
                 location['latitude'], location['longitude']
             )
             
-            # Create asteroid object for casualty calculation
-            asteroid = self.scenarios.create_asteroid_from_scenario(scenario_name)
-            
-            # Calculate casualties if population data available
-            casualties = {}
-            if regional_data['regional_population']['status'] in ['success', 'fallback']:
-                pop_data = regional_data['regional_population']
-                casualties = asteroid.estimate_casualties(
-                    pop_data['population_density_per_km2'],
-                    pop_data['population_estimate']
-                )
-            
             # Create visualizations
             shake_map_data = self.viz_manager.create_shake_map_data(
                 location['latitude'], location['longitude'], asteroid,
@@ -231,44 +254,73 @@ class ScenarioController:
             
             chart_data = self.viz_manager.create_impact_chart_data(asteroid)
             
-            # Prepare comprehensive response
-            response_data = {
-                'success': True,
-                'data': {
-                    'scenario_info': scenario_results['scenario_info'],
-                    'impact_location': scenario_results['impact_location'],
-                    'asteroid_data': scenario_results['asteroid_data'],
-                    'analysis': scenario_results['analysis'],
-                    'casualties': casualties,
-                    'regional_data': regional_data,
-                    'visualizations': {
-                        'shake_map': shake_map_data,
-                        'charts': chart_data
-                    },
-                    'summary': {
+            def sections():
+                # Locally computed sections go out while the regional lookup is in flight
+                yield 'scenario_info', scenario_results['scenario_info']
+                yield 'impact_location', scenario_results['impact_location']
+                yield 'asteroid_data', scenario_results['asteroid_data']
+                yield 'analysis', scenario_results['analysis']
+                yield 'visualizations', {
+                    'shake_map': shake_map_data,
+                    'charts': chart_data
+                }
+                yield 'execution_info', {
+                    'scenario_name': scenario_name,
+                    'used_custom_location': custom_location is not None,
+                    'location_source': 'custom' if custom_location else 'scenario_default'
+                }
+                
+                try:
+                    regional_data = regional_future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching regional data for {scenario_name}: {str(e)}")
+                    yield 'regional_data', {'status': 'error', 'error': str(e)}
+                    return {
+                        'success': False,
+                        'error': 'Failed to fetch regional data',
+                        'details': str(e)
+                    }
+                
+                yield 'regional_data', regional_data
+                
+                # The 200 status is already sent, so a failure from here on is
+                # reported through the trailing success flag instead
+                try:
+                    # Calculate casualties if population data available
+                    casualties = {}
+                    pop_data = regional_data['regional_population']
+                    if pop_data['status'] in ['success', 'fallback']:
+                        casualties = asteroid.estimate_casualties(
+                            pop_data['population_density_per_km2'],
+                            pop_data['population_estimate']
+                        )
+                    
+                    summary = {
                         **scenario_results['summary'],
                         'total_fatalities': casualties.get('totals', {}).get('fatalities', 0),
                         'total_injuries': casualties.get('totals', {}).get('injuries', 0),
                         'affected_population': casualties.get('totals', {}).get('affected_population', 0)
-                    },
-                    'execution_info': {
-                        'scenario_name': scenario_name,
-                        'used_custom_location': custom_location is not None,
-                        'location_source': 'custom' if custom_location else 'scenario_default'
                     }
-                }
-            }
+                except Exception as e:
+                    logger.exception(f"Error estimating casualties for {scenario_name}: {str(e)}")
+                    return {
+                        'success': False,
+                        'error': 'Failed to run scenario',
+                        'details': str(e)
+                    }
+                
+                yield 'casualties', casualties
+                yield 'summary', summary
             
-            return jsonify(response_data)
+            return stream_json_response('data', sections(), {'success': True})
             
         except Exception as e:
-            logger.error(f"Error in run_scenario: {str(e)}")
-            logger.error(traceback.format_exc())
-            return jsonify({
+            logger.exception(f"Error in run_scenario: {str(e)}")
+            return json_response({
                 'success': False,
                 'error': 'Failed to run scenario',
                 'details': str(e)
-            }), 500
+            }, 500)
     
     def compare_scenarios(self, request) -> Dict[str, Any]:
         """
@@ -282,37 +334,25 @@ class ScenarioController:
         """
         try:
             if not request.is_json:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': 'Request must be JSON'
-                }), 400
+                }, 400)
             
             data = request.get_json()
             
-            if 'scenario_names' not in data:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing required parameter: scenario_names'
-                }), 400
-            
-            scenario_names = data['scenario_names']
-            
-            if not isinstance(scenario_names, list) or len(scenario_names) < 2:
-                return jsonify({
-                    'success': False,
-                    'error': 'scenario_names must be a list with at least 2 scenarios'
-                }), 400
+            scenario_names = CompareScenariosRequest.from_json(data).scenario_names
             
             # Validate scenario names
             available_scenarios = self.scenarios.get_scenarios()
             invalid_scenarios = [name for name in scenario_names if name not in available_scenarios]
             
             if invalid_scenarios:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': f'Invalid scenario names: {", ".join(invalid_scenarios)}',
                     'available_scenarios': list(available_scenarios.keys())
-                }), 400
+                }, 400)
             
             # Perform comparison
             comparison_results = self.scenarios.compare_scenarios(scenario_names)
@@ -320,11 +360,24 @@ class ScenarioController:
             # Add additional analysis
             comparison_data = comparison_results['comparison_data']
             
+            most_powerful = least_powerful = largest_crater = widest_damage = None
+            
             # Calculate relative scales
             if comparison_data:
-                energy_values = [item['energy_mt'] for item in comparison_data]
-                max_energy = max(energy_values)
-                min_energy = min(energy_values)
+                # Find all extrema in a single pass (first match wins on ties, like max/min)
+                most_powerful = least_powerful = largest_crater = widest_damage = comparison_data[0]
+                for item in comparison_data[1:]:
+                    if item['energy_mt'] > most_powerful['energy_mt']:
+                        most_powerful = item
+                    if item['energy_mt'] < least_powerful['energy_mt']:
+                        least_powerful = item
+                    if item['crater_diameter_km'] > largest_crater['crater_diameter_km']:
+                        largest_crater = item
+                    if item['light_damage_range_km'] > widest_damage['light_damage_range_km']:
+                        widest_damage = item
+                
+                max_energy = most_powerful['energy_mt']
+                min_energy = least_powerful['energy_mt']
                 
                 for item in comparison_data:
                     item['energy_scale_factor'] = item['energy_mt'] / min_energy if min_energy > 0 else 1
@@ -347,10 +400,10 @@ class ScenarioController:
                     'summary_statistics': {
                         'energy_range': comparison_results['energy_range'],
                         'size_range': comparison_results['size_range'],
-                        'most_powerful': max(comparison_data, key=lambda x: x['energy_mt']) if comparison_data else None,
-                        'least_powerful': min(comparison_data, key=lambda x: x['energy_mt']) if comparison_data else None,
-                        'largest_crater': max(comparison_data, key=lambda x: x['crater_diameter_km']) if comparison_data else None,
-                        'widest_damage': max(comparison_data, key=lambda x: x['light_damage_range_km']) if comparison_data else None
+                        'most_powerful': most_powerful,
+                        'least_powerful': least_powerful,
+                        'largest_crater': largest_crater,
+                        'widest_damage': widest_damage
                     },
                     'visualization_data': {
                         'energy_comparison': [
@@ -377,16 +430,21 @@ class ScenarioController:
                 }
             }
             
-            return jsonify(response_data)
+            return json_response(response_data)
+            
+        except SchemaError as e:
+            return json_response({
+                'success': False,
+                'error': str(e)
+            }, 400)
             
         except Exception as e:
-            logger.error(f"Error in compare_scenarios: {str(e)}")
-            logger.error(traceback.format_exc())
-            return jsonify({
+            logger.exception(f"Error in compare_scenarios: {str(e)}")
+            return json_response({
                 'success': False,
                 'error': 'Failed to compare scenarios',
                 'details': str(e)
-            }), 500
+            }, 500)
     
     def search_scenarios(self, request) -> Dict[str, Any]:
         """
@@ -399,26 +457,14 @@ class ScenarioController:
         """
         try:
             if not request.is_json:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': 'Request must be JSON'
-                }), 400
+                }, 400)
             
             data = request.get_json()
             
-            if 'query' not in data:
-                return jsonify({
-                    'success': False,
-                    'error': 'Missing required parameter: query'
-                }), 400
-            
-            query = data['query'].strip()
-            
-            if not query:
-                return jsonify({
-                    'success': False,
-                    'error': 'Query cannot be empty'
-                }), 400
+            query = SearchScenariosRequest.from_json(data).query
             
             # Perform search
             search_results = self.scenarios.search_scenarios(query)
@@ -442,7 +488,7 @@ class ScenarioController:
                     }
                 })
             
-            return jsonify({
+            return json_response({
                 'success': True,
                 'data': {
                     'query': query,
@@ -451,10 +497,16 @@ class ScenarioController:
                 }
             })
             
+        except SchemaError as e:
+            return json_response({
+                'success': False,
+                'error': str(e)
+            }, 400)
+            
         except Exception as e:
             logger.error(f"Error in search_scenarios: {str(e)}")
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Failed to search scenarios',
                 'details': str(e)
-            }), 500
\ No newline at end of file
+            }, 500)
\ No newline at end of file
@@ -6,8 +6,14 @@ REST API endpoints for tsunami risk assessment based on asteroid impact scenario
 Analyzes elevation data and coastal proximity to determine tsunami generation potential.
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from utils.nasa_apis import NASAAPIManager
+from utils.json_response import json_response
+from utils.schemas import SchemaError, TsunamiAssessRequest
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +24,38 @@ tsunami_bp = Blueprint('tsunami', __name__, url_prefix='/api/tsunami')
 # Initialize NASA API manager
 nasa_manager = NASAAPIManager()
 
+# Shared pool for batch assessments
+EXEC = ThreadPoolExecutor(max_workers=8)
+
+# Upper bound on points accepted by a single batch request
+MAX_BATCH_POINTS = 1000
+
+
+class _ElevationUnavailable(Exception):
+    """Raised for fallback elevation lookups so they are not cached."""
+    
+    def __init__(self, elevation_data):
+        super().__init__(elevation_data.get('error', 'elevation unavailable'))
+        self.elevation_data = elevation_data
+
+
+@lru_cache(maxsize=100000)
+def _cached_elevation(lat_q: float, lon_q: float):
+    """Elevation lookup for a quantized (0.01°, ~1 km) tile; only successes are cached."""
+    elevation_data = nasa_manager.get_elevation_single(lat_q, lon_q)
+    if elevation_data.get('status') != 'success':
+        raise _ElevationUnavailable(elevation_data)
+    return elevation_data
+
+
+def get_tile_elevation(latitude: float, longitude: float):
+    """Get elevation data for the ~1 km tile containing the given coordinates."""
+    try:
+        return _cached_elevation(round(latitude, 2), round(longitude, 2))
+    except _ElevationUnavailable as e:
+        return e.elevation_data
+
+
 @tsunami_bp.route('/assess', methods=['POST'])
 def assess_tsunami_risk():
     """
@@ -44,54 +82,11 @@ def assess_tsunami_risk():
     }
     """
     try:
-        data = request.get_json()
-        
-        # Validate required parameters
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is required'
-            }), 400
-        
-        required_fields = ['latitude', 'longitude', 'diameter_m']
-        missing_fields = [field for field in required_fields if field not in data]
-        
-        if missing_fields:
-            return jsonify({
-                'success': False,
-                'error': f'Missing required fields: {", ".join(missing_fields)}'
-            }), 400
-        
-        # Extract parameters
-        latitude = float(data['latitude'])
-        longitude = float(data['longitude'])
-        diameter_m = float(data['diameter_m'])
-        search_radius_km = float(data.get('search_radius_km', 1000))
-        
-        # Validate parameter ranges
-        if not (-90 <= latitude <= 90):
-            return jsonify({
-                'success': False,
-                'error': 'Latitude must be between -90 and 90 degrees'
-            }), 400
-        
-        if not (-180 <= longitude <= 180):
-            return jsonify({
-                'success': False,
-                'error': 'Longitude must be between -180 and 180 degrees'
-            }), 400
-        
-        if diameter_m <= 0:
-            return jsonify({
-                'success': False,
-                'error': 'Asteroid diameter must be positive'
-            }), 400
-        
-        if search_radius_km <= 0 or search_radius_km > 5000:
-            return jsonify({
-                'success': False,
-                'error': 'Search radius must be between 0 and 5000 km'
-            }), 400
+        payload = TsunamiAssessRequest.from_json(request.get_json())
+        latitude = payload.latitude
+        longitude = payload.longitude
+        diameter_m = payload.diameter_m
+        search_radius_km = payload.search_radius_km
         
         # Perform tsunami risk assessment
         logger.info(f"Assessing tsunami risk for impact at ({latitude}, {longitude}) "
@@ -100,30 +95,182 @@ def assess_tsunami_risk():
         assessment_result = nasa_manager.assess_tsunami_risk(
             impact_lat=latitude,
             impact_lon=longitude,
-            diameter_m=diameter_m,
+            asteroid_diameter_m=diameter_m,
             search_radius_km=search_radius_km
         )
         
         # Return successful response
-        return jsonify({
+        return json_response({
             'success': True,
             'data': assessment_result,
             'message': f'Tsunami risk assessment completed for {diameter_m}m asteroid impact'
         })
     
+    except SchemaError as e:
+        return json_response({
+            'success': False,
+            'error': str(e)
+        }, 400)
+    
     except ValueError as e:
         logger.error(f"Invalid parameter values: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': f'Invalid parameter values: {str(e)}'
-        }), 400
+        }, 400)
     
     except Exception as e:
         logger.error(f"Error in tsunami risk assessment: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': f'Failed to assess tsunami risk: {str(e)}'
-        }), 500
+        }, 500)
+
+
+def _parse_batch_point(point) -> Tuple[Optional[List[float]], Optional[str]]:
+    """Convert a batch point to a numeric row, or return an error message."""
+    try:
+        return list(TsunamiAssessRequest.parse_fields(point)), None
+    except SchemaError as e:
+        return None, str(e)
+
+
+def _validate_batch_ranges(rows: List[List[float]]) -> List[Dict[str, Any]]:
+    """
+    Check coordinate and parameter ranges for all batch rows at once.
+    
+    Args:
+        rows (list): Numeric rows of [latitude, longitude, diameter_m, search_radius_km]
+        
+    Returns:
+        list: Index/error entries for rows that are out of range
+    """
+    arr = np.asarray(rows, dtype=np.float64)
+    lat, lon, diameter, radius = arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+    
+    # Comparisons are written so NaN values are rejected as well
+    checks = [
+        (~((lat >= -90) & (lat <= 90)), 'Latitude must be between -90 and 90 degrees'),
+        (~((lon >= -180) & (lon <= 180)), 'Longitude must be between -180 and 180 degrees'),
+        (~(diameter > 0), 'Asteroid diameter must be positive'),
+        (~((radius > 0) & (radius <= 5000)), 'Search radius must be between 0 and 5000 km')
+    ]
+    
+    bad = np.zeros(len(arr), dtype=bool)
+    for mask, _ in checks:
+        bad |= mask
+    
+    errors = []
+    for index in np.flatnonzero(bad).tolist():
+        error = next(message for mask, message in checks if mask[index])
+        errors.append({'index': index, 'error': error})
+    return errors
+
+
+def _assess_batch_point(row: List[float]) -> dict:
+    """Run a tsunami assessment for one validated batch row."""
+    lat, lon, diameter_m, search_radius_km = row
+    return nasa_manager.assess_tsunami_risk(
+        impact_lat=lat,
+        impact_lon=lon,
+        asteroid_diameter_m=diameter_m,
+        search_radius_km=search_radius_km
+    )
+
+
+@tsunami_bp.route('/assess-batch', methods=['POST'])
+def assess_tsunami_risk_batch():
+    """
+    🌊 Assess tsunami risk for many impact points in one request
+    
+    POST /api/tsunami/assess-batch
+    Body: {
+        "points": [
+            {
+                "latitude": float,
+                "longitude": float,
+                "diameter_m": float,
+                "search_radius_km": float (optional, default: 1000)
+            },
+            ...
+        ]
+    }
+    
+    Returns: {
+        "success": bool,
+        "data": {
+            "results": list,
+            "total_points": int
+        }
+    }
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or 'points' not in data:
+            return json_response({
+                'success': False,
+                'error': 'Missing required parameter: points'
+            }, 400)
+        
+        points = data['points']
+        
+        if not isinstance(points, list) or not points:
+            return json_response({
+                'success': False,
+                'error': 'points must be a non-empty list'
+            }, 400)
+        
+        if len(points) > MAX_BATCH_POINTS:
+            return json_response({
+                'success': False,
+                'error': f'Too many points (maximum {MAX_BATCH_POINTS})'
+            }, 400)
+        
+        # Validate every point up front so the batch fails fast
+        rows = []
+        row_indices = []
+        invalid_points = []
+        for index, point in enumerate(points):
+            row, error = _parse_batch_point(point)
+            if error:
+                invalid_points.append({'index': index, 'error': error})
+            else:
+                rows.append(row)
+                row_indices.append(index)
+        
+        if rows:
+            for entry in _validate_batch_ranges(rows):
+                entry['index'] = row_indices[entry['index']]
+                invalid_points.append(entry)
+            invalid_points.sort(key=lambda entry: entry['index'])
+        
+        if invalid_points:
+            return json_response({
+                'success': False,
+                'error': 'Invalid points in batch',
+                'details': invalid_points
+            }, 400)
+        
+        logger.info(f"Assessing tsunami risk for batch of {len(points)} points")
+        
+        results = list(EXEC.map(_assess_batch_point, rows))
+        
+        return json_response({
+            'success': True,
+            'data': {
+                'results': results,
+                'total_points': len(results)
+            },
+            'message': f'Tsunami risk assessment completed for {len(results)} impact points'
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in batch tsunami risk assessment: {str(e)}")
+        return json_response({
+            'success': False,
+            'error': f'Failed to assess tsunami risk batch: {str(e)}'
+        }, 500)
 
 
 @tsunami_bp.route('/risk-levels', methods=['GET'])
@@ -188,7 +335,7 @@ def get_risk_levels():
             ]
         }
         
-        return jsonify({
+        return json_response({
             'success': True,
             'data': risk_info,
             'message': 'Tsunami risk level information retrieved successfully'
@@ -196,10 +343,10 @@ def get_risk_levels():
     
     except Exception as e:
         logger.error(f"Error retrieving risk level info: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': f'Failed to retrieve risk level information: {str(e)}'
-        }), 500
+        }, 500)
 
 
 @tsunami_bp.route('/quick-check', methods=['GET'])
@@ -226,13 +373,13 @@ def quick_tsunami_check():
         diameter_m = request.args.get('diameter', type=float)
         
         if None in [latitude, longitude, diameter_m]:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Required parameters: lat, lon, diameter'
-            }), 400
+            }, 400)
         
         # Get elevation data
-        elevation_data = nasa_manager.get_elevation_single(latitude, longitude)
+        elevation_data = get_tile_elevation(latitude, longitude)
         elevation = elevation_data.get('elevation', 0)
         
         # Quick assessment
@@ -255,7 +402,7 @@ def quick_tsunami_check():
                 risk_category = 'high'
                 quick_assessment = 'Very large asteroid, water impact - major tsunami risk'
         
-        return jsonify({
+        return json_response({
             'success': True,
             'data': {
                 'is_water_impact': is_water_impact,
@@ -272,24 +419,24 @@ def quick_tsunami_check():
     
     except Exception as e:
         logger.error(f"Error in quick tsunami check: {str(e)}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': f'Quick check failed: {str(e)}'
-        }), 500
+        }, 500)
 
 
 # Error handlers for the blueprint
 @tsunami_bp.errorhandler(400)
 def bad_request(error):
-    return jsonify({
+    return json_response({
         'success': False,
         'error': 'Bad request - check your parameters'
-    }), 400
+    }, 400)
 
 
 @tsunami_bp.errorhandler(500)
 def internal_error(error):
-    return jsonify({
+    return json_response({
         'success': False,
         'error': 'Internal server error'
-    }), 500
\ No newline at end of file
+    }, 500)
\ No newline at end of file
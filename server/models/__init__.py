@@ -5,4 +5,7 @@ Models package initialization
 from .asteroid_impact import AsteroidImpact
 from .scenarios import ImpactScenarios
 
-__all__ = ['AsteroidImpact', 'ImpactScenarios']
\ No newline at end of file
+# Shared scenario catalog, built once per process (and shared across preloaded workers)
+SCENARIOS = ImpactScenarios()
+
+__all__ = ['AsteroidImpact', 'ImpactScenarios', 'SCENARIOS']
\ No newline at end of file
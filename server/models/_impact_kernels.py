@@ -0,0 +1,153 @@
+"""
+⚙️ Impact Physics Kernels
+NASA Space Apps 2024
+
+Scalar and batch numeric kernels behind AsteroidImpact.
+Compiled with numba when it is installed; otherwise they run as plain Python.
+"""
+
+import math
+from typing import Tuple
+
+from ._numba_compat import NUMBA_AVAILABLE, njit
+
+# numpy is only needed for the compiled batch kernel
+np = None
+if NUMBA_AVAILABLE:
+    import numpy as np
+
+# Physical constants shared by the scalar and batch models
+GRAVITY = 9.81  # Gravity (m/s²)
+TARGET_DENSITY = 2670  # Average crustal density (kg/m³)
+
+# Folded geometry constants: sphere volume = π/6 * D³, cone volume = π/12 * D² * h
+_PI_OVER_6 = math.pi / 6.0
+_PI_OVER_12 = math.pi / 12.0
+
+
+@njit(cache=True, fastmath=True)
+def _kinetic_energy_kernel(mass: float, velocity: float) -> Tuple[float, float, float]:
+    """Kinetic energy in Joules, kilotons and megatons of TNT."""
+    ke_joules = 0.5 * mass * (velocity ** 2)
+    
+    # Convert to TNT equivalent (1 kiloton TNT = 4.184e12 J)
+    tnt_kilotons = ke_joules / (4.184e12)
+    return ke_joules, tnt_kilotons, tnt_kilotons / 1000
+
+
+@njit(cache=True, fastmath=True)
+def _crater_kernel(ke_joules: float, sin2_angle: float, density_ratio_011: float,
+                   inv_target_gravity: float) -> Tuple[float, float, float, float]:
+    """
+    Schmidt-Housen crater diameter, depth, rim height and volume (meters).
+    
+    Angle and density terms are per-asteroid constants precomputed by AsteroidImpact:
+    sin²(angle), (ρi/ρt)^0.11 and 1/(ρt*g).
+    """
+    # Effective kinetic energy accounting for impact angle
+    eff_energy = ke_joules * sin2_angle
+    
+    # D = K * (E/ρt*g)^0.22 * (ρi/ρt)^0.11 with K = 1.88 for complex craters,
+    # evaluated as exp(k * log(x)) to skip the generic pow() path
+    scaled_energy = eff_energy * inv_target_gravity
+    if scaled_energy > 0:
+        crater_diameter = 1.88 * math.exp(math.log(scaled_energy) * 0.22) * density_ratio_011
+    else:
+        crater_diameter = 0.0
+    
+    # Depth ≈ 0.2 * diameter, rim height ≈ 7% of diameter
+    crater_depth = crater_diameter * 0.2
+    rim_height = crater_diameter * 0.07
+    volume = _PI_OVER_12 * crater_diameter * crater_diameter * crater_depth
+    return crater_diameter, crater_depth, rim_height, volume
+
+
+@njit(cache=True, fastmath=True)
+def _seismic_kernel(ke_joules: float, log10_ke_joules: float) -> Tuple[float, float]:
+    """
+    Moment magnitude and approximate Richter magnitude.
+    
+    log10(E_ergs) = log10(E_joules) + 7, so M = (log10(E_joules) + 7 - 11.8) / 1.5;
+    log10_ke_joules is only read when there is impact energy.
+    """
+    if ke_joules > 0:
+        magnitude = (log10_ke_joules - 4.8) / 1.5
+    else:
+        magnitude = 0.0
+    
+    richter_approx = magnitude - 0.2  # Rough conversion
+    return max(0.0, magnitude), max(0.0, richter_approx)
+
+
+@njit(cache=True, fastmath=True)
+def _air_blast_kernel(tnt_kilotons: float) -> Tuple[float, float, float, float]:
+    """1/5/20 psi overpressure and 3rd-degree thermal radii in km (yield must be positive)."""
+    log_yield = math.log(tnt_kilotons)
+    yield_scale = math.exp(log_yield * 0.33)
+    return (2.2 * yield_scale, 0.8 * yield_scale, 0.3 * yield_scale,
+            1.9 * math.exp(log_yield * 0.41))
+
+
+@njit(cache=True, fastmath=True)
+def _compute_all(diameter_m: float, velocity_m_s: float, density_kg_m3: float,
+                 angle_rad: float) -> Tuple[float, ...]:
+    """
+    Full impact pipeline for one asteroid.
+    
+    Returns:
+        tuple: (energy J, energy kt, energy Mt, crater diameter m, crater depth m,
+                moment magnitude, 1 psi km, 5 psi km, 20 psi km, thermal km);
+               blast radii are 0 when there is no impact energy
+    """
+    mass = _PI_OVER_6 * diameter_m * diameter_m * diameter_m * density_kg_m3
+    ke_joules, tnt_kilotons, tnt_megatons = _kinetic_energy_kernel(mass, velocity_m_s)
+    
+    crater_diameter, crater_depth, _, _ = _crater_kernel(
+        ke_joules, math.sin(angle_rad) ** 2,
+        (density_kg_m3 / TARGET_DENSITY) ** 0.11,
+        1.0 / (TARGET_DENSITY * GRAVITY)
+    )
+    magnitude, _ = _seismic_kernel(ke_joules, math.log10(ke_joules) if ke_joules > 0 else 0.0)
+    
+    psi_1 = psi_5 = psi_20 = thermal = 0.0
+    if tnt_kilotons > 0:
+        psi_1, psi_5, psi_20, thermal = _air_blast_kernel(tnt_kilotons)
+    
+    return (ke_joules, tnt_kilotons, tnt_megatons, crater_diameter, crater_depth,
+            magnitude, psi_1, psi_5, psi_20, thermal)
+
+
+# Column order of _compute_batch output (matches the _compute_all tuple)
+BATCH_COLUMNS = (
+    'energy_joules', 'energy_tnt_kilotons', 'energy_tnt_megatons', 'crater_diameter_m',
+    'crater_depth_m', 'moment_magnitude', '1_psi_km', '5_psi_km', '20_psi_km',
+    'thermal_3rd_degree_km'
+)
+
+
+# Serial on purpose: request threads call this concurrently, and numba's parallel
+# workqueue layer aborts the process on concurrent use. Sweeps are a few rows anyway.
+@njit(cache=True)
+def _compute_batch(diameter_m, velocity_m_s, density_kg_m3, angle_rad):
+    """Run _compute_all over float64 arrays; returns an (n, 10) array."""
+    n = diameter_m.shape[0]
+    out = np.empty((n, 10))
+    for i in range(n):
+        row = _compute_all(diameter_m[i], velocity_m_s[i], density_kg_m3[i], angle_rad[i])
+        for j in range(10):
+            out[i, j] = row[j]
+    return out
+
+
+def _analyze_prototype() -> None:
+    """Run every kernel once so JIT compilation happens at import, not on the first request."""
+    ke_joules, tnt_kilotons, _ = _kinetic_energy_kernel(1.0e9, 20000.0)
+    _crater_kernel(ke_joules, 0.5, 0.99, 1.0 / (2670.0 * 9.81))
+    _seismic_kernel(ke_joules, math.log10(ke_joules))
+    _air_blast_kernel(tnt_kilotons)
+    if NUMBA_AVAILABLE:
+        ones = np.ones(1)
+        _compute_batch(ones, ones, ones, ones)
+
+
+_analyze_prototype()
@@ -0,0 +1,20 @@
+"""
+🔧 Optional Numba Support
+NASA Space Apps 2024
+
+Shared njit import for the numeric kernel modules. When numba is not installed,
+njit is a no-op decorator and the kernels run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
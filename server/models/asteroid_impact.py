@@ -11,8 +11,108 @@ Core physics calculations for asteroid impact modeling including:
 """
 
 import math
-import numpy as np
-from typing import Dict, Optional, Tuple, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Any
+
+from ._impact_kernels import (
+    GRAVITY, TARGET_DENSITY, NUMBA_AVAILABLE, _PI_OVER_6,
+    BATCH_COLUMNS, _kinetic_energy_kernel, _crater_kernel, _seismic_kernel, _air_blast_kernel,
+    _compute_batch
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (fatality rate, injury rate) per damage zone, based on nuclear weapons effects studies
+_CASUALTY_RATES = {
+    'severe_zone': (0.90, 0.10),        # 20 psi: severe destruction
+    'heavy_damage_zone': (0.50, 0.40),  # 5 psi: heavy building damage
+    'light_damage_zone': (0.05, 0.30)   # 1 psi: light damage
+}
+
+
+def _zone(population: float, fatality_rate: float, injury_rate: float,
+          radius_km: float) -> Dict[str, Any]:
+    """Casualty entry for one damage zone (counts truncated to whole people)."""
+    return {
+        'population': int(population),
+        'fatalities': int(population * fatality_rate),
+        'injuries': int(population * injury_rate),
+        'radius_km': radius_km
+    }
+
+
+def analyze_impacts_batch(diameter_m, velocity_km_s, density_kg_m3,
+                          angle_degrees) -> Dict[str, 'np.ndarray']:
+    """
+    Vectorized impact metrics for many asteroids at once.
+    
+    Applies the same scaling laws as AsteroidImpact elementwise over arrays,
+    for comparisons and parameter sweeps that would otherwise build one
+    AsteroidImpact per row. Uses the numba batch kernel when available and
+    NumPy broadcasting otherwise.
+    
+    Args:
+        diameter_m: Asteroid diameters in meters (array-like)
+        velocity_km_s: Impact velocities in km/s (array-like)
+        density_kg_m3: Asteroid densities in kg/m³ (array-like)
+        angle_degrees: Impact angles in degrees (array-like)
+        
+    Returns:
+        dict: Arrays keyed by metric (energy, crater, seismic and blast ranges);
+              blast ranges are 0 where there is no impact energy
+    """
+    import numpy as np  # Deferred so the scalar model doesn't pay for numpy at import
+    
+    diameter = np.asarray(diameter_m, dtype=np.float64)
+    velocity = np.asarray(velocity_km_s, dtype=np.float64) * 1000
+    density = np.asarray(density_kg_m3, dtype=np.float64)
+    angle = np.radians(np.asarray(angle_degrees, dtype=np.float64))
+    
+    if NUMBA_AVAILABLE:
+        # Compiled per-element pipeline over the rows
+        table = _compute_batch(diameter, velocity, density, angle)
+        metrics = {name: table[:, i] for i, name in enumerate(BATCH_COLUMNS)}
+        metrics['mass_kg'] = _PI_OVER_6 * diameter * diameter * diameter * density
+        metrics['crater_diameter_km'] = metrics['crater_diameter_m'] / 1000
+        return metrics
+    
+    mass = _PI_OVER_6 * diameter * diameter * diameter * density
+    ke_joules = 0.5 * mass * velocity * velocity
+    tnt_kilotons = ke_joules / 4.184e12
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Crater: D = K * (E/ρt*g)^0.22 * (ρi/ρt)^0.11
+        scaled_energy = ke_joules * np.sin(angle) ** 2 / (TARGET_DENSITY * GRAVITY)
+        crater_diameter = np.where(
+            scaled_energy > 0,
+            1.88 * np.exp(np.log(scaled_energy) * 0.22) * (density / TARGET_DENSITY) ** 0.11,
+            0.0
+        )
+        
+        # Seismic: log10(E_ergs) = log10(E_joules) + 7 = 11.8 + 1.5*M
+        magnitude = np.where(ke_joules > 0, (np.log10(ke_joules) - 4.8) / 1.5, 0.0)
+        
+        # Air blast: one log(yield) shared by the 0.33 and 0.41 exponents
+        has_yield = tnt_kilotons > 0
+        log_yield = np.log(tnt_kilotons)
+        yield_scale = np.where(has_yield, np.exp(log_yield * 0.33), 0.0)
+        thermal = np.where(has_yield, 1.9 * np.exp(log_yield * 0.41), 0.0)
+    
+    return {
+        'mass_kg': mass,
+        'energy_joules': ke_joules,
+        'energy_tnt_kilotons': tnt_kilotons,
+        'energy_tnt_megatons': tnt_kilotons / 1000,
+        'crater_diameter_m': crater_diameter,
+        'crater_diameter_km': crater_diameter / 1000,
+        'crater_depth_m': crater_diameter * 0.2,
+        'moment_magnitude': np.maximum(magnitude, 0.0),
+        '1_psi_km': 2.2 * yield_scale,
+        '5_psi_km': 0.8 * yield_scale,
+        '20_psi_km': 0.3 * yield_scale,
+        'thermal_3rd_degree_km': thermal
+    }
 
 
 class AsteroidImpact:
@@ -39,27 +139,36 @@ class AsteroidImpact:
         self.density = density_kg_m3
         self.angle = math.radians(angle_degrees)
         
+        # Keep the input units too so serialization doesn't convert back
+        self.velocity_km_s = velocity_km_s
+        self.angle_degrees = angle_degrees
+        
         # Calculate basic properties
         self.radius = diameter_m / 2
-        self.volume = (4/3) * math.pi * (self.radius ** 3)
+        self.volume = _PI_OVER_6 * diameter_m * diameter_m * diameter_m
         self.mass = self.volume * density_kg_m3
         
+        # Impact energy depends only on constructor inputs, so compute it once
+        self._ke_joules, self._ke_kilotons, self._ke_megatons = _kinetic_energy_kernel(
+            float(self.mass), float(self.velocity)
+        )
+        self._log10_ke_joules = math.log10(self._ke_joules) if self._ke_joules > 0 else -math.inf
+        
         # Constants
-        self.g = 9.81  # Gravity (m/s²)
-        self.target_density = 2670  # Average crustal density (kg/m³)
+        self.g = GRAVITY  # Gravity (m/s²)
+        self.target_density = TARGET_DENSITY  # Average crustal density (kg/m³)
+        
+        # Crater scaling terms that depend only on constructor inputs
+        self._sin2_angle = math.sin(self.angle) ** 2
+        self._density_ratio_011 = (self.density / self.target_density) ** 0.11
+        self._inv_tg = 1.0 / (self.target_density * self.g)
         
     def calculate_kinetic_energy(self) -> Dict[str, float]:
         """Calculate kinetic energy of impact in Joules and TNT equivalent."""
-        ke_joules = 0.5 * self.mass * (self.velocity ** 2)
-        
-        # Convert to TNT equivalent (1 kiloton TNT = 4.184e12 J)
-        tnt_kilotons = ke_joules / (4.184e12)
-        tnt_megatons = tnt_kilotons / 1000
-        
         return {
-            'energy_joules': ke_joules,
-            'energy_tnt_kilotons': tnt_kilotons,
-            'energy_tnt_megatons': tnt_megatons
+            'energy_joules': self._ke_joules,
+            'energy_tnt_kilotons': self._ke_kilotons,
+            'energy_tnt_megatons': self._ke_megatons
         }
     
     def calculate_crater_size(self) -> Dict[str, float]:
@@ -68,29 +177,16 @@ class AsteroidImpact:
         
         Uses the Schmidt-Housen crater scaling law for complex craters.
         """
-        # Effective kinetic energy accounting for impact angle
-        ke = self.calculate_kinetic_energy()['energy_joules']
-        eff_energy = ke * (math.sin(self.angle) ** 2)
-        
-        # Schmidt-Housen scaling (for gravity-dominated craters)
-        # D = K * (E/ρt*g)^0.22 * ρi^0.11 / ρt^0.11
-        K = 1.88  # Scaling constant for complex craters
-        
-        crater_diameter = K * ((eff_energy / (self.target_density * self.g)) ** 0.22) * \
-                         ((self.density ** 0.11) / (self.target_density ** 0.11))
-        
-        # Crater depth (empirical relationship: depth ≈ 0.2 * diameter for complex craters)
-        crater_depth = crater_diameter * 0.2
-        
-        # Rim height (typically 5-10% of diameter)
-        rim_height = crater_diameter * 0.07
+        crater_diameter, crater_depth, rim_height, crater_volume = _crater_kernel(
+            self._ke_joules, float(self._sin2_angle), float(self._density_ratio_011), float(self._inv_tg)
+        )
         
         return {
             'diameter_m': crater_diameter,
             'diameter_km': crater_diameter / 1000,
             'depth_m': crater_depth,
             'rim_height_m': rim_height,
-            'volume_m3': math.pi * (crater_diameter/2)**2 * crater_depth / 3
+            'volume_m3': crater_volume
         }
     
     def calculate_seismic_magnitude(self) -> Dict[str, float]:
@@ -100,49 +196,46 @@ class AsteroidImpact:
         Uses the relationship: log10(E) = 11.8 + 1.5*M (Kanamori, 1977)
         where E is energy in ergs and M is moment magnitude.
         """
-        ke = self.calculate_kinetic_energy()['energy_joules']
-        
-        # Convert Joules to ergs (1 J = 10^7 ergs)
-        energy_ergs = ke * 1e7
-        
-        # Calculate moment magnitude
-        if energy_ergs > 0:
-            magnitude = (math.log10(energy_ergs) - 11.8) / 1.5
-        else:
-            magnitude = 0
-        
-        # Richter scale approximation (for comparison)
-        richter_approx = magnitude - 0.2  # Rough conversion
+        magnitude, richter_approx = _seismic_kernel(self._ke_joules, self._log10_ke_joules)
         
         return {
-            'moment_magnitude': max(0, magnitude),
-            'richter_approximate': max(0, richter_approx),
-            'energy_ergs': energy_ergs
+            'moment_magnitude': magnitude,
+            'richter_approximate': richter_approx,
+            'energy_ergs': self._ke_joules * 1e7  # 1 J = 10^7 ergs
         }
     
+    @cached_property
+    def _blast_radii(self) -> Tuple[float, ...]:
+        """Overpressure and thermal radii in km (empty when there is no impact energy)."""
+        if self._ke_kilotons > 0:
+            return _air_blast_kernel(self._ke_kilotons)
+        return ()
+    
     def calculate_air_blast(self) -> Dict[str, float]:
         """Calculate air blast effects and overpressure zones."""
-        ke = self.calculate_kinetic_energy()['energy_tnt_kilotons']
-        
         # Air blast ranges (empirical formulas for kiloton yield)
         # Overpressure distances in km
         ranges = {}
         
-        if ke > 0:
-            # 1 psi overpressure (window breaking) - R = 2.2 * Y^0.33
-            ranges['1_psi_km'] = 2.2 * (ke ** 0.33)
-            
-            # 5 psi overpressure (building damage) - R = 0.8 * Y^0.33  
-            ranges['5_psi_km'] = 0.8 * (ke ** 0.33)
-            
-            # 20 psi overpressure (severe destruction) - R = 0.3 * Y^0.33
-            ranges['20_psi_km'] = 0.3 * (ke ** 0.33)
+        if self._blast_radii:
+            psi_1, psi_5, psi_20, thermal = self._blast_radii
             
-            # Thermal radiation (3rd degree burns) - R = 1.9 * Y^0.41
-            ranges['thermal_3rd_degree_km'] = 1.9 * (ke ** 0.41)
+            # 1 psi (window breaking), 5 psi (building damage), 20 psi (severe destruction)
+            # R = {2.2, 0.8, 0.3} * Y^0.33; thermal radiation (3rd degree burns) R = 1.9 * Y^0.41
+            ranges['1_psi_km'] = psi_1
+            ranges['5_psi_km'] = psi_5
+            ranges['20_psi_km'] = psi_20
+            ranges['thermal_3rd_degree_km'] = thermal
         
         return ranges
     
+    @cached_property
+    def _zone_areas(self) -> Tuple[float, float, float]:
+        """Areas (km²) of the 20 psi disk and the 5 psi / 1 psi rings around it."""
+        psi_1, psi_5, psi_20, _ = self._blast_radii or (0.0, 0.0, 0.0, 0.0)
+        r20_sq, r5_sq, r1_sq = psi_20 * psi_20, psi_5 * psi_5, psi_1 * psi_1
+        return math.pi * r20_sq, math.pi * (r5_sq - r20_sq), math.pi * (r1_sq - r5_sq)
+    
     def estimate_casualties(self, population_density_per_km2: float, 
                           total_population: int) -> Dict[str, Any]:
         """
@@ -155,93 +248,138 @@ class AsteroidImpact:
         Returns:
             dict: Casualty estimates by damage zone
         """
-        blast_ranges = self.calculate_air_blast()
+        # No impact energy means no blast zones, so skip the zone arithmetic entirely
+        if not self._blast_radii:
+            return {}
         
-        casualties = {}
+        psi_1, psi_5, psi_20, _ = self._blast_radii
         
-        if blast_ranges:
-            # Calculate affected areas (π * r²)
-            area_20_psi = math.pi * (blast_ranges.get('20_psi_km', 0) ** 2)
-            area_5_psi = math.pi * (blast_ranges.get('5_psi_km', 0) ** 2) - area_20_psi
-            area_1_psi = math.pi * (blast_ranges.get('1_psi_km', 0) ** 2) - area_5_psi - area_20_psi
-            
-            # Estimate population in each zone
-            pop_20_psi = min(area_20_psi * population_density_per_km2, total_population)
-            pop_5_psi = min(area_5_psi * population_density_per_km2, total_population - pop_20_psi)
-            pop_1_psi = min(area_1_psi * population_density_per_km2, total_population - pop_20_psi - pop_5_psi)
-            
-            # Casualty rates by zone (based on nuclear weapons effects studies)
-            fatality_rate_20_psi = 0.90  # 90% fatality rate in severe destruction zone
-            injury_rate_20_psi = 0.10   # 10% injury rate (survivors)
-            
-            fatality_rate_5_psi = 0.50   # 50% fatality rate in heavy damage zone
-            injury_rate_5_psi = 0.40     # 40% injury rate
-            
-            fatality_rate_1_psi = 0.05   # 5% fatality rate in light damage zone
-            injury_rate_1_psi = 0.30     # 30% injury rate
-            
-            casualties = {
-                'severe_zone': {
-                    'population': int(pop_20_psi),
-                    'fatalities': int(pop_20_psi * fatality_rate_20_psi),
-                    'injuries': int(pop_20_psi * injury_rate_20_psi),
-                    'radius_km': blast_ranges.get('20_psi_km', 0)
-                },
-                'heavy_damage_zone': {
-                    'population': int(pop_5_psi),
-                    'fatalities': int(pop_5_psi * fatality_rate_5_psi),
-                    'injuries': int(pop_5_psi * injury_rate_5_psi),
-                    'radius_km': blast_ranges.get('5_psi_km', 0)
-                },
-                'light_damage_zone': {
-                    'population': int(pop_1_psi),
-                    'fatalities': int(pop_1_psi * fatality_rate_1_psi),
-                    'injuries': int(pop_1_psi * injury_rate_1_psi),
-                    'radius_km': blast_ranges.get('1_psi_km', 0)
-                }
-            }
+        # Calculate affected areas (π * r²) from squared radii; each ring excludes the inner zones
+        area_20_psi, area_5_psi, area_1_psi = self._zone_areas
+        
+        # Estimate population in each zone
+        pop_20_psi = min(area_20_psi * population_density_per_km2, total_population)
+        pop_5_psi = min(area_5_psi * population_density_per_km2, total_population - pop_20_psi)
+        pop_1_psi = min(area_1_psi * population_density_per_km2, total_population - pop_20_psi - pop_5_psi)
+        
+        # Casualty rates by zone come from _CASUALTY_RATES
+        casualties = {
+            'severe_zone': _zone(pop_20_psi, *_CASUALTY_RATES['severe_zone'], psi_20),
+            'heavy_damage_zone': _zone(pop_5_psi, *_CASUALTY_RATES['heavy_damage_zone'], psi_5),
+            'light_damage_zone': _zone(pop_1_psi, *_CASUALTY_RATES['light_damage_zone'], psi_1)
+        }
+        
+        # Calculate totals
+        total_fatalities = total_injuries = total_affected = 0
+        for zone in casualties.values():
+            total_fatalities += zone['fatalities']
+            total_injuries += zone['injuries']
+            total_affected += zone['population']
+        
+        casualties['totals'] = {
+            'fatalities': total_fatalities,
+            'injuries': total_injuries,
+            'affected_population': total_affected
+        }
+        
+        return casualties
+    
+    def estimate_casualties_batch(self, population_density_per_km2,
+                                  total_population) -> Dict[str, Any]:
+        """
+        Vectorized estimate_casualties over arrays of population inputs.
+        
+        Useful for sweeps (e.g. Monte Carlo over population density) with a fixed asteroid.
+        
+        Args:
+            population_density_per_km2: People per square kilometer (array-like)
+            total_population: Total population in affected area (array-like, broadcastable)
             
-            # Calculate totals
-            total_fatalities = sum([zone['fatalities'] for zone in casualties.values()])
-            total_injuries = sum([zone['injuries'] for zone in casualties.values()])
-            total_affected = sum([zone['population'] for zone in casualties.values()])
+        Returns:
+            dict: Same zone/totals layout as estimate_casualties with int64 arrays
+                  in place of ints (empty when there is no blast)
+        """
+        if not self._blast_radii:
+            return {}
+        
+        import numpy as np
+        
+        density = np.asarray(population_density_per_km2, dtype=np.float64)
+        remaining = np.asarray(total_population, dtype=np.float64)
+        psi_1, psi_5, psi_20, _ = self._blast_radii
+        
+        casualties = {}
+        totals = {'fatalities': 0, 'injuries': 0, 'affected_population': 0}
+        
+        # Fill zones from the center outwards, capping each by the population left
+        for zone, area, radius in (('severe_zone', self._zone_areas[0], psi_20),
+                                   ('heavy_damage_zone', self._zone_areas[1], psi_5),
+                                   ('light_damage_zone', self._zone_areas[2], psi_1)):
+            fatality_rate, injury_rate = _CASUALTY_RATES[zone]
+            population = np.minimum(area * density, remaining)
+            remaining = remaining - population
             
-            casualties['totals'] = {
-                'fatalities': total_fatalities,
-                'injuries': total_injuries,
-                'affected_population': total_affected
+            casualties[zone] = {
+                'population': population.astype(np.int64),
+                'fatalities': (population * fatality_rate).astype(np.int64),
+                'injuries': (population * injury_rate).astype(np.int64),
+                'radius_km': radius
             }
+            totals['fatalities'] = totals['fatalities'] + casualties[zone]['fatalities']
+            totals['injuries'] = totals['injuries'] + casualties[zone]['injuries']
+            totals['affected_population'] = totals['affected_population'] + casualties[zone]['population']
         
+        casualties['totals'] = totals
         return casualties
     
     def get_comprehensive_analysis(self) -> Dict[str, Any]:
-        """Get complete impact analysis."""
+        """
+        Get complete impact analysis.
+        
+        Computed once per asteroid; the returned dict is shared between calls
+        (maps, charts and images all read it) and must not be mutated.
+        """
+        return self._analysis
+    
+    @cached_property
+    def _analysis(self) -> Dict[str, Any]:
+        """Complete impact analysis behind get_comprehensive_analysis."""
         energy = self.calculate_kinetic_energy()
         crater = self.calculate_crater_size()
         seismic = self.calculate_seismic_magnitude()
         blast = self.calculate_air_blast()
         
+        # Rounded headline numbers for scenario previews
+        preview = {
+            'energy_megatons': round(energy['energy_tnt_megatons'], 3),
+            'seismic_magnitude': round(seismic['moment_magnitude'], 2),
+            'crater_diameter_km': round(crater['diameter_km'], 3),
+            'crater_depth_m': round(crater['depth_m'], 1),
+            'max_damage_range_km': round(max(blast.values(), default=0), 2)
+        }
+        
         return {
             'asteroid_properties': {
                 'diameter_m': self.diameter,
-                'velocity_km_s': self.velocity / 1000,
+                'velocity_km_s': self.velocity_km_s,
                 'mass_kg': self.mass,
                 'density_kg_m3': self.density,
-                'impact_angle_degrees': math.degrees(self.angle)
+                'impact_angle_degrees': self.angle_degrees
             },
             'energy': energy,
             'crater': crater,
             'seismic': seismic,
-            'air_blast_ranges': blast
+            'air_blast_ranges': blast,
+            'preview': preview
         }
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert asteroid object to dictionary for JSON serialization."""
         return {
             'diameter_m': self.diameter,
-            'velocity_km_s': self.velocity / 1000,
+            'velocity_km_s': self.velocity_km_s,
             'density_kg_m3': self.density,
-            'angle_degrees': math.degrees(self.angle),
+            'angle_degrees': self.angle_degrees,
             'mass_kg': self.mass,
             'volume_m3': self.volume
         }
@@ -6,119 +6,179 @@ Pre-defined asteroid impact scenarios based on historical events and potential t
 Includes comparison and analysis tools for different impact scales.
 """
 
-from typing import Dict, List, Any, Optional
-import pandas as pd
-from .asteroid_impact import AsteroidImpact
+from copy import deepcopy
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Set, Tuple
+from .asteroid_impact import AsteroidImpact, analyze_impacts_batch
+
+# Substring length used by the scenario search index
+_NGRAM = 3
+
+# Pre-defined asteroid scenarios (read-only, shared by every caller)
+_SCENARIOS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    'chelyabinsk_2013': {
+        'name': '2013 Chelyabinsk Event (Actual)',
+        'diameter_m': 20,
+        'velocity_km_s': 19.16,
+        'density_kg_m3': 3300,
+        'angle_degrees': 18,
+        'description': 'Actual airburst over Russia in 2013. Injured ~1500 people.',
+        'location': {'lat': 55.1544, 'lon': 61.4294, 'name': 'Chelyabinsk, Russia'},
+        'historical': True,
+        'category': 'small_event'
+    },
+    'tunguska_1908': {
+        'name': '1908 Tunguska Event (Estimated)',
+        'diameter_m': 60,
+        'velocity_km_s': 27,
+        'density_kg_m3': 2000,
+        'angle_degrees': 30,
+        'description': 'Massive airburst over Siberia. Flattened 2,000 km² of forest.',
+        'location': {'lat': 60.8858, 'lon': 101.8942, 'name': 'Tunguska, Siberia'},
+        'historical': True,
+        'category': 'medium_event'
+    },
+    'apophis_potential': {
+        'name': 'Apophis 2029 Close Approach',
+        'diameter_m': 340,
+        'velocity_km_s': 12.87,
+        'density_kg_m3': 2600,
+        'angle_degrees': 45,
+        'description': 'Potentially hazardous asteroid - modeled impact scenario.',
+        'location': {'lat': 40.7128, 'lon': -74.0060, 'name': 'New York City, USA'},
+        'historical': False,
+        'category': 'city_killer'
+    },
+    'chicxulub_scale': {
+        'name': 'Chicxulub-Scale Event (K-Pg Extinction)',
+        'diameter_m': 10000,
+        'velocity_km_s': 20,
+        'density_kg_m3': 2600,
+        'angle_degrees': 60,
+        'description': 'Dinosaur extinction event scale impact (66 million years ago).',
+        'location': {'lat': 21.4, 'lon': -89.5, 'name': 'Yucatan Peninsula, Mexico'},
+        'historical': True,
+        'category': 'extinction_event'
+    },
+    'city_killer': {
+        'name': 'City Killer Scenario',
+        'diameter_m': 140,
+        'velocity_km_s': 18,
+        'density_kg_m3': 2600,
+        'angle_degrees': 45,
+        'description': 'NASA threshold for city-destroying asteroid.',
+        'location': {'lat': 35.6762, 'lon': 139.6503, 'name': 'Tokyo, Japan'},
+        'historical': False,
+        'category': 'city_killer'
+    },
+    'regional_disaster': {
+        'name': 'Regional Disaster Scenario',
+        'diameter_m': 500,
+        'velocity_km_s': 25,
+        'density_kg_m3': 2800,
+        'angle_degrees': 30,
+        'description': 'Regional-scale impact causing widespread damage.',
+        'location': {'lat': 51.5074, 'lon': -0.1278, 'name': 'London, UK'},
+        'historical': False,
+        'category': 'regional_disaster'
+    },
+    'small_meteor': {
+        'name': 'Small Meteor Event',
+        'diameter_m': 5,
+        'velocity_km_s': 15,
+        'density_kg_m3': 3000,
+        'angle_degrees': 45,
+        'description': 'Typical small meteor event - usually burns up in atmosphere.',
+        'location': {'lat': 34.0522, 'lon': -118.2437, 'name': 'Los Angeles, USA'},
+        'historical': False,
+        'category': 'small_event'
+    },
+    'planetary_defense_test': {
+        'name': 'Planetary Defense Test Case',
+        'diameter_m': 250,
+        'velocity_km_s': 22,
+        'density_kg_m3': 2400,
+        'angle_degrees': 35,
+        'description': 'Test case for planetary defense systems and impact mitigation.',
+        'location': {'lat': 48.8566, 'lon': 2.3522, 'name': 'Paris, France'},
+        'historical': False,
+        'category': 'city_killer'
+    }
+})
+
+
+
+def _group_by_category() -> Dict[str, Mapping[str, Dict[str, Any]]]:
+    """Group scenarios by category, preserving definition order."""
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for name, scenario in _SCENARIOS.items():
+        groups.setdefault(scenario.get('category', 'unknown'), {})[name] = scenario
+    return {category: MappingProxyType(members) for category, members in groups.items()}
+
+
+# Scenario data grouped by category
+_BY_CATEGORY = _group_by_category()
+
+# Lowercase id, name and description per scenario, NUL-separated so matches stay within one field
+_SEARCH_INDEX: List[Tuple[str, str]] = [
+    (name, '\0'.join((name.lower(), scenario['name'].lower(), scenario['description'].lower())))
+    for name, scenario in _SCENARIOS.items()
+]
+
+
+def _build_trigram_index() -> Dict[str, Set[str]]:
+    """Map every trigram of the search text to the scenarios containing it."""
+    index: Dict[str, Set[str]] = {}
+    for name, blob in _SEARCH_INDEX:
+        for i in range(len(blob) - _NGRAM + 1):
+            index.setdefault(blob[i:i + _NGRAM], set()).add(name)
+    return index
+
+
+_TRIGRAM_INDEX = _build_trigram_index()
+
+
+def _asteroid_for(scenario: Mapping[str, Any]) -> AsteroidImpact:
+    """Build the AsteroidImpact described by a scenario's physical parameters."""
+    return AsteroidImpact(
+        diameter_m=scenario['diameter_m'],
+        velocity_km_s=scenario['velocity_km_s'],
+        density_kg_m3=scenario['density_kg_m3'],
+        angle_degrees=scenario['angle_degrees']
+    )
+
+
+def _precompute_analysis() -> Dict[str, Tuple[AsteroidImpact, Dict[str, Any], Dict[str, Any]]]:
+    """Analyze every scenario once; the results depend only on the fixed asteroid parameters."""
+    precomputed = {}
+    for name, scenario in _SCENARIOS.items():
+        asteroid = _asteroid_for(scenario)
+        precomputed[name] = (asteroid, asteroid.to_dict(), asteroid.get_comprehensive_analysis())
+    return precomputed
+
+
+# (asteroid, asteroid_data, comprehensive analysis) per scenario, computed at import
+_SCENARIO_ANALYSIS = _precompute_analysis()
 
 
 class ImpactScenarios:
     """Pre-defined impact scenarios for testing and comparison."""
     
     @staticmethod
-    def get_scenarios() -> Dict[str, Dict[str, Any]]:
-        """Return dictionary of pre-defined asteroid scenarios."""
-        return {
-            'chelyabinsk_2013': {
-                'name': '2013 Chelyabinsk Event (Actual)',
-                'diameter_m': 20,
-                'velocity_km_s': 19.16,
-                'density_kg_m3': 3300,
-                'angle_degrees': 18,
-                'description': 'Actual airburst over Russia in 2013. Injured ~1500 people.',
-                'location': {'lat': 55.1544, 'lon': 61.4294, 'name': 'Chelyabinsk, Russia'},
-                'historical': True,
-                'category': 'small_event'
-            },
-            'tunguska_1908': {
-                'name': '1908 Tunguska Event (Estimated)',
-                'diameter_m': 60,
-                'velocity_km_s': 27,
-                'density_kg_m3': 2000,
-                'angle_degrees': 30,
-                'description': 'Massive airburst over Siberia. Flattened 2,000 km² of forest.',
-                'location': {'lat': 60.8858, 'lon': 101.8942, 'name': 'Tunguska, Siberia'},
-                'historical': True,
-                'category': 'medium_event'
-            },
-            'apophis_potential': {
-                'name': 'Apophis 2029 Close Approach',
-                'diameter_m': 340,
-                'velocity_km_s': 12.87,
-                'density_kg_m3': 2600,
-                'angle_degrees': 45,
-                'description': 'Potentially hazardous asteroid - modeled impact scenario.',
-                'location': {'lat': 40.7128, 'lon': -74.0060, 'name': 'New York City, USA'},
-                'historical': False,
-                'category': 'city_killer'
-            },
-            'chicxulub_scale': {
-                'name': 'Chicxulub-Scale Event (K-Pg Extinction)',
-                'diameter_m': 10000,
-                'velocity_km_s': 20,
-                'density_kg_m3': 2600,
-                'angle_degrees': 60,
-                'description': 'Dinosaur extinction event scale impact (66 million years ago).',
-                'location': {'lat': 21.4, 'lon': -89.5, 'name': 'Yucatan Peninsula, Mexico'},
-                'historical': True,
-                'category': 'extinction_event'
-            },
-            'city_killer': {
-                'name': 'City Killer Scenario',
-                'diameter_m': 140,
-                'velocity_km_s': 18,
-                'density_kg_m3': 2600,
-                'angle_degrees': 45,
-                'description': 'NASA threshold for city-destroying asteroid.',
-                'location': {'lat': 35.6762, 'lon': 139.6503, 'name': 'Tokyo, Japan'},
-                'historical': False,
-                'category': 'city_killer'
-            },
-            'regional_disaster': {
-                'name': 'Regional Disaster Scenario',
-                'diameter_m': 500,
-                'velocity_km_s': 25,
-                'density_kg_m3': 2800,
-                'angle_degrees': 30,
-                'description': 'Regional-scale impact causing widespread damage.',
-                'location': {'lat': 51.5074, 'lon': -0.1278, 'name': 'London, UK'},
-                'historical': False,
-                'category': 'regional_disaster'
-            },
-            'small_meteor': {
-                'name': 'Small Meteor Event',
-                'diameter_m': 5,
-                'velocity_km_s': 15,
-                'density_kg_m3': 3000,
-                'angle_degrees': 45,
-                'description': 'Typical small meteor event - usually burns up in atmosphere.',
-                'location': {'lat': 34.0522, 'lon': -118.2437, 'name': 'Los Angeles, USA'},
-                'historical': False,
-                'category': 'small_event'
-            },
-            'planetary_defense_test': {
-                'name': 'Planetary Defense Test Case',
-                'diameter_m': 250,
-                'velocity_km_s': 22,
-                'density_kg_m3': 2400,
-                'angle_degrees': 35,
-                'description': 'Test case for planetary defense systems and impact mitigation.',
-                'location': {'lat': 48.8566, 'lon': 2.3522, 'name': 'Paris, France'},
-                'historical': False,
-                'category': 'city_killer'
-            }
-        }
+    def get_scenarios() -> Mapping[str, Dict[str, Any]]:
+        """Return read-only mapping of pre-defined asteroid scenarios."""
+        return _SCENARIOS
     
     @staticmethod
     def get_scenario_by_name(scenario_name: str) -> Optional[Dict[str, Any]]:
         """Get a specific scenario by name."""
-        scenarios = ImpactScenarios.get_scenarios()
-        return scenarios.get(scenario_name)
+        return _SCENARIOS.get(scenario_name)
     
     @staticmethod
-    def get_scenarios_by_category(category: str) -> Dict[str, Dict[str, Any]]:
+    def get_scenarios_by_category(category: str) -> Mapping[str, Dict[str, Any]]:
         """Get all scenarios in a specific category."""
-        scenarios = ImpactScenarios.get_scenarios()
-        return {k: v for k, v in scenarios.items() if v.get('category') == category}
+        return _BY_CATEGORY.get(category, MappingProxyType({}))
     
     @staticmethod
     def get_historical_scenarios() -> Dict[str, Dict[str, Any]]:
@@ -133,15 +193,10 @@ class ImpactScenarios:
         if not scenario:
             return None
         
-        return AsteroidImpact(
-            diameter_m=scenario['diameter_m'],
-            velocity_km_s=scenario['velocity_km_s'],
-            density_kg_m3=scenario['density_kg_m3'],
-            angle_degrees=scenario['angle_degrees']
-        )
+        return _asteroid_for(scenario)
     
     @staticmethod
-    def run_scenario_analysis(scenario_name: str, custom_location: Optional[Dict[str, float]] = None) -> Optional[Dict[str, Any]]:
+    def run_scenario_analysis(scenario_name: str, custom_location: Optional[Dict[str, float]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[AsteroidImpact]]:
         """
         Run comprehensive analysis for a scenario.
         
@@ -150,16 +205,15 @@ class ImpactScenarios:
             custom_location (dict): Optional custom location {'lat': float, 'lon': float}
             
         Returns:
-            dict: Complete scenario analysis
+            tuple: (complete scenario analysis, AsteroidImpact used for it),
+                   or (None, None) if the scenario is unknown
         """
         scenario = ImpactScenarios.get_scenario_by_name(scenario_name)
         if not scenario:
-            return None
+            return None, None
         
-        # Create asteroid object
-        asteroid = ImpactScenarios.create_asteroid_from_scenario(scenario_name)
-        if not asteroid:
-            return None
+        # Asteroid and analysis are precomputed; only the location can vary per call
+        asteroid, asteroid_data, cached_analysis = _SCENARIO_ANALYSIS[scenario_name]
         
         # Determine impact location
         if custom_location:
@@ -171,12 +225,12 @@ class ImpactScenarios:
             impact_lon = scenario['location']['lon']
             location_name = scenario['location']['name']
         
-        # Get comprehensive analysis
-        analysis = asteroid.get_comprehensive_analysis()
+        # Copy the cached analysis so callers can't modify the shared results
+        analysis = deepcopy(cached_analysis)
         
-        return {
+        results = {
             'scenario_info': scenario,
-            'asteroid_data': asteroid.to_dict(),
+            'asteroid_data': dict(asteroid_data),
             'impact_location': {
                 'latitude': impact_lat,
                 'longitude': impact_lon,
@@ -192,6 +246,8 @@ class ImpactScenarios:
                 'light_damage_radius_km': analysis['air_blast_ranges'].get('1_psi_km', 0)
             }
         }
+        
+        return results, asteroid
     
     @staticmethod
     def compare_scenarios(scenario_names: List[str]) -> Dict[str, Any]:
@@ -205,73 +261,73 @@ class ImpactScenarios:
             dict: Comparison data including DataFrame-compatible structure
         """
         scenarios = ImpactScenarios.get_scenarios()
+        valid_scenarios = [name for name in scenario_names if name in scenarios]
         results = []
-        valid_scenarios = []
         
-        for name in scenario_names:
-            if name not in scenarios:
-                continue
-                
-            scenario = scenarios[name]
-            asteroid = AsteroidImpact(
-                diameter_m=scenario['diameter_m'],
-                velocity_km_s=scenario['velocity_km_s'],
-                density_kg_m3=scenario['density_kg_m3'],
-                angle_degrees=scenario['angle_degrees']
+        if valid_scenarios:
+            # Analyze all selected scenarios in one vectorized pass
+            selected = [scenarios[name] for name in valid_scenarios]
+            metrics = analyze_impacts_batch(
+                [scenario['diameter_m'] for scenario in selected],
+                [scenario['velocity_km_s'] for scenario in selected],
+                [scenario['density_kg_m3'] for scenario in selected],
+                [scenario['angle_degrees'] for scenario in selected]
             )
+            columns = zip(*[metrics[key].tolist() for key in (
+                'energy_tnt_megatons', 'moment_magnitude', 'crater_diameter_km', 'crater_depth_m',
+                '20_psi_km', '1_psi_km', 'thermal_3rd_degree_km'
+            )])
             
-            analysis = asteroid.get_comprehensive_analysis()
-            
-            result = {
-                'scenario_name': name,
-                'display_name': scenario['name'],
-                'category': scenario.get('category', 'unknown'),
-                'historical': scenario.get('historical', False),
-                'diameter_m': scenario['diameter_m'],
-                'velocity_km_s': scenario['velocity_km_s'],
-                'energy_mt': round(analysis['energy']['energy_tnt_megatons'], 3),
-                'seismic_magnitude': round(analysis['seismic']['moment_magnitude'], 2),
-                'crater_diameter_km': round(analysis['crater']['diameter_km'], 3),
-                'crater_depth_m': round(analysis['crater']['depth_m'], 1),
-                'severe_damage_range_km': round(analysis['air_blast_ranges'].get('20_psi_km', 0), 2),
-                'light_damage_range_km': round(analysis['air_blast_ranges'].get('1_psi_km', 0), 2),
-                'thermal_range_km': round(analysis['air_blast_ranges'].get('thermal_3rd_degree_km', 0), 2)
-            }
-            
-            results.append(result)
-            valid_scenarios.append(name)
+            for name, scenario, (energy_mt, magnitude, crater_km, crater_depth_m,
+                                 severe_km, light_km, thermal_km) in zip(valid_scenarios, selected, columns):
+                results.append({
+                    'scenario_name': name,
+                    'display_name': scenario['name'],
+                    'category': scenario.get('category', 'unknown'),
+                    'historical': scenario.get('historical', False),
+                    'diameter_m': scenario['diameter_m'],
+                    'velocity_km_s': scenario['velocity_km_s'],
+                    'energy_mt': round(energy_mt, 3),
+                    'seismic_magnitude': round(magnitude, 2),
+                    'crater_diameter_km': round(crater_km, 3),
+                    'crater_depth_m': round(crater_depth_m, 1),
+                    'severe_damage_range_km': round(severe_km, 2),
+                    'light_damage_range_km': round(light_km, 2),
+                    'thermal_range_km': round(thermal_km, 2)
+                })
         
         # Sort by energy for better comparison
-        results.sort(key=lambda x: x['energy_mt'])
+        results.sort(key=itemgetter('energy_mt'))
+        
+        # Single pass for categories and size extrema; energy extrema are the sorted ends
+        categories = set()
+        min_diameter = max_diameter = results[0]['diameter_m'] if results else 0
+        for r in results:
+            categories.add(r['category'])
+            if r['diameter_m'] < min_diameter:
+                min_diameter = r['diameter_m']
+            elif r['diameter_m'] > max_diameter:
+                max_diameter = r['diameter_m']
         
         return {
             'comparison_data': results,
             'valid_scenarios': valid_scenarios,
             'total_scenarios': len(results),
-            'categories': list(set([r['category'] for r in results])),
+            'categories': list(categories),
             'energy_range': {
-                'min_mt': min([r['energy_mt'] for r in results]) if results else 0,
-                'max_mt': max([r['energy_mt'] for r in results]) if results else 0
+                'min_mt': results[0]['energy_mt'] if results else 0,
+                'max_mt': results[-1]['energy_mt'] if results else 0
             },
             'size_range': {
-                'min_diameter_m': min([r['diameter_m'] for r in results]) if results else 0,
-                'max_diameter_m': max([r['diameter_m'] for r in results]) if results else 0
+                'min_diameter_m': min_diameter,
+                'max_diameter_m': max_diameter
             }
         }
     
     @staticmethod
     def get_scenario_categories() -> Dict[str, List[str]]:
         """Get scenarios organized by category."""
-        scenarios = ImpactScenarios.get_scenarios()
-        categories = {}
-        
-        for name, scenario in scenarios.items():
-            category = scenario.get('category', 'unknown')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(name)
-        
-        return categories
+        return {category: list(members) for category, members in _BY_CATEGORY.items()}
     
     @staticmethod
     def search_scenarios(query: str) -> List[Dict[str, Any]]:
@@ -284,18 +340,24 @@ class ImpactScenarios:
         Returns:
             list: Matching scenarios
         """
-        scenarios = ImpactScenarios.get_scenarios()
-        results = []
         query_lower = query.lower()
         
-        for name, scenario in scenarios.items():
-            if (query_lower in name.lower() or 
-                query_lower in scenario['name'].lower() or 
-                query_lower in scenario['description'].lower()):
-                
+        # Narrow candidates with trigram lookups; short queries scan every scenario
+        candidates = None
+        if len(query_lower) >= _NGRAM:
+            grams = {query_lower[i:i + _NGRAM] for i in range(len(query_lower) - _NGRAM + 1)}
+            candidates = set.intersection(*[_TRIGRAM_INDEX.get(gram, set()) for gram in grams])
+        
+        results = []
+        for name, blob in _SEARCH_INDEX:
+            if candidates is not None and name not in candidates:
+                continue
+            
+            # Confirm the substring match against the precomputed lowercase text
+            if query_lower in blob:
                 results.append({
                     'scenario_name': name,
-                    'scenario_data': scenario
+                    'scenario_data': _SCENARIOS[name]
                 })
         
-        return results
\ No newline at end of file
+        return results
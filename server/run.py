@@ -5,15 +5,20 @@ NASA Space Apps 2024
 Simple script to run the Flask backend server with proper configuration.
 """
 
+import logging
 import os
+import shutil
 import sys
 
 # Add the backend directory to Python path
 backend_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, backend_dir)
 
+logger = logging.getLogger('astroshield')
+
 if __name__ == '__main__':
-    from app import app
+    # Configure logging before app import so its basicConfig call is a no-op
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
     
     # Get port from environment variable (Railway sets this)
     port = int(os.environ.get('PORT', 5000))
@@ -21,22 +26,54 @@ if __name__ == '__main__':
     # Check if we're in production (Railway sets this)
     is_production = os.environ.get('RAILWAY_ENVIRONMENT') is not None
     
-    print("🌍☄️ NASA Space Apps - Asteroid Impact Modeling API")
-    print("=" * 60)
-    print("🚀 Starting Flask backend server...")
+    logger.info("🌍☄️ NASA Space Apps - Asteroid Impact Modeling API")
+    logger.info("=" * 60)
+    logger.info("🚀 Starting Flask backend server...")
     
     if is_production:
-        print(f"📡 Production API available on port: {port}")
-        print("🌐 CORS enabled for production frontend")
-        print("🔒 Running in production mode")
+        logger.info(f"📡 Production API available on port: {port}")
+        logger.info("🌐 CORS enabled for production frontend")
+        logger.info("🔒 Running in production mode")
     else:
-        print(f"📡 Development API available at: http://localhost:{port}")
-        print("🌐 CORS enabled for React frontend")
-        print("🔧 Running in development mode")
+        logger.info(f"📡 Development API available at: http://localhost:{port}")
+        logger.info("🌐 CORS enabled for React frontend")
+        logger.info("🔧 Running in development mode")
+    
+    logger.info(f"📚 API documentation: /api/info")
+    logger.info(f"💡 Health check: /api/health")
+    logger.info("=" * 60)
+    
+    if is_production:
+        # Prefer a multi-process WSGI server so requests scale across CPUs
+        if shutil.which('gunicorn') and os.name == 'posix':
+            workers = 2 * (os.cpu_count() or 1) + 1
+            logger.info(f"🦄 Starting gunicorn with {workers} workers")
+            # exec before importing the app here: gunicorn loads it itself, and with
+            # --preload only once, so forked workers share the read-only scenario tables
+            os.execvp('gunicorn', [
+                'gunicorn',
+                '--chdir', backend_dir,
+                '-w', str(workers),
+                '--threads', '4',
+                '--preload',
+                '-b', f'0.0.0.0:{port}',
+                'app:app'
+            ])
+    
+    from app import app
     
-    print(f"📚 API documentation: /api/info")
-    print(f"💡 Health check: /api/health")
-    print("=" * 60)
+    if is_production:
+        try:
+            from waitress import serve
+        except ImportError:
+            serve = None
+        
+        if serve is not None:
+            logger.info("🍽️ Starting waitress with 8 threads")
+            serve(app, host='0.0.0.0', port=port, threads=8)
+            sys.exit(0)
+        
+        logger.warning("⚠️ gunicorn/waitress not installed - falling back to the Flask server")
     
     # Server configuration based on environment
     app.run(
@@ -45,4 +82,4 @@ if __name__ == '__main__':
         debug=not is_production,           # Disable debug in production
         threaded=True,                     # Enable threading
         use_reloader=not is_production     # Disable reloader in production
-    )
\ No newline at end of file
+    )
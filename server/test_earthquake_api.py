@@ -5,6 +5,7 @@ NASA Space Apps 2024
 Simple test to verify that the earthquake API integration works correctly.
 """
 
+import logging
 import sys
 import os
 
@@ -16,6 +17,8 @@ from utils.nasa_apis import NASAAPIManager
 from utils.visualization import VisualizationManager
 from models.asteroid_impact import AsteroidImpact
 
+logger = logging.getLogger(__name__)
+
 def test_earthquake_api():
     """Test the earthquake API integration."""
     print("🧪 Testing USGS Earthquake API Integration...")
@@ -29,9 +32,10 @@ def test_earthquake_api():
     print("📡 Fetching earthquake data from USGS API...")
     earthquake_data = nasa_api.get_historical_earthquakes()
     
-    print(f"✅ Retrieved {len(earthquake_data)} earthquakes:")
-    for name, magnitude in earthquake_data.items():
-        print(f"   • {name}: M{magnitude}")
+    print(f"✅ Retrieved {len(earthquake_data)} earthquakes")
+    if logger.isEnabledFor(logging.DEBUG):
+        for name, magnitude in earthquake_data.items():
+            print(f"   • {name}: M{magnitude}")
     
     print("\n" + "=" * 50)
     
@@ -51,12 +55,16 @@ def test_earthquake_api():
     
     print("📊 Seismic comparison data:")
     seismic_comp = chart_data['seismic_comparison']
-    for item in seismic_comp['data']:
-        status = "🎯 IMPACT" if item['is_impact'] else "🌍 Earthquake"
-        print(f"   {status} {item['name']}: M{item['magnitude']}")
+    print(f"   {len(seismic_comp['data'])} entries")
+    if logger.isEnabledFor(logging.DEBUG):
+        for item in seismic_comp['data']:
+            status = "🎯 IMPACT" if item['is_impact'] else "🌍 Earthquake"
+            print(f"   {status} {item['name']}: M{item['magnitude']}")
     
     print("\n✅ API integration test completed successfully!")
     print("🌍 Earthquake data is now fetched from USGS API with fallback to static data")
 
 if __name__ == "__main__":
+    # Pass -v to list every earthquake and comparison entry
+    logging.basicConfig(level=logging.DEBUG if '-v' in sys.argv else logging.INFO)
     test_earthquake_api()
\ No newline at end of file
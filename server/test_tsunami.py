@@ -8,6 +8,7 @@ without requiring the full Flask server to be running.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the backend directory to the Python path
 backend_dir = os.path.dirname(os.path.abspath(__file__))
@@ -55,7 +56,20 @@ def test_tsunami_assessment():
         }
     ]
     
-    for i, scenario in enumerate(test_scenarios, 1):
+    # Assessments are network-bound, so run them all concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(test_scenarios)) as executor:
+        futures = [
+            executor.submit(
+                nasa_manager.assess_tsunami_risk,
+                impact_lat=scenario['lat'],
+                impact_lon=scenario['lon'],
+                asteroid_diameter_m=scenario['diameter_m'],
+                search_radius_km=1000
+            )
+            for scenario in test_scenarios
+        ]
+    
+    for i, (scenario, future) in enumerate(zip(test_scenarios, futures), 1):
         print(f"\n🎯 Test {i}: {scenario['name']}")
         print(f"📍 Location: ({scenario['lat']}, {scenario['lon']})")
         print(f"📏 Diameter: {scenario['diameter_m']}m")
@@ -63,13 +77,8 @@ def test_tsunami_assessment():
         print("-" * 30)
         
         try:
-            # Perform tsunami risk assessment
-            result = nasa_manager.assess_tsunami_risk(
-                impact_lat=scenario['lat'],
-                impact_lon=scenario['lon'],
-                diameter_m=scenario['diameter_m'],
-                search_radius_km=1000
-            )
+            # Collect the tsunami risk assessment
+            result = future.result()
             
             # Display results
             print(f"🌊 Tsunami Risk Level: {result['risk_level'].upper()}")
@@ -101,5 +110,77 @@ def test_tsunami_assessment():
     print("• Warning generation system")
     print("\nNote: This test uses live elevation data from Open-Elevation API")
 
+def test_underwater_impact_is_scored():
+    """An underwater impact must go through the coastal analysis and get a real risk level."""
+    nasa_manager = NASAAPIManager()
+
+    # Answer elevation lookups locally: the impact point and every ring point are sea floor
+    nasa_manager.get_elevation_single = lambda lat, lon: {'status': 'success', 'elevation': -3000}
+    nasa_manager.get_elevation_batch = lambda points: [
+        {'status': 'success', 'elevation': -3000} for _ in points
+    ]
+
+    result = nasa_manager.assess_tsunami_risk(
+        impact_lat=0.0,
+        impact_lon=-140.0,
+        asteroid_diameter_m=500,
+        search_radius_km=1000
+    )
+
+    assert result['risk_level'] != 'unknown', result.get('error')
+    assert result['tsunami_likely'] is True
+    assert result['coastal_analysis']['water_points'] == result['coastal_analysis']['total_sample_points']
+
+def test_batch_endpoint_validates_points():
+    """The batch endpoint rejects bad batches up front and scores the validated rows."""
+    from flask import Flask
+    from controllers import tsunami_controller
+
+    app = Flask(__name__)
+    app.register_blueprint(tsunami_controller.tsunami_bp)
+    client = app.test_client()
+
+    # Answer elevation lookups locally, as in test_underwater_impact_is_scored
+    nasa_manager = tsunami_controller.nasa_manager
+    nasa_manager.get_elevation_single = lambda lat, lon: {'status': 'success', 'elevation': -3000}
+    nasa_manager.get_elevation_batch = lambda points: [
+        {'status': 'success', 'elevation': -3000} for _ in points
+    ]
+    point = {'latitude': 0.0, 'longitude': -140.0, 'diameter_m': 500}
+
+    try:
+        response = client.post('/api/tsunami/assess-batch', json={'points': point})
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'points must be a non-empty list'
+
+        too_many = [point] * (tsunami_controller.MAX_BATCH_POINTS + 1)
+        response = client.post('/api/tsunami/assess-batch', json={'points': too_many})
+        assert response.status_code == 400
+        assert response.get_json()['error'].startswith('Too many points')
+
+        response = client.post('/api/tsunami/assess-batch', json={'points': [
+            point,
+            {'latitude': 0.0, 'longitude': -140.0},
+            {**point, 'latitude': 95.0},
+            {**point, 'diameter_m': 'nan'}
+        ]})
+        assert response.status_code == 400
+        details = response.get_json()['details']
+        assert [entry['index'] for entry in details] == [1, 2, 3]
+        assert details[1]['error'] == 'Latitude must be between -90 and 90 degrees'
+        assert details[2]['error'] == 'Asteroid diameter must be positive'
+
+        response = client.post('/api/tsunami/assess-batch', json={'points': [
+            point,
+            {'latitude': '10', 'longitude': '-150', 'diameter_m': '200', 'search_radius_km': 500}
+        ]})
+        assert response.status_code == 200
+        results = response.get_json()['data']['results']
+        assert [(result['impact_location']['latitude'], result['impact_location']['longitude'])
+                for result in results] == [(0.0, -140.0), (10.0, -150.0)]
+    finally:
+        del nasa_manager.get_elevation_single
+        del nasa_manager.get_elevation_batch
+
 if __name__ == '__main__':
     test_tsunami_assessment()
\ No newline at end of file
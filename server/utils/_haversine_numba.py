@@ -0,0 +1,49 @@
+"""
+🌐 Haversine Batch Kernel
+NASA Space Apps 2024
+
+Great-circle distances from one point to many, compiled with numba when it is
+installed. Callers should check NUMBA_AVAILABLE and use a NumPy path otherwise.
+"""
+
+import math
+
+from models._numba_compat import NUMBA_AVAILABLE, njit
+
+# Earth's radius in km
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit('float64(float64, float64, float64, float64, float64)', fastmath=True, cache=True)
+def haversine_fast(lat0_rad, lon0_rad, cos_lat0, lat_deg, lon_deg):
+    """
+    Distance (km) from a reference point to (lat_deg, lon_deg).
+
+    The reference point is passed pre-converted (radians and cos of latitude) so
+    loops over many points don't redo that trig for every point.
+    """
+    lat_rad = math.radians(lat_deg)
+    sin_dlat = math.sin((lat_rad - lat0_rad) / 2)
+    sin_dlon = math.sin((math.radians(lon_deg) - lon0_rad) / 2)
+    a = sin_dlat * sin_dlat + cos_lat0 * math.cos(lat_rad) * sin_dlon * sin_dlon
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+# Serial on purpose: it runs on concurrent request threads, where numba's parallel
+# workqueue layer aborts the process, and the point arrays are small
+@njit('void(float64, float64, float64[:], float64[:], float64[:])', fastmath=True, cache=True)
+def haversine_batch(lat0, lon0, lats, lons, out):
+    """
+    Write distances (km) from (lat0, lon0) to each (lats[i], lons[i]) into out.
+
+    Args:
+        lat0, lon0: Reference point in degrees
+        lats, lons: float64 arrays of point coordinates in degrees
+        out: Preallocated float64 array with the same length as lats
+    """
+    lat0_rad = math.radians(lat0)
+    lon0_rad = math.radians(lon0)
+    cos_lat0 = math.cos(lat0_rad)
+
+    for i in range(lats.shape[0]):
+        out[i] = haversine_fast(lat0_rad, lon0_rad, cos_lat0, lats[i], lons[i])
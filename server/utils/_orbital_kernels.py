@@ -0,0 +1,50 @@
+"""
+🪐 Orbital Mechanics Kernels
+NASA Space Apps 2024
+
+Scalar kernels behind RealisticOrbitalMechanics (Kepler solver and orbit rotation).
+Compiled with numba when it is installed; otherwise they run as plain Python.
+"""
+
+import math
+
+from models._numba_compat import njit
+
+
+@njit('float64(float64, float64, float64)', cache=True, fastmath=True)
+def solve_kepler(M, e, tolerance):
+    """Solve Kepler's equation E - e*sin(E) = M for E using Newton-Raphson."""
+    E = M  # Initial guess
+    for _ in range(50):  # Max iterations
+        f = E - e * math.sin(E) - M
+        f_prime = 1 - e * math.cos(E)
+        if abs(f_prime) < 1e-12:  # Avoid division by zero
+            break
+        E_new = E - f / f_prime
+        
+        if abs(E_new - E) < tolerance:
+            return E_new
+        E = E_new
+    
+    return E  # Return best approximation
+
+
+@njit('UniTuple(float64, 6)(float64, float64, float64)', cache=True, fastmath=True)
+def rotation_coefficients(Omega, omega, i):
+    """
+    Orbital-plane to heliocentric rotation for one orbit.
+    
+    Returns:
+        tuple: (p11, p12, p21, p22, p31, p32) coefficients applied to (x_orb, y_orb)
+    """
+    cos_Omega, sin_Omega = math.cos(Omega), math.sin(Omega)
+    cos_i, sin_i = math.cos(i), math.sin(i)
+    cos_omega, sin_omega = math.cos(omega), math.sin(omega)
+    
+    return (cos_Omega * cos_omega - sin_Omega * sin_omega * cos_i,
+            -cos_Omega * sin_omega - sin_Omega * cos_omega * cos_i,
+            sin_Omega * cos_omega + cos_Omega * sin_omega * cos_i,
+            -sin_Omega * sin_omega + cos_Omega * cos_omega * cos_i,
+            sin_omega * sin_i,
+            cos_omega * sin_i)
+
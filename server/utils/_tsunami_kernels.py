@@ -0,0 +1,67 @@
+"""
+🌊 Tsunami Geometry Kernels
+NASA Space Apps 2024
+
+Small scalar kernels behind NASAAPIManager's tsunami and population models.
+Compiled with numba when it is installed; otherwise they run as plain Python.
+"""
+
+import math
+import numpy as np
+
+from models._numba_compat import njit
+
+# Approximate km per degree of latitude
+KM_PER_DEGREE = 111.0
+
+
+@njit('float64[:, :](float64, float64, float64, int64)', cache=True, fastmath=True)
+def sample_ring(center_lat, center_lon, radius_km, num_points):
+    """
+    Points evenly spaced on a circle of radius_km around the center.
+
+    Returns:
+        (num_points, 3) array of latitude, longitude and angle (radians)
+    """
+    ring = np.empty((num_points, 3))
+    radius_deg = radius_km / KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(center_lat))
+
+    for i in range(num_points):
+        angle = (2 * math.pi * i) / num_points
+        ring[i, 0] = center_lat + radius_deg * math.cos(angle)
+        ring[i, 1] = center_lon + radius_deg * math.sin(angle) / cos_lat
+        ring[i, 2] = angle
+    return ring
+
+
+@njit('int64(float64, float64, float64)', cache=True)
+def tsunami_risk_score(diameter_m, elevation_m, water_ratio):
+    """Additive tsunami risk score from asteroid size, impact depth and nearby water."""
+    # Size factor
+    if diameter_m > 1000:
+        score = 5
+    elif diameter_m > 500:
+        score = 4
+    elif diameter_m > 200:
+        score = 3
+    elif diameter_m > 100:
+        score = 2
+    else:
+        score = 1
+
+    # Location factor
+    if elevation_m < -1000:  # Deep ocean
+        score += 3
+    elif elevation_m < -100:  # Continental shelf
+        score += 4
+    elif elevation_m <= 0:  # Shallow water/coastline
+        score += 5
+
+    # Coastal proximity factor
+    if water_ratio > 0.8:
+        score += 2
+    elif water_ratio > 0.5:
+        score += 1
+
+    return score
@@ -3,31 +3,114 @@ Asteroid Data Fetcher - NASA JPL Small-Body Database Integration
 Fetches real asteroid data from JPL's Small-Body Database for impact predictions.
 """
 
+import copy
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from utils.json_response import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Successful JPL lookups are reused for a day; SBDB data changes rarely
+CACHE_TTL_SECONDS = 24 * 3600
+CACHE_MAX_ENTRIES = 512
+
 class PracticalAsteroidFetcher:
     """Fetch real asteroid data from JPL for predictions"""
     
+    # JPL element/parameter names mapped to our standard names
+    _JPL_ORBIT_MAP = {
+        'a': 'semi_major_axis',
+        'e': 'eccentricity',
+        'i': 'inclination',
+        'om': 'ascending_node',
+        'w': 'argument_perihelion',
+        'ma': 'mean_anomaly',
+        'epoch': 'epoch',
+        'n': 'mean_motion_deg_day'
+    }
+    _JPL_PHYS_MAP = {
+        'diameter': 'diameter_km',
+        'H': 'absolute_magnitude',
+        'albedo': 'albedo'
+    }
+    
+    # Values used when JPL omits an element or parameter
+    _ORBIT_DEFAULTS = {
+        'semi_major_axis': 2.0,
+        'eccentricity': 0.2,
+        'inclination': 5.0,
+        'ascending_node': 45.0,
+        'argument_perihelion': 30.0,
+        'mean_anomaly': 0.0,
+        'epoch': 2451545.0,  # J2000
+        'mean_motion_deg_day': 0.5
+    }
+    _PHYS_DEFAULTS = {
+        'diameter_km': 1.0,
+        'absolute_magnitude': 20.0,
+        'albedo': 0.14
+    }
+    
     def __init__(self):
         self.jpl_url = "https://ssd-api.jpl.nasa.gov/sbdb.api"
+        # Query options shared by every SBDB lookup, pre-encoded once
+        self._jpl_static_qs = "full-prec=true&phys-par=true"
+        
+        # Persistent HTTP session so repeated lookups reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        
+        # LRU + TTL cache of successful responses: key -> (expires_at, result)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+    def _cache_get(self, key: Tuple) -> Optional[Dict]:
+        """Return a copy of a fresh cached result, or None on miss/expiry"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        return copy.deepcopy(result)
+    
+    def _cache_put(self, key: Tuple, result: Dict) -> None:
+        """Store a successful result, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, copy.deepcopy(result))
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
         
     def fetch_asteroid_data(self, asteroid_id: str) -> Dict:
         """Fetch real asteroid data from JPL database"""
+        cache_key = ('sbdb', asteroid_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            params = {
-                'sstr': asteroid_id,
-                'full-prec': 'true',
-                'phys-par': 'true'
-            }
+            url = f"{self.jpl_url}?sstr={quote(str(asteroid_id), safe='')}&{self._jpl_static_qs}"
             
             logger.info(f"Fetching asteroid data for ID: {asteroid_id}")
-            response = requests.get(self.jpl_url, params=params, timeout=15)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             if 'object' not in data:
                 logger.warning(f"No object data found for asteroid ID: {asteroid_id}")
@@ -49,6 +132,7 @@ class PracticalAsteroidFetcher:
             }
             
             logger.info(f"Successfully fetched data for asteroid: {result['name']}")
+            self._cache_put(cache_key, result)
             return result
             
         except requests.RequestException as e:
@@ -60,73 +144,35 @@ class PracticalAsteroidFetcher:
     
     def _parse_orbital_elements(self, data: Dict) -> Dict:
         """Parse orbital elements from JPL response"""
-        elements = {}
+        # Start from the defaults so missing elements need no second pass
+        elements = dict(self._ORBIT_DEFAULTS)
         
         if 'orbit' in data and 'elements' in data['orbit']:
             for elem in data['orbit']['elements']:
                 name = elem.get('name', '')
+                key = self._JPL_ORBIT_MAP.get(name)
+                if key is None:
+                    continue
                 try:
-                    value = float(elem.get('value', 0))
-                    
-                    # Map JPL names to our standard names
-                    if name == 'a':
-                        elements['semi_major_axis'] = value
-                    elif name == 'e':
-                        elements['eccentricity'] = value
-                    elif name == 'i':
-                        elements['inclination'] = value
-                    elif name == 'om':
-                        elements['ascending_node'] = value
-                    elif name == 'w':
-                        elements['argument_perihelion'] = value
-                    elif name == 'ma':
-                        elements['mean_anomaly'] = value
-                    elif name == 'epoch':
-                        elements['epoch'] = value
-                    elif name == 'n':
-                        elements['mean_motion_deg_day'] = value
+                    elements[key] = float(elem.get('value', 0))
                 except (ValueError, TypeError):
                     logger.warning(f"Could not parse orbital element {name}: {elem.get('value')}")
                     continue
         
-        # Set defaults if missing
-        defaults = {
-            'semi_major_axis': 2.0,
-            'eccentricity': 0.2,
-            'inclination': 5.0,
-            'ascending_node': 45.0,
-            'argument_perihelion': 30.0,
-            'mean_anomaly': 0.0,
-            'epoch': 2451545.0,  # J2000
-            'mean_motion_deg_day': 0.5
-        }
-        
-        for key, default_value in defaults.items():
-            if key not in elements:
-                elements[key] = default_value
-                logger.debug(f"Using default value for {key}: {default_value}")
-        
         return elements
     
     def _parse_physical_properties(self, data: Dict) -> Dict:
         """Parse physical properties from JPL response"""
-        properties = {
-            'diameter_km': 1.0,
-            'absolute_magnitude': 20.0,
-            'albedo': 0.14
-        }
+        properties = dict(self._PHYS_DEFAULTS)
         
         if 'phys_par' in data:
             for phys in data['phys_par']:
                 name = phys.get('name', '')
+                key = self._JPL_PHYS_MAP.get(name)
+                if key is None:
+                    continue
                 try:
-                    value = float(phys.get('value', 0))
-                    if name == 'diameter':
-                        properties['diameter_km'] = value
-                    elif name == 'H':
-                        properties['absolute_magnitude'] = value
-                    elif name == 'albedo':
-                        properties['albedo'] = value
+                    properties[key] = float(phys.get('value', 0))
                 except (ValueError, TypeError):
                     logger.warning(f"Could not parse physical property {name}: {phys.get('value')}")
                     continue
@@ -135,6 +181,11 @@ class PracticalAsteroidFetcher:
 
     def search_asteroids(self, query: str, limit: int = 10) -> Dict:
         """Search for asteroids by name or designation"""
+        cache_key = ('search', query, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Use a simpler endpoint for searches
             search_url = "https://ssd-api.jpl.nasa.gov/sbdb_query.api"
@@ -146,9 +197,9 @@ class PracticalAsteroidFetcher:
             }
             
             logger.info(f"Searching for asteroids with query: {query}")
-            response = requests.get(search_url, params=params, timeout=15)
+            response = self.session.get(search_url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             if 'data' not in data:
                 return {'success': False, 'error': 'No search results found'}
@@ -165,12 +216,14 @@ class PracticalAsteroidFetcher:
                         'diameter_km': float(row[5]) if row[5] else None
                     })
             
-            return {
+            search_result = {
                 'success': True,
                 'query': query,
                 'count': len(results),
                 'results': results
             }
+            self._cache_put(cache_key, search_result)
+            return search_result
             
         except Exception as e:
             logger.error(f"Error searching asteroids: {str(e)}")
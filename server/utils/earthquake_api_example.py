@@ -6,13 +6,109 @@ Example of how to add live USGS earthquake data to the asteroid impact system.
 This would replace the static earthquake comparison with dynamic API data.
 """
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+from utils.json_response import json_loads
+from utils._haversine_numba import EARTH_RADIUS_KM, NUMBA_AVAILABLE, haversine_batch, haversine_fast
+
 logger = logging.getLogger(__name__)
 
+# Optional incremental JSON parser for large USGS responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distances (km) from one point to arrays of points, in one vectorized pass."""
+    if NUMBA_AVAILABLE:
+        distances = np.empty(lats.shape[0])
+        haversine_batch(lat, lon, lats, lons, distances)
+        return distances
+    
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    lats_r = np.radians(lats)
+    lons_r = np.radians(lons)
+    
+    a = (np.sin((lats_r - lat_r) / 2) ** 2 +
+         math.cos(lat_r) * np.cos(lats_r) * np.sin((lons_r - lon_r) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+# Columnar (SoA) layout for parsed USGS features; place names and URLs live in parallel lists
+EQ_DTYPE = np.dtype([
+    ('magnitude', 'f8'),
+    ('time_ms', 'i8'),
+    ('latitude', 'f8'),
+    ('longitude', 'f8'),
+    ('depth_km', 'f8'),
+    ('distance_km', 'f8')
+])
+
+
+def _features_to_table(features: List[Dict[str, Any]],
+                       origin: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, List[str], List[str]]:
+    """
+    Pack GeoJSON features into an EQ_DTYPE array sorted by descending magnitude.
+    
+    Args:
+        features (list): USGS GeoJSON features
+        origin (tuple): Optional (lat, lon) to fill distance_km from
+        
+    Returns:
+        tuple: (table, places, urls) in the same sorted order
+    """
+    table = np.zeros(len(features), dtype=EQ_DTYPE)
+    places = []
+    urls = []
+    
+    for i, feature in enumerate(features):
+        props = feature['properties']
+        coords = feature['geometry']['coordinates']
+        
+        # USGS events normally carry every field; only fall back to defaults when one is absent
+        try:
+            magnitude = props['mag']
+            time_ms = props['time']
+            place = props['place']
+            url = props['url']
+        except KeyError:
+            magnitude = props.get('mag')
+            time_ms = props.get('time', 0)
+            place = props.get('place', 'Unknown')
+            url = props.get('url', '')
+        
+        table[i] = (
+            magnitude if magnitude is not None else np.nan,
+            time_ms,
+            coords[1],
+            coords[0],
+            coords[2] if len(coords) > 2 else 0,
+            0.0
+        )
+        places.append(place)
+        urls.append(url)
+    
+    if origin is not None:
+        # Distances to every epicenter in one vectorized haversine
+        table['distance_km'] = _haversine_km(origin[0], origin[1], table['latitude'], table['longitude'])
+    
+    # Stable descending sort keeps USGS order for equal magnitudes (like sorted(reverse=True))
+    order = np.argsort(-table['magnitude'], kind='stable')
+    return table[order], [places[i] for i in order], [urls[i] for i in order]
+
 
 class EarthquakeAPIManager:
     """Manager for USGS earthquake data integration."""
@@ -22,6 +118,13 @@ class EarthquakeAPIManager:
         self.usgs_base_url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
         self.timeout = 10
         
+        # Persistent HTTP session so repeated lookups reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        
         # Famous historical earthquakes as fallback
         self.historical_earthquakes = {
             '2011 Japan (Tōhoku)': 9.1,
@@ -33,6 +136,13 @@ class EarthquakeAPIManager:
             '1994 Northridge': 6.7,
             '2023 Turkey-Syria': 7.8
         }
+        
+        # Historical comparison entries are static, so build and sort them once
+        self._historical_sorted = sorted(
+            [{'name': name, 'magnitude': magnitude, 'type': 'historical', 'is_impact': False}
+             for name, magnitude in self.historical_earthquakes.items()],
+            key=lambda x: x['magnitude'], reverse=True
+        )
     
     def get_recent_earthquakes(self, min_magnitude: float = 6.0, 
                              days_back: int = 30) -> List[Dict[str, Any]]:
@@ -44,8 +154,72 @@ class EarthquakeAPIManager:
             days_back (int): Number of days to look back
             
         Returns:
-            list: Recent earthquake data
+            list: Recent earthquake data (event time in epoch milliseconds as 'time_ms')
+        """
+        fetched = self._fetch_recent_table(min_magnitude, days_back)
+        if fetched is None:
+            return []
+        
+        table, places, urls = fetched
+        return [
+            {
+                'magnitude': magnitude,
+                'location': place,
+                'time_ms': time_ms,
+                'latitude': latitude,
+                'longitude': longitude,
+                'depth_km': depth_km,
+                'url': url
+            }
+            for magnitude, place, time_ms, latitude, longitude, depth_km, url in zip(
+                table['magnitude'].tolist(), places, table['time_ms'].tolist(),
+                table['latitude'].tolist(), table['longitude'].tolist(),
+                table['depth_km'].tolist(), urls
+            )
+        ]
+    
+    def get_regional_earthquakes(self, lat: float, lon: float, 
+                               radius_km: float = 1000, 
+                               min_magnitude: float = 5.0,
+                               years_back: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get historical earthquakes in a region around the impact point.
+        
+        Args:
+            lat (float): Center latitude
+            lon (float): Center longitude
+            radius_km (float): Search radius in kilometers
+            min_magnitude (float): Minimum magnitude
+            years_back (int): Years of history to search
+            
+        Returns:
+            list: Regional earthquake history (event time in epoch milliseconds as 'time_ms')
         """
+        fetched = self._fetch_regional_table(lat, lon, radius_km, min_magnitude, years_back)
+        if fetched is None:
+            return []
+        
+        table, places, _ = fetched
+        return [
+            {
+                'magnitude': magnitude,
+                'location': place,
+                'time_ms': time_ms,
+                'latitude': latitude,
+                'longitude': longitude,
+                'depth_km': depth_km,
+                'distance_km': distance_km
+            }
+            for magnitude, place, time_ms, latitude, longitude, depth_km, distance_km in zip(
+                table['magnitude'].tolist(), places, table['time_ms'].tolist(),
+                table['latitude'].tolist(), table['longitude'].tolist(),
+                table['depth_km'].tolist(), table['distance_km'].tolist()
+            )
+        ]
+    
+    def _fetch_recent_table(self, min_magnitude: float,
+                            days_back: int) -> Optional[Tuple[np.ndarray, List[str], List[str]]]:
+        """Query recent earthquakes as an EQ_DTYPE table (None if the request failed)."""
         try:
             # Calculate date range
             end_time = datetime.utcnow()
@@ -61,61 +235,29 @@ class EarthquakeAPIManager:
                 'limit': 20
             }
             
-            response = requests.get(self.usgs_base_url, params=params, timeout=self.timeout)
+            response = self.session.get(self.usgs_base_url, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
-                earthquakes = []
-                
-                for feature in data.get('features', []):
-                    props = feature['properties']
-                    coords = feature['geometry']['coordinates']
-                    
-                    earthquakes.append({
-                        'magnitude': props.get('mag'),
-                        'location': props.get('place', 'Unknown'),
-                        'time': datetime.fromtimestamp(props.get('time', 0) / 1000),
-                        'latitude': coords[1],
-                        'longitude': coords[0],
-                        'depth_km': coords[2] if len(coords) > 2 else 0,
-                        'url': props.get('url', '')
-                    })
-                
-                return sorted(earthquakes, key=lambda x: x['magnitude'], reverse=True)
+                data = json_loads(response.content)
+                return _features_to_table(data.get('features', []))
             
             else:
                 logger.warning(f"USGS API returned status {response.status_code}")
-                return []
+                return None
                 
         except Exception as e:
             logger.error(f"Error fetching earthquake data: {str(e)}")
-            return []
+            return None
     
-    def get_regional_earthquakes(self, lat: float, lon: float, 
-                               radius_km: float = 1000, 
-                               min_magnitude: float = 5.0,
-                               years_back: int = 10) -> List[Dict[str, Any]]:
-        """
-        Get historical earthquakes in a region around the impact point.
-        
-        Args:
-            lat (float): Center latitude
-            lon (float): Center longitude
-            radius_km (float): Search radius in kilometers
-            min_magnitude (float): Minimum magnitude
-            years_back (int): Years of history to search
-            
-        Returns:
-            list: Regional earthquake history
-        """
+    def _fetch_regional_table(self, lat: float, lon: float, radius_km: float,
+                              min_magnitude: float,
+                              years_back: int) -> Optional[Tuple[np.ndarray, List[str], List[str]]]:
+        """Query regional earthquakes as an EQ_DTYPE table with distances (None if the request failed)."""
         try:
             # Calculate date range
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(days=years_back * 365)
             
-            # Convert radius to degrees (approximate)
-            radius_deg = radius_km / 111.0  # 1 degree ≈ 111 km
-            
             params = {
                 'format': 'geojson',
                 'starttime': start_time.strftime('%Y-%m-%d'),
@@ -128,35 +270,21 @@ class EarthquakeAPIManager:
                 'limit': 50
             }
             
-            response = requests.get(self.usgs_base_url, params=params, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                data = response.json()
-                earthquakes = []
+            # The with block releases the pooled connection even when the body is never read
+            with self.session.get(
+                self.usgs_base_url, params=params, timeout=self.timeout, stream=IJSON_AVAILABLE
+            ) as response:
+                if response.status_code == 200:
+                    features = self._read_features(response, params['limit'])
+                    return _features_to_table(features, origin=(lat, lon))
                 
-                for feature in data.get('features', []):
-                    props = feature['properties']
-                    coords = feature['geometry']['coordinates']
-                    
-                    earthquakes.append({
-                        'magnitude': props.get('mag'),
-                        'location': props.get('place', 'Unknown'),
-                        'time': datetime.fromtimestamp(props.get('time', 0) / 1000),
-                        'latitude': coords[1],
-                        'longitude': coords[0],
-                        'depth_km': coords[2] if len(coords) > 2 else 0,
-                        'distance_km': self._calculate_distance(lat, lon, coords[1], coords[0])
-                    })
-                
-                return sorted(earthquakes, key=lambda x: x['magnitude'], reverse=True)
-            
-            else:
-                logger.warning(f"USGS API returned status {response.status_code}")
-                return []
+                else:
+                    logger.warning(f"USGS API returned status {response.status_code}")
+                    return None
                 
         except Exception as e:
             logger.error(f"Error fetching regional earthquake data: {str(e)}")
-            return []
+            return None
     
     def create_enhanced_seismic_comparison(self, impact_magnitude: float, 
                                          impact_lat: float = None, 
@@ -186,79 +314,79 @@ class EarthquakeAPIManager:
         }]
         
         # Add historical reference earthquakes
-        historical_list = []
-        for name, magnitude in self.historical_earthquakes.items():
-            historical_list.append({
-                'name': name,
-                'magnitude': magnitude,
-                'type': 'historical',
-                'is_impact': False
-            })
+        comparison_data['categories']['Historical Major'] = list(self._historical_sorted)
         
-        comparison_data['categories']['Historical Major'] = sorted(
-            historical_list, key=lambda x: x['magnitude'], reverse=True
-        )
+        # Fetch recent and regional earthquakes concurrently; both are independent USGS queries
+        has_location = impact_lat is not None and impact_lon is not None
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            recent_future = executor.submit(
+                self._fetch_recent_table, min_magnitude=6.0, days_back=365
+            )
+            regional_future = executor.submit(
+                self._fetch_regional_table, impact_lat, impact_lon,
+                radius_km=500, min_magnitude=5.0, years_back=20
+            ) if has_location else None
+            recent = recent_future.result()
+            regional = regional_future.result() if regional_future else None
         
-        # Add recent earthquakes
-        recent_earthquakes = self.get_recent_earthquakes(min_magnitude=6.0, days_back=365)
-        if recent_earthquakes:
-            recent_list = []
-            for eq in recent_earthquakes[:10]:  # Top 10 recent
-                recent_list.append({
-                    'name': f"{eq['location']} ({eq['time'].year})",
-                    'magnitude': eq['magnitude'],
+        # Add recent earthquakes (only the top 10 rows are turned into dicts)
+        if recent is not None and len(recent[0]):
+            table, places, _ = recent
+            top = table[:10]
+            dates = [datetime.fromtimestamp(time_ms / 1000) for time_ms in top['time_ms'].tolist()]
+            comparison_data['categories']['Recent (Last Year)'] = [
+                {
+                    'name': f"{place} ({date.year})",
+                    'magnitude': magnitude,
                     'type': 'recent',
                     'is_impact': False,
-                    'date': eq['time']
-                })
-            
-            comparison_data['categories']['Recent (Last Year)'] = recent_list
+                    'date': date
+                }
+                for magnitude, place, date in zip(top['magnitude'].tolist(), places, dates)
+            ]
         
         # Add regional context if coordinates provided
-        if impact_lat is not None and impact_lon is not None:
-            regional_earthquakes = self.get_regional_earthquakes(
-                impact_lat, impact_lon, radius_km=500, min_magnitude=5.0, years_back=20
-            )
-            
-            if regional_earthquakes:
-                regional_list = []
-                for eq in regional_earthquakes[:10]:  # Top 10 regional
-                    regional_list.append({
-                        'name': f"{eq['location']} ({eq['time'].year})",
-                        'magnitude': eq['magnitude'], 
-                        'type': 'regional',
-                        'is_impact': False,
-                        'distance_km': eq['distance_km'],
-                        'date': eq['time']
-                    })
-                
-                comparison_data['categories']['Regional (500km)'] = regional_list
+        if regional is not None and len(regional[0]):
+            table, places, _ = regional
+            top = table[:10]
+            dates = [datetime.fromtimestamp(time_ms / 1000) for time_ms in top['time_ms'].tolist()]
+            comparison_data['categories']['Regional (500km)'] = [
+                {
+                    'name': f"{place} ({date.year})",
+                    'magnitude': magnitude,
+                    'type': 'regional',
+                    'is_impact': False,
+                    'distance_km': distance_km,
+                    'date': date
+                }
+                for magnitude, place, distance_km, date in zip(
+                    top['magnitude'].tolist(), places, top['distance_km'].tolist(), dates
+                )
+            ]
         
         return comparison_data
     
+    def _read_features(self, response: requests.Response, limit: int) -> List[Dict[str, Any]]:
+        """
+        Read at most `limit` GeoJSON features from a USGS response.
+        
+        With ijson the features are parsed incrementally from the raw stream, so
+        the full document is never materialized; otherwise the body is parsed whole.
+        """
+        if not IJSON_AVAILABLE:
+            return json_loads(response.content).get('features', [])[:limit]
+        
+        try:
+            response.raw.decode_content = True  # Let urllib3 undo gzip before parsing
+            return list(islice(ijson.items(response.raw, 'features.item', use_float=True), limit))
+        finally:
+            response.close()
+    
     def _calculate_distance(self, lat1: float, lon1: float, 
                           lat2: float, lon2: float) -> float:
         """Calculate approximate distance between two points in km."""
-        import math
-        
-        # Convert to radians
         lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth's radius in km
-        r = 6371
-        
-        return r * c
+        return haversine_fast(lat1_rad, math.radians(lon1), math.cos(lat1_rad), lat2, lon2)
 
 
 # Example integration into the visualization manager
@@ -0,0 +1,97 @@
+"""
+⚡ Fast JSON Responses
+NASA Space Apps 2024
+
+Flask response helpers for large, float-heavy API payloads, plus a matching
+parser for upstream API bodies.
+Uses orjson when it is installed and falls back to the standard json module.
+"""
+
+from typing import Any, Dict, Generator, Iterable, Iterator, Optional, Tuple
+
+from flask import Response, stream_with_context
+
+# Conditional orjson import - stdlib json is used when it is not available
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    import numpy as np
+
+    def _json_default(value: Any) -> Any:
+        """Convert numpy values the way orjson's OPT_SERIALIZE_NUMPY does."""
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, default=_json_default).encode('utf-8')
+
+    json_loads = json.loads
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes with the same encoder json_response uses."""
+    return _dumps(data)
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """
+    Serialize data into a JSON Flask response.
+
+    Args:
+        data: JSON-serializable payload (numpy scalars/arrays allowed with orjson)
+        status (int): HTTP status code
+
+    Returns:
+        Response: Flask response with application/json mimetype
+    """
+    return Response(_dumps(data), status=status, mimetype='application/json')
+
+
+def stream_json_response(key: str, sections: Iterable[Tuple[str, Any]],
+                         envelope: Dict[str, Any]) -> Response:
+    """
+    Stream a JSON object whose `key` member is written section by section.
+
+    The response body is equivalent to {key: dict(sections), **envelope}, but each
+    (name, value) pair is sent as soon as the sections iterable produces it.
+    The envelope goes out last, so a sections generator can override its members
+    (e.g. {'success': False, 'error': ...}) by returning a dict once it is done.
+
+    Args:
+        key (str): Name of the streamed member (e.g. 'data')
+        sections: Iterable of (name, value) pairs, typically a generator
+        envelope (dict): Top-level members written after the sections (e.g. {'success': True})
+        
+    Returns:
+        Response: Streaming Flask response with application/json mimetype
+    """
+    def members() -> Generator[bytes, None, Optional[Dict[str, Any]]]:
+        separator = b''
+        iterator = iter(sections)
+        while True:
+            try:
+                name, value = next(iterator)
+            except StopIteration as stop:
+                return stop.value
+            yield separator + _dumps(name) + b':' + _dumps(value)
+            separator = b','
+
+    def generate() -> Iterator[bytes]:
+        yield b'{' + _dumps(key) + b':{'
+        overrides = yield from members()
+        tail = _dumps({**envelope, **(overrides or {})})[1:]
+        yield b'}' + (b',' + tail if tail != b'}' else tail)
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
@@ -7,14 +7,180 @@ and geographic data to enhance asteroid impact analysis.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import copy
 import math
-from datetime import datetime, timedelta
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, Optional, Tuple, List
 import logging
+import numpy as np
+
+from utils._haversine_numba import EARTH_RADIUS_KM
+from utils._tsunami_kernels import KM_PER_DEGREE, sample_ring, tsunami_risk_score
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for fanning out per-point elevation lookups (I/O bound). Eight in flight
+# keeps the fan-out fast without tripping the public Open-Elevation rate limits.
+EXEC = ThreadPoolExecutor(max_workers=8)
+
+# Major metropolitan areas (rough approximations) used by the population density model
+_CITY_LATLON = np.array([
+    [40.7128, -74.0060],    # New York
+    [51.5074, -0.1278],     # London
+    [35.6762, 139.6503],    # Tokyo
+    [48.8566, 2.3522],      # Paris
+    [34.0522, -118.2437],   # Los Angeles
+    [30.0444, 31.2357],     # Cairo
+    [55.7558, 37.6176],     # Moscow
+    [28.6139, 77.2090],     # Delhi
+    [31.2304, 121.4737],    # Shanghai
+    [-23.5505, -46.6333]    # São Paulo
+], dtype=np.float64)
+_CITY_DENSITIES = (10000, 5000, 6000, 8000, 3000, 4000, 4500, 12000, 7000, 7500)
+_CITY_LAT_RAD = np.radians(_CITY_LATLON[:, 0])
+_CITY_LON_RAD = np.radians(_CITY_LATLON[:, 1])
+_CITY_COS_LAT = np.cos(_CITY_LAT_RAD)
+
+
+def _build_density_grid() -> np.ndarray:
+    """
+    Evaluate the nearest-city density model at every 1°x1° cell center.
+    
+    Density falls off in bands of ~1, 5 and 10 degrees (111/555/1111 km) from the
+    nearest major city; cells further out are 0 and get the remote fallback at lookup.
+    
+    Returns:
+        (180, 360) float64 array indexed by [int(lat + 90), int(lon + 180)]
+    """
+    lat_rad = np.radians(np.arange(-89.5, 90.0, 1.0))[:, None, None]
+    lon_rad = np.radians(np.arange(-179.5, 180.0, 1.0))[None, :, None]
+    a = (np.sin((_CITY_LAT_RAD - lat_rad) / 2) ** 2 +
+         np.cos(lat_rad) * _CITY_COS_LAT * np.sin((_CITY_LON_RAD - lon_rad) / 2) ** 2)
+    distances_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+    
+    nearest = distances_km.argmin(axis=2)
+    min_distance_km = np.take_along_axis(distances_km, nearest[..., None], axis=2)[..., 0]
+    closest_density = np.asarray(_CITY_DENSITIES, dtype=np.float64)[nearest]
+    
+    return np.select(
+        [min_distance_km < 111, min_distance_km < 555, min_distance_km < 1111],
+        [closest_density, closest_density * 0.5, closest_density * 0.1],
+        default=0.0
+    )
+
+
+# Population density model precomputed on a 1° grid; swap for a real raster without touching callers
+_DENSITY_GRID = _build_density_grid()
+
+# Coastal region lookup tables: rows of (lat_min, lat_max, lon_min, lon_max), bounds inclusive.
+# Where rows overlap the first matching row wins, so row order is significant.
+_NORTH = np.nextafter(0.0, 1.0)  # strictly north of the equator
+_OCEAN_REGION_BOXES = np.array([
+    [_NORTH, np.inf, -180, -30],     # Atlantic/Pacific Americas
+    [-np.inf, 0, -180, -30],
+    [_NORTH, np.inf, -30, 60],       # Atlantic/Indian Ocean
+    [-np.inf, 0, -30, 60],
+    [_NORTH, np.inf, 60, 180],       # Pacific/Indian Ocean
+    [-np.inf, 0, 60, 180]
+], dtype=np.float64)
+_OCEAN_REGION_NAMES = (
+    ('North American Coast', 'European Coast'),
+    ('South American Coast', 'African Coast'),
+    ('European Coast', 'Middle Eastern Coast'),
+    ('African Coast', 'Indian Ocean Islands'),
+    ('Asian Coast', 'Pacific Islands'),
+    ('Australian Coast', 'Pacific Islands')
+)
+_HIGH_RISK_BOXES = np.array([
+    [20, 50, 120, 150],
+    [-10, 10, 90, 120],
+    [30, 45, -130, -115]
+], dtype=np.float64)
+_HIGH_RISK_NAMES = (
+    'Japan Coast (High Risk)',
+    'Indonesia/Philippines (High Risk)',
+    'US West Coast (High Risk)'
+)
+
+# Impacts this far from water (km) by asteroids no larger than this (m) are scored
+# as land impacts without looking up the impact point elevation
+INTERIOR_LAND_DISTANCE_KM = 200
+INTERIOR_LAND_MAX_DIAMETER_M = 500
+
+# Tsunami generation potential by asteroid diameter: a diameter below _SIZE_THRESHOLDS_M[i]
+# falls in _SIZE_FACTORS[i]; at or above the last threshold it is catastrophic.
+# The dicts are shared between calls and must not be mutated.
+_SIZE_THRESHOLDS_M = (50, 200, 500, 1000)
+_SIZE_FACTORS = (
+    {'category': 'negligible', 'description': 'Too small to generate significant tsunamis'},
+    {'category': 'minor', 'description': 'May cause local wave disturbances'},
+    {'category': 'moderate', 'description': 'Can generate regional tsunamis'},
+    {'category': 'major', 'description': 'Can generate large regional tsunamis'},
+    {'category': 'catastrophic', 'description': 'Can generate ocean-wide mega-tsunamis'}
+)
+
+# Latitude bands for location info. Upper bounds are inclusive, so they are searched
+# with bisect_left; the general region additionally requires -90 <= lat <= 90.
+_REGION_LAT_BOUNDS = (-60, -23.5, 23.5, 60)
+_REGION_NAMES = ('Antarctica', 'Southern Temperate', 'Tropical', 'Northern Temperate', 'Arctic')
+_CLIMATE_ABS_LAT_BOUNDS = (23.5, 35, 60)
+_CLIMATE_ZONES = ('Tropical', 'Subtropical', 'Temperate', 'Polar')
+
+# Wave energy factor by asteroid diameter, bucketed the same way
+_WAVE_ENERGY_THRESHOLDS_M = (100, 500, 1000)
+_WAVE_ENERGY_FACTORS = (1, 5, 20, 50)
+
+# Continental interiors and their rough distance to the nearest water body (km)
+_INTERIOR_BOXES = np.array([
+    [20, 50, -105, -95],     # Central US
+    [45, 65, 30, 140],       # Central Asia
+    [-30, 10, 10, 30],       # Central Africa
+    [-40, -10, -70, -40]     # Central South America
+], dtype=np.float64)
+_INTERIOR_WATER_DISTANCE_KM = (800, 1000, 500, 600)
+
+
+def _first_box_hit(boxes: np.ndarray, lat: float, lon: float) -> int:
+    """Index of the first (lat_min, lat_max, lon_min, lon_max) row containing the point, or -1."""
+    hit = ((lat >= boxes[:, 0]) & (lat <= boxes[:, 1]) &
+           (lon >= boxes[:, 2]) & (lon <= boxes[:, 3]))
+    return int(hit.argmax()) if hit.any() else -1
+
+# Historical earthquakes (name, magnitude) used to pad the USGS comparison set
+_WELL_KNOWN_EARTHQUAKES = (
+    ('2011 Japan', 9.1),
+    ('2004 Sumatra', 9.1),
+    ('1960 Chile', 9.5),
+    ('1964 Alaska', 9.2)
+)
+
+# Static comparison set used when the USGS API is unavailable
+_FALLBACK_EARTHQUAKES = (
+    ('2011 Japan', 9.1),
+    ('2004 Sumatra', 9.1),
+    ('1906 San Francisco', 7.9),
+    ('2010 Haiti', 7.0),
+    ('1994 Northridge', 6.7),
+    ('1960 Chile', 9.5)
+)
+
+# Elevation cache: coordinates rounded to 4 decimals (~11 m), successful lookups only
+ELEVATION_CACHE_DECIMALS = 4
+ELEVATION_CACHE_MAX_ENTRIES = 100000
+
+# USGS significant-earthquake list is reused for an hour; it changes at most daily
+HISTORICAL_EARTHQUAKES_TTL_SECONDS = 3600
+
+# Regional and tsunami results cached per exact request arguments, complete lookups only
+RESULT_CACHE_MAX_ENTRIES = 2048
+
 
 class NASAAPIManager:
     """Manager for NASA and external API integrations."""
@@ -41,6 +207,74 @@ class NASAAPIManager:
             'base_url': 'https://earthquake.usgs.gov/fdsnws/event/1/query',
             'timeout': 10
         }
+        
+        # Persistent HTTP session so repeated API calls reuse pooled keep-alive connections.
+        # Transient gateway errors are retried; the pool covers every EXEC worker.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Identify the app to the public elevation/USGS services
+        self.session.headers.update({'User-Agent': 'AstroSheild/1.0'})
+        
+        # LRU cache of successful elevation lookups: (lat_q, lon_q) -> elevation
+        self._elevation_cache = OrderedDict()
+        self._elevation_cache_lock = threading.Lock()
+        
+        # LRU cache of regional/tsunami results: (method, *args) -> result
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Last successful USGS historical earthquake fetch: (expires_at, earthquakes)
+        self._historical_earthquakes = None
+    
+    def _elevation_key(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Quantize coordinates into an elevation cache key."""
+        return round(lat, ELEVATION_CACHE_DECIMALS), round(lon, ELEVATION_CACHE_DECIMALS)
+    
+    def _elevation_cache_get(self, key: Tuple[float, float]) -> Optional[float]:
+        """Return a cached elevation, or None on a miss."""
+        with self._elevation_cache_lock:
+            elevation = self._elevation_cache.get(key)
+            if elevation is not None:
+                self._elevation_cache.move_to_end(key)
+            return elevation
+    
+    def _elevation_cache_put(self, key: Tuple[float, float], elevation: float) -> None:
+        """Store an elevation, evicting the least recently used entry when full."""
+        with self._elevation_cache_lock:
+            self._elevation_cache[key] = elevation
+            self._elevation_cache.move_to_end(key)
+            if len(self._elevation_cache) > ELEVATION_CACHE_MAX_ENTRIES:
+                self._elevation_cache.popitem(last=False)
+    
+    def clear_elevation_cache(self) -> None:
+        """Forget every cached elevation, and the regional/tsunami results built from them."""
+        with self._elevation_cache_lock:
+            self._elevation_cache.clear()
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
+    def _result_cache_get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached result, or None on a miss."""
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        return copy.deepcopy(result)
+    
+    def _result_cache_put(self, key: Tuple, result: Dict[str, Any]) -> None:
+        """Store a copy of a result, evicting the least recently used entry when full."""
+        result = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > RESULT_CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
     
     def get_elevation_single(self, lat: float, lon: float) -> Dict[str, Any]:
         """
@@ -62,12 +296,21 @@ class NASAAPIManager:
                     'elevation': self.fallback_elevation
                 }
             
+            cache_key = self._elevation_key(lat, lon)
+            cached = self._elevation_cache_get(cache_key)
+            if cached is not None:
+                return {
+                    'status': 'success',
+                    'elevation': cached,
+                    'source': 'open-elevation'
+                }
+            
             # Make API request
             params = {
                 'locations': f"{lat},{lon}"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.apis['elevation']['base_url'],
                 params=params,
                 timeout=self.apis['elevation']['timeout']
@@ -77,6 +320,7 @@ class NASAAPIManager:
                 data = response.json()
                 if 'results' in data and data['results']:
                     elevation = data['results'][0].get('elevation', self.fallback_elevation)
+                    self._elevation_cache_put(cache_key, elevation)
                     return {
                         'status': 'success',
                         'elevation': elevation,
@@ -106,6 +350,103 @@ class NASAAPIManager:
                 'error': str(e)
             }
     
+    def get_elevation_batch(self, points: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+        """
+        Get elevations for many coordinates with a single Open-Elevation POST.
+        
+        Args:
+            points (list): (lat, lon) pairs
+            
+        Returns:
+            list: Elevation data with status for each point, index-aligned with points
+        """
+        results = [None] * len(points)
+        
+        # Out-of-range coordinates get the fallback and cached points are answered locally;
+        # only the rest are sent
+        pending_indices = []
+        for i, (lat, lon) in enumerate(points):
+            if (-90 <= lat <= 90) and (-180 <= lon <= 180):
+                cached = self._elevation_cache_get(self._elevation_key(lat, lon))
+                if cached is not None:
+                    results[i] = {
+                        'status': 'success',
+                        'elevation': cached,
+                        'source': 'open-elevation'
+                    }
+                else:
+                    pending_indices.append(i)
+            else:
+                results[i] = {
+                    'status': 'error',
+                    'error': 'Invalid coordinates',
+                    'elevation': self.fallback_elevation
+                }
+        
+        if not pending_indices:
+            return results
+        
+        error = None
+        timed_out = False
+        try:
+            body = {
+                'locations': [
+                    {'latitude': points[i][0], 'longitude': points[i][1]} for i in pending_indices
+                ]
+            }
+            
+            response = self.session.post(
+                self.apis['elevation']['base_url'],
+                json=body,
+                timeout=self.apis['elevation']['timeout']
+            )
+            
+            if response.status_code == 200:
+                api_results = response.json().get('results') or []
+                for i, result in zip(pending_indices, api_results):
+                    elevation = result.get('elevation', self.fallback_elevation)
+                    self._elevation_cache_put(self._elevation_key(*points[i]), elevation)
+                    results[i] = {
+                        'status': 'success',
+                        'elevation': elevation,
+                        'source': 'open-elevation'
+                    }
+                if len(api_results) < len(pending_indices):
+                    error = 'API returned fewer results than requested'
+            else:
+                error = f"API returned status {response.status_code}"
+                
+        except requests.exceptions.Timeout:
+            error = 'API timeout'
+            timed_out = True
+        except Exception as e:
+            error = str(e)
+        
+        if error:
+            logger.warning(f"Batch elevation lookup for {len(pending_indices)} points failed: {error}")
+            
+            # Retry unanswered points as concurrent single lookups, unless the API is timing out
+            missing = [i for i in pending_indices if results[i] is None]
+            if missing and not timed_out:
+                if len(missing) <= 2:
+                    # Not worth a trip through the pool
+                    singles = [self.get_elevation_single(*points[i]) for i in missing]
+                else:
+                    singles = EXEC.map(lambda i: self.get_elevation_single(*points[i]), missing)
+                for i, result in zip(missing, singles):
+                    results[i] = result
+        
+        # Anything still unanswered falls back individually
+        for i in pending_indices:
+            if results[i] is None:
+                results[i] = {
+                    'status': 'fallback',
+                    'elevation': self.fallback_elevation,
+                    'error': error
+                }
+        
+        return results
+    
     def estimate_population_bbox(self, south: float, north: float, 
                                west: float, east: float) -> Dict[str, Any]:
         """
@@ -120,6 +461,13 @@ class NASAAPIManager:
         Returns:
             dict: Population estimate data
         """
+        # Calculate area in km²
+        # This is an approximation - more accurate methods would account for Earth's curvature
+        lat_km = (north - south) * KM_PER_DEGREE
+        # Longitude degrees shrink with the cosine of the average latitude
+        lon_km = (east - west) * KM_PER_DEGREE * math.cos(math.radians((north + south) / 2))
+        area_km2 = lat_km * lon_km
+        
         try:
             # Validate bounding box
             if not (-90 <= south <= north <= 90) or not (-180 <= west <= east <= 180):
@@ -128,20 +476,6 @@ class NASAAPIManager:
                     'error': 'Invalid bounding box coordinates'
                 }
             
-            # Calculate area in km²
-            # This is an approximation - more accurate methods would account for Earth's curvature
-            lat_diff = north - south
-            lon_diff = east - west
-            
-            # Average latitude for more accurate longitude distance calculation
-            avg_lat = (north + south) / 2
-            
-            # Convert degrees to km (approximately)
-            lat_km = lat_diff * 111  # 1 degree latitude ≈ 111 km
-            lon_km = lon_diff * 111 * math.cos(math.radians(avg_lat))  # Longitude varies with latitude
-            
-            area_km2 = lat_km * lon_km
-            
             # Estimate population density based on location characteristics
             population_density = self._estimate_population_density(south, north, west, east)
             
@@ -165,7 +499,6 @@ class NASAAPIManager:
         except Exception as e:
             logger.error(f"Population estimation error: {str(e)}")
             # Fallback calculation
-            area_km2 = ((north - south) * 111) * ((east - west) * 111 * math.cos(math.radians((north + south) / 2)))
             pop_estimate = int(area_km2 * self.fallback_population_density)
             
             return {
@@ -189,44 +522,14 @@ class NASAAPIManager:
         
         # Very basic population density estimation based on known populated regions
         # This is highly simplified and should be replaced with real data in production
-        
-        # Major metropolitan areas (rough approximations)
-        major_cities = [
-            {'lat': 40.7128, 'lon': -74.0060, 'density': 10000, 'name': 'New York'},
-            {'lat': 51.5074, 'lon': -0.1278, 'density': 5000, 'name': 'London'},
-            {'lat': 35.6762, 'lon': 139.6503, 'density': 6000, 'name': 'Tokyo'},
-            {'lat': 48.8566, 'lon': 2.3522, 'density': 8000, 'name': 'Paris'},
-            {'lat': 34.0522, 'lon': -118.2437, 'density': 3000, 'name': 'Los Angeles'},
-            {'lat': 30.0444, 'lon': 31.2357, 'density': 4000, 'name': 'Cairo'},
-            {'lat': 55.7558, 'lon': 37.6176, 'density': 4500, 'name': 'Moscow'},
-            {'lat': 28.6139, 'lon': 77.2090, 'density': 12000, 'name': 'Delhi'},
-            {'lat': 31.2304, 'lon': 121.4737, 'density': 7000, 'name': 'Shanghai'},
-            {'lat': -23.5505, 'lon': -46.6333, 'density': 7500, 'name': 'São Paulo'}
-        ]
-        
-        # Find closest major city
-        min_distance = float('inf')
-        closest_density = self.fallback_population_density
-        
-        for city in major_cities:
-            # Calculate approximate distance
-            lat_diff = center_lat - city['lat']
-            lon_diff = center_lon - city['lon']
-            distance = math.sqrt(lat_diff**2 + lon_diff**2)  # Rough distance in degrees
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_density = city['density']
-        
-        # Adjust density based on distance from nearest major city
-        if min_distance < 1:  # Very close to major city
-            return closest_density
-        elif min_distance < 5:  # Moderate distance
-            return closest_density * 0.5
-        elif min_distance < 10:  # Suburban/rural
-            return closest_density * 0.1
-        else:  # Very rural/remote
-            return max(10, self.fallback_population_density * 0.2)
+        lat_idx = min(max(int(center_lat + 90), 0), 179)
+        lon_idx = min(max(int(center_lon + 180), 0), 359)
+        density = _DENSITY_GRID[lat_idx, lon_idx]
+        
+        if density > 0:
+            return float(density)
+        # Very rural/remote
+        return max(10, self.fallback_population_density * 0.2)
     
     def get_regional_impact_data(self, impact_lat: float, impact_lon: float, 
                                search_radius_km: float = 100) -> Dict[str, Any]:
@@ -241,6 +544,11 @@ class NASAAPIManager:
         Returns:
             dict: Regional impact data
         """
+        cache_key = ('regional', impact_lat, impact_lon, search_radius_km)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Calculate bounding box
         degree_offset = search_radius_km / 111  # Approximate conversion
         
@@ -255,7 +563,7 @@ class NASAAPIManager:
         # Get population data
         population_data = self.estimate_population_bbox(south, north, west, east)
         
-        return {
+        regional_data = {
             'impact_location': {
                 'latitude': impact_lat,
                 'longitude': impact_lon,
@@ -271,6 +579,11 @@ class NASAAPIManager:
                 'east': east
             }
         }
+        
+        # Only cache complete data so API outages aren't pinned in the cache
+        if elevation_data.get('status') == 'success' and population_data.get('status') == 'success':
+            self._result_cache_put(cache_key, regional_data)
+        return regional_data
     
     def assess_tsunami_risk(self, impact_lat: float, impact_lon: float, 
                            asteroid_diameter_m: float, search_radius_km: float = 200) -> Dict[str, Any]:
@@ -286,102 +599,24 @@ class NASAAPIManager:
         Returns:
             dict: Tsunami risk assessment
         """
+        cache_key = ('tsunami', impact_lat, impact_lon, asteroid_diameter_m, search_radius_km)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Get impact point elevation
-            impact_elevation = self.get_elevation_single(impact_lat, impact_lon)
-            elevation_m = impact_elevation.get('elevation', self.fallback_elevation)
-            
-            # Initialize risk assessment
-            risk_assessment = {
-                'tsunami_likely': False,
-                'risk_level': 'none',  # none, low, moderate, high, extreme
-                'risk_factors': [],
-                'warnings': [],
-                'impact_location': {
-                    'latitude': impact_lat,
-                    'longitude': impact_lon,
-                    'elevation_m': elevation_m,
-                    'is_underwater': elevation_m <= 0
-                },
-                'coastal_analysis': {
-                    'nearby_coastlines': [],
-                    'affected_regions': [],
-                    'max_wave_height_estimate_m': 0
-                },
-                'asteroid_size_factor': self._get_tsunami_size_factor(asteroid_diameter_m)
-            }
+            distance_to_water = self._estimate_distance_to_water(impact_lat, impact_lon)
             
-            # Check if impact is in water (elevation <= 0)
-            if elevation_m <= 0:
-                risk_assessment['risk_factors'].append('Impact location is underwater/at sea level')
-                risk_assessment['tsunami_likely'] = True
-                
-                # Analyze surrounding area for coastlines and populated areas
-                coastal_analysis = self._analyze_coastal_impact(
-                    impact_lat, impact_lon, asteroid_diameter_m, search_radius_km
-                )
-                risk_assessment['coastal_analysis'] = coastal_analysis
-                
-                # Calculate risk level based on multiple factors
-                risk_level = self._calculate_tsunami_risk_level(
-                    asteroid_diameter_m, elevation_m, coastal_analysis
-                )
-                risk_assessment['risk_level'] = risk_level
-                
-                # Generate warnings and recommendations
-                warnings = self._generate_tsunami_warnings(
-                    risk_level, asteroid_diameter_m, coastal_analysis
-                )
-                risk_assessment['warnings'] = warnings
-                
+            # Small impacts deep in a continental interior are land impacts; skip the elevation
+            # round-trip for them and report the elevation as unknown
+            if distance_to_water > INTERIOR_LAND_DISTANCE_KM and asteroid_diameter_m <= INTERIOR_LAND_MAX_DIAMETER_M:
+                elevation_m = None
+                complete = True
             else:
-                # Land impact - check if close to water bodies
-                distance_to_water = self._estimate_distance_to_water(impact_lat, impact_lon)
-                
-                if distance_to_water < 50:  # Within 50km of water
-                    risk_assessment['risk_factors'].append(f'Impact within ~{distance_to_water}km of water body')
-                    
-                    if asteroid_diameter_m > 500:  # Large asteroid
-                        risk_assessment['tsunami_likely'] = True
-                        risk_assessment['risk_level'] = 'low'
-                        risk_assessment['warnings'].append('Large asteroid impact near water may cause local tsunamis')
-                
-                risk_assessment['distance_to_water_km'] = distance_to_water
-            
-            return risk_assessment
-            
-        except Exception as e:
-            logger.error(f"Error in tsunami risk assessment: {str(e)}")
-            return {
-                'tsunami_likely': False,
-                'risk_level': 'unknown',
-                'error': str(e),
-                'impact_location': {
-                    'latitude': impact_lat,
-                    'longitude': impact_lon,
-                    'elevation_m': None,
-                    'is_underwater': False
-                }
-            }
-    
-    def assess_tsunami_risk(self, impact_lat: float, impact_lon: float, 
-                           asteroid_diameter_m: float, search_radius_km: float = 200) -> Dict[str, Any]:
-        """
-        Assess tsunami risk based on impact location, elevation, and surrounding geography.
-        
-        Args:
-            impact_lat (float): Impact latitude
-            impact_lon (float): Impact longitude
-            asteroid_diameter_m (float): Asteroid diameter in meters
-            search_radius_km (float): Search radius for coastal analysis
-            
-        Returns:
-            dict: Tsunami risk assessment
-        """
-        try:
-            # Get impact point elevation
-            impact_elevation = self.get_elevation_single(impact_lat, impact_lon)
-            elevation_m = impact_elevation.get('elevation', self.fallback_elevation)
+                impact_elevation = self.get_elevation_single(impact_lat, impact_lon)
+                elevation_m = impact_elevation.get('elevation', self.fallback_elevation)
+                complete = impact_elevation.get('status') == 'success'
+            is_underwater = elevation_m is not None and elevation_m <= 0
             
             # Initialize risk assessment
             risk_assessment = {
@@ -393,7 +628,7 @@ class NASAAPIManager:
                     'latitude': impact_lat,
                     'longitude': impact_lon,
                     'elevation_m': elevation_m,
-                    'is_underwater': elevation_m <= 0
+                    'is_underwater': is_underwater
                 },
                 'coastal_analysis': {
                     'nearby_coastlines': [],
@@ -404,14 +639,15 @@ class NASAAPIManager:
             }
             
             # Check if impact is in water (elevation <= 0)
-            if elevation_m <= 0:
+            if is_underwater:
                 risk_assessment['risk_factors'].append('Impact location is underwater/at sea level')
                 risk_assessment['tsunami_likely'] = True
                 
                 # Analyze surrounding area for coastlines and populated areas
-                coastal_analysis = self._analyze_coastal_impact(
+                coastal_analysis, coastal_complete = self._analyze_coastal_impact(
                     impact_lat, impact_lon, asteroid_diameter_m, search_radius_km
                 )
+                complete = complete and coastal_complete
                 risk_assessment['coastal_analysis'] = coastal_analysis
                 
                 # Calculate risk level based on multiple factors
@@ -428,8 +664,6 @@ class NASAAPIManager:
                 
             else:
                 # Land impact - check if close to water bodies
-                distance_to_water = self._estimate_distance_to_water(impact_lat, impact_lon)
-                
                 if distance_to_water < 50:  # Within 50km of water
                     risk_assessment['risk_factors'].append(f'Impact within ~{distance_to_water}km of water body')
                     
@@ -440,6 +674,9 @@ class NASAAPIManager:
                 
                 risk_assessment['distance_to_water_km'] = distance_to_water
             
+            # Only cache assessments built from real elevation data
+            if complete:
+                self._result_cache_put(cache_key, risk_assessment)
             return risk_assessment
             
         except Exception as e:
@@ -458,88 +695,59 @@ class NASAAPIManager:
     
     def _get_tsunami_size_factor(self, diameter_m: float) -> Dict[str, Any]:
         """Get tsunami generation potential based on asteroid size."""
-        if diameter_m < 50:
-            return {'category': 'negligible', 'description': 'Too small to generate significant tsunamis'}
-        elif diameter_m < 200:
-            return {'category': 'minor', 'description': 'May cause local wave disturbances'}
-        elif diameter_m < 500:
-            return {'category': 'moderate', 'description': 'Can generate regional tsunamis'}
-        elif diameter_m < 1000:
-            return {'category': 'major', 'description': 'Can generate large regional tsunamis'}
-        else:
-            return {'category': 'catastrophic', 'description': 'Can generate ocean-wide mega-tsunamis'}
+        return _SIZE_FACTORS[bisect_right(_SIZE_THRESHOLDS_M, diameter_m)]
     
     def _analyze_coastal_impact(self, impact_lat: float, impact_lon: float, 
-                               diameter_m: float, search_radius_km: float) -> Dict[str, Any]:
-        """Analyze potential coastal impact areas."""
+                               diameter_m: float, search_radius_km: float) -> Tuple[Dict[str, Any], bool]:
+        """
+        Analyze potential coastal impact areas.
+        
+        Returns:
+            tuple: (coastal analysis, whether every sample elevation lookup succeeded)
+        """
         
         # Sample multiple points around the impact to find coastlines
         sample_points = self._generate_sample_points(impact_lat, impact_lon, search_radius_km)
+        total_points = len(sample_points)
         
-        coastlines = []
-        land_points = []
-        water_points = []
+        # One round-trip for all sample points instead of one request per point
+        elevations = self.get_elevation_batch([(lat, lon) for lat, lon in sample_points.tolist()])
+        elevs = np.asarray([data.get('elevation', 0) for data in elevations], dtype=np.float64)
         
-        for point in sample_points:
-            elevation_data = self.get_elevation_single(point['lat'], point['lon'])
-            elevation = elevation_data.get('elevation', 0)
-            
-            if elevation <= 0:
-                water_points.append({
-                    'lat': point['lat'],
-                    'lon': point['lon'],
-                    'elevation': elevation,
-                    'distance_km': point['distance_km']
-                })
-            else:
-                land_points.append({
-                    'lat': point['lat'],
-                    'lon': point['lon'], 
-                    'elevation': elevation,
-                    'distance_km': point['distance_km']
-                })
+        # Water (elevation <= 0) vs land split as one vectorized mask
+        water_mask = elevs <= 0
+        n_water = int(water_mask.sum())
+        
+        # Deepest water point, without copying out the water subset (0 when there is no water)
+        water_depth_m = abs(float(elevs.min(where=water_mask, initial=0.0)))
         
         # Estimate wave height based on asteroid size and water depth
-        estimated_wave_height = self._estimate_tsunami_wave_height(diameter_m, abs(min([p['elevation'] for p in water_points] + [0])))
+        estimated_wave_height = self._estimate_tsunami_wave_height(diameter_m, water_depth_m)
         
         # Identify potentially affected coastal regions
         affected_regions = self._identify_coastal_regions(impact_lat, impact_lon, search_radius_km)
         
+        complete = all(data.get('status') == 'success' for data in elevations)
+        
         return {
-            'total_sample_points': len(sample_points),
-            'water_points': len(water_points),
-            'land_points': len(land_points),
-            'water_to_land_ratio': len(water_points) / len(sample_points) if sample_points else 0,
+            'total_sample_points': total_points,
+            'water_points': n_water,
+            'land_points': total_points - n_water,
+            'water_to_land_ratio': n_water / total_points if total_points else 0,
             'max_wave_height_estimate_m': estimated_wave_height,
             'affected_regions': affected_regions,
             'search_radius_km': search_radius_km
-        }
+        }, complete
     
     def _generate_sample_points(self, center_lat: float, center_lon: float, 
-                               radius_km: float, num_points: int = 16) -> List[Dict[str, Any]]:
-        """Generate sample points in a circle around the impact location."""
-        import math
-        
-        points = []
-        for i in range(num_points):
-            # Generate points in a circle
-            angle = (2 * math.pi * i) / num_points
-            
-            # Convert km to degrees (approximate)
-            lat_offset = (radius_km / 111) * math.cos(angle)
-            lon_offset = (radius_km / 111) * math.sin(angle) / math.cos(math.radians(center_lat))
-            
-            point_lat = center_lat + lat_offset
-            point_lon = center_lon + lon_offset
-            
-            points.append({
-                'lat': point_lat,
-                'lon': point_lon,
-                'angle': angle,
-                'distance_km': radius_km
-            })
+                               radius_km: float, num_points: int = 16) -> np.ndarray:
+        """
+        Generate sample points in a circle around the impact location.
         
-        return points
+        Returns:
+            (num_points, 2) float64 array of latitude, longitude columns
+        """
+        return sample_ring(center_lat, center_lon, radius_km, num_points)[:, :2]
     
     def _estimate_tsunami_wave_height(self, diameter_m: float, water_depth_m: float) -> float:
         """Estimate tsunami wave height based on asteroid size and water depth."""
@@ -547,14 +755,7 @@ class NASAAPIManager:
         # Real calculations would be much more complex
         
         # Base energy factor from asteroid size
-        if diameter_m < 100:
-            energy_factor = 1
-        elif diameter_m < 500:
-            energy_factor = 5
-        elif diameter_m < 1000:
-            energy_factor = 20
-        else:
-            energy_factor = 50
+        energy_factor = _WAVE_ENERGY_FACTORS[bisect_right(_WAVE_ENERGY_THRESHOLDS_M, diameter_m)]
         
         # Water depth factor (shallower water = higher waves near shore)
         depth_factor = max(1, 100 / max(water_depth_m, 10))
@@ -573,63 +774,24 @@ class NASAAPIManager:
         regions = []
         
         # Major ocean/sea identification
-        if -180 <= impact_lon <= -30:  # Atlantic/Pacific Americas
-            if impact_lat > 0:
-                regions.extend(['North American Coast', 'European Coast'])
-            else:
-                regions.extend(['South American Coast', 'African Coast'])
-        elif -30 <= impact_lon <= 60:  # Atlantic/Indian Ocean
-            if impact_lat > 0:
-                regions.extend(['European Coast', 'Middle Eastern Coast'])
-            else:
-                regions.extend(['African Coast', 'Indian Ocean Islands'])
-        elif 60 <= impact_lon <= 180:  # Pacific/Indian Ocean
-            if impact_lat > 0:
-                regions.extend(['Asian Coast', 'Pacific Islands'])
-            else:
-                regions.extend(['Australian Coast', 'Pacific Islands'])
+        ocean = _first_box_hit(_OCEAN_REGION_BOXES, impact_lat, impact_lon)
+        if ocean >= 0:
+            regions.extend(_OCEAN_REGION_NAMES[ocean])
         
         # Add specific high-risk areas based on location
-        if 20 <= impact_lat <= 50 and 120 <= impact_lon <= 150:
-            regions.append('Japan Coast (High Risk)')
-        elif -10 <= impact_lat <= 10 and 90 <= impact_lon <= 120:
-            regions.append('Indonesia/Philippines (High Risk)')
-        elif 30 <= impact_lat <= 45 and -130 <= impact_lon <= -115:
-            regions.append('US West Coast (High Risk)')
+        high_risk = _first_box_hit(_HIGH_RISK_BOXES, impact_lat, impact_lon)
+        if high_risk >= 0:
+            regions.append(_HIGH_RISK_NAMES[high_risk])
         
         return regions[:5]  # Limit to top 5 regions
     
     def _calculate_tsunami_risk_level(self, diameter_m: float, elevation_m: float, 
                                     coastal_analysis: Dict[str, Any]) -> str:
         """Calculate overall tsunami risk level."""
-        risk_score = 0
-        
-        # Size factor
-        if diameter_m > 1000:
-            risk_score += 5
-        elif diameter_m > 500:
-            risk_score += 4
-        elif diameter_m > 200:
-            risk_score += 3
-        elif diameter_m > 100:
-            risk_score += 2
-        else:
-            risk_score += 1
-        
-        # Location factor
-        if elevation_m < -1000:  # Deep ocean
-            risk_score += 3
-        elif elevation_m < -100:  # Continental shelf
-            risk_score += 4
-        elif elevation_m <= 0:  # Shallow water/coastline
-            risk_score += 5
-        
-        # Coastal proximity factor
-        water_ratio = coastal_analysis.get('water_to_land_ratio', 0)
-        if water_ratio > 0.8:
-            risk_score += 2
-        elif water_ratio > 0.5:
-            risk_score += 1
+        # Size, location and coastal proximity factors
+        risk_score = tsunami_risk_score(
+            diameter_m, elevation_m, coastal_analysis.get('water_to_land_ratio', 0)
+        )
         
         # Convert score to risk level
         if risk_score >= 9:
@@ -675,17 +837,12 @@ class NASAAPIManager:
         # Real implementation would use detailed coastline databases
         
         # Major continental interior regions (rough estimates)
-        if (20 <= lat <= 50) and (-105 <= lon <= -95):  # Central US
-            return 800
-        elif (45 <= lat <= 65) and (30 <= lon <= 140):  # Central Asia
-            return 1000
-        elif (-30 <= lat <= 10) and (10 <= lon <= 30):  # Central Africa
-            return 500
-        elif (-40 <= lat <= -10) and (-70 <= lon <= -40):  # Central South America
-            return 600
-        else:
-            # Default assumption - most places are within 200km of water
-            return 100
+        interior = _first_box_hit(_INTERIOR_BOXES, lat, lon)
+        if interior >= 0:
+            return _INTERIOR_WATER_DISTANCE_KM[interior]
+        
+        # Default assumption - most places are within 200km of water
+        return 100
     
     def validate_coordinates(self, lat: float, lon: float) -> Dict[str, Any]:
         """
@@ -746,30 +903,13 @@ class NASAAPIManager:
     
     def _get_general_region(self, lat: float, lon: float) -> str:
         """Get general geographic region."""
-        if -90 <= lat <= -60:
-            return "Antarctica"
-        elif -60 <= lat <= -23.5:
-            return "Southern Temperate"
-        elif -23.5 <= lat <= 23.5:
-            return "Tropical"
-        elif 23.5 <= lat <= 60:
-            return "Northern Temperate"
-        elif 60 <= lat <= 90:
-            return "Arctic"
-        else:
+        if not -90 <= lat <= 90:
             return "Unknown"
+        return _REGION_NAMES[bisect_left(_REGION_LAT_BOUNDS, lat)]
     
     def _get_climate_zone(self, lat: float) -> str:
         """Get basic climate zone."""
-        abs_lat = abs(lat)
-        if abs_lat <= 23.5:
-            return "Tropical"
-        elif abs_lat <= 35:
-            return "Subtropical"
-        elif abs_lat <= 60:
-            return "Temperate"
-        else:
-            return "Polar"
+        return _CLIMATE_ZONES[bisect_left(_CLIMATE_ABS_LAT_BOUNDS, abs(lat))]
     
     def _estimate_ocean_proximity(self, lat: float, lon: float) -> str:
         """Rough estimate of ocean proximity."""
@@ -782,235 +922,6 @@ class NASAAPIManager:
         else:
             return "Coastal/Island"
     
-    def _get_tsunami_size_factor(self, diameter_m: float) -> Dict[str, Any]:
-        """Get tsunami generation potential based on asteroid size."""
-        if diameter_m < 50:
-            return {'category': 'negligible', 'description': 'Too small to generate significant tsunamis'}
-        elif diameter_m < 200:
-            return {'category': 'minor', 'description': 'May cause local wave disturbances'}
-        elif diameter_m < 500:
-            return {'category': 'moderate', 'description': 'Can generate regional tsunamis'}
-        elif diameter_m < 1000:
-            return {'category': 'major', 'description': 'Can generate large regional tsunamis'}
-        else:
-            return {'category': 'catastrophic', 'description': 'Can generate ocean-wide mega-tsunamis'}
-    
-    def _analyze_coastal_impact(self, impact_lat: float, impact_lon: float, 
-                               diameter_m: float, search_radius_km: float) -> Dict[str, Any]:
-        """Analyze potential coastal impact areas."""
-        
-        # Sample multiple points around the impact to find coastlines
-        sample_points = self._generate_sample_points(impact_lat, impact_lon, search_radius_km)
-        
-        coastlines = []
-        land_points = []
-        water_points = []
-        
-        for point in sample_points:
-            elevation_data = self.get_elevation_single(point['lat'], point['lon'])
-            elevation = elevation_data.get('elevation', 0)
-            
-            if elevation <= 0:
-                water_points.append({
-                    'lat': point['lat'],
-                    'lon': point['lon'],
-                    'elevation': elevation,
-                    'distance_km': point['distance_km']
-                })
-            else:
-                land_points.append({
-                    'lat': point['lat'],
-                    'lon': point['lon'], 
-                    'elevation': elevation,
-                    'distance_km': point['distance_km']
-                })
-        
-        # Estimate wave height based on asteroid size and water depth
-        estimated_wave_height = self._estimate_tsunami_wave_height(diameter_m, abs(min([p['elevation'] for p in water_points] + [0])))
-        
-        # Identify potentially affected coastal regions
-        affected_regions = self._identify_coastal_regions(impact_lat, impact_lon, search_radius_km)
-        
-        return {
-            'total_sample_points': len(sample_points),
-            'water_points': len(water_points),
-            'land_points': len(land_points),
-            'water_to_land_ratio': len(water_points) / len(sample_points) if sample_points else 0,
-            'max_wave_height_estimate_m': estimated_wave_height,
-            'affected_regions': affected_regions,
-            'search_radius_km': search_radius_km
-        }
-    
-    def _generate_sample_points(self, center_lat: float, center_lon: float, 
-                               radius_km: float, num_points: int = 16) -> List[Dict[str, Any]]:
-        """Generate sample points in a circle around the impact location."""
-        points = []
-        for i in range(num_points):
-            # Generate points in a circle
-            angle = (2 * math.pi * i) / num_points
-            
-            # Convert km to degrees (approximate)
-            lat_offset = (radius_km / 111) * math.cos(angle)
-            lon_offset = (radius_km / 111) * math.sin(angle) / math.cos(math.radians(center_lat))
-            
-            point_lat = center_lat + lat_offset
-            point_lon = center_lon + lon_offset
-            
-            points.append({
-                'lat': point_lat,
-                'lon': point_lon,
-                'angle': angle,
-                'distance_km': radius_km
-            })
-        
-        return points
-    
-    def _estimate_tsunami_wave_height(self, diameter_m: float, water_depth_m: float) -> float:
-        """Estimate tsunami wave height based on asteroid size and water depth."""
-        # Simplified tsunami wave height estimation
-        # Real calculations would be much more complex
-        
-        # Base energy factor from asteroid size
-        if diameter_m < 100:
-            energy_factor = 1
-        elif diameter_m < 500:
-            energy_factor = 5
-        elif diameter_m < 1000:
-            energy_factor = 20
-        else:
-            energy_factor = 50
-        
-        # Water depth factor (shallower water = higher waves near shore)
-        depth_factor = max(1, 100 / max(water_depth_m, 10))
-        
-        # Estimate wave height
-        estimated_height = energy_factor * depth_factor * 0.1
-        
-        return min(estimated_height, 100)  # Cap at reasonable maximum
-    
-    def _identify_coastal_regions(self, impact_lat: float, impact_lon: float, 
-                                 radius_km: float) -> List[str]:
-        """Identify major coastal regions that could be affected."""
-        # Simplified regional identification based on coordinates
-        # Real implementation would use detailed geographic databases
-        
-        regions = []
-        
-        # Major ocean/sea identification
-        if -180 <= impact_lon <= -30:  # Atlantic/Pacific Americas
-            if impact_lat > 0:
-                regions.extend(['North American Coast', 'European Coast'])
-            else:
-                regions.extend(['South American Coast', 'African Coast'])
-        elif -30 <= impact_lon <= 60:  # Atlantic/Indian Ocean
-            if impact_lat > 0:
-                regions.extend(['European Coast', 'Middle Eastern Coast'])
-            else:
-                regions.extend(['African Coast', 'Indian Ocean Islands'])
-        elif 60 <= impact_lon <= 180:  # Pacific/Indian Ocean
-            if impact_lat > 0:
-                regions.extend(['Asian Coast', 'Pacific Islands'])
-            else:
-                regions.extend(['Australian Coast', 'Pacific Islands'])
-        
-        # Add specific high-risk areas based on location
-        if 20 <= impact_lat <= 50 and 120 <= impact_lon <= 150:
-            regions.append('Japan Coast (High Risk)')
-        elif -10 <= impact_lat <= 10 and 90 <= impact_lon <= 120:
-            regions.append('Indonesia/Philippines (High Risk)')
-        elif 30 <= impact_lat <= 45 and -130 <= impact_lon <= -115:
-            regions.append('US West Coast (High Risk)')
-        
-        return regions[:5]  # Limit to top 5 regions
-    
-    def _calculate_tsunami_risk_level(self, diameter_m: float, elevation_m: float, 
-                                    coastal_analysis: Dict[str, Any]) -> str:
-        """Calculate overall tsunami risk level."""
-        risk_score = 0
-        
-        # Size factor
-        if diameter_m > 1000:
-            risk_score += 5
-        elif diameter_m > 500:
-            risk_score += 4
-        elif diameter_m > 200:
-            risk_score += 3
-        elif diameter_m > 100:
-            risk_score += 2
-        else:
-            risk_score += 1
-        
-        # Location factor
-        if elevation_m < -1000:  # Deep ocean
-            risk_score += 3
-        elif elevation_m < -100:  # Continental shelf
-            risk_score += 4
-        elif elevation_m <= 0:  # Shallow water/coastline
-            risk_score += 5
-        
-        # Coastal proximity factor
-        water_ratio = coastal_analysis.get('water_to_land_ratio', 0)
-        if water_ratio > 0.8:
-            risk_score += 2
-        elif water_ratio > 0.5:
-            risk_score += 1
-        
-        # Convert score to risk level
-        if risk_score >= 9:
-            return 'extreme'
-        elif risk_score >= 7:
-            return 'high'
-        elif risk_score >= 5:
-            return 'moderate'
-        elif risk_score >= 3:
-            return 'low'
-        else:
-            return 'minimal'
-    
-    def _generate_tsunami_warnings(self, risk_level: str, diameter_m: float, 
-                                  coastal_analysis: Dict[str, Any]) -> List[str]:
-        """Generate tsunami warnings and recommendations."""
-        warnings = []
-        
-        if risk_level in ['extreme', 'high']:
-            warnings.append('⚠️ EXTREME TSUNAMI RISK: Immediate evacuation of all coastal areas required')
-            warnings.append(f'🌊 Estimated wave heights up to {coastal_analysis.get("max_wave_height_estimate_m", 0):.1f}m')
-            warnings.append('📍 Evacuate areas within 10km of coastline to elevations above 30m')
-            
-        elif risk_level == 'moderate':
-            warnings.append('⚠️ MODERATE TSUNAMI RISK: Coastal areas should prepare for evacuation')
-            warnings.append(f'🌊 Estimated wave heights up to {coastal_analysis.get("max_wave_height_estimate_m", 0):.1f}m')
-            warnings.append('📍 Evacuate low-lying coastal areas to higher ground')
-            
-        elif risk_level == 'low':
-            warnings.append('⚠️ LOW TSUNAMI RISK: Monitor coastal areas for unusual wave activity')
-            warnings.append('📍 Be prepared to move away from immediate shoreline')
-        
-        # Add region-specific warnings
-        affected_regions = coastal_analysis.get('affected_regions', [])
-        if affected_regions:
-            warnings.append(f'🗺️ Potentially affected regions: {", ".join(affected_regions)}')
-        
-        return warnings
-    
-    def _estimate_distance_to_water(self, lat: float, lon: float) -> float:
-        """Estimate approximate distance to nearest water body."""
-        # Very simplified estimation based on known geographic features
-        # Real implementation would use detailed coastline databases
-        
-        # Major continental interior regions (rough estimates)
-        if (20 <= lat <= 50) and (-105 <= lon <= -95):  # Central US
-            return 800
-        elif (45 <= lat <= 65) and (30 <= lon <= 140):  # Central Asia
-            return 1000
-        elif (-30 <= lat <= 10) and (10 <= lon <= 30):  # Central Africa
-            return 500
-        elif (-40 <= lat <= -10) and (-70 <= lon <= -40):  # Central South America
-            return 600
-        else:
-            # Default assumption - most places are within 200km of water
-            return 100
-    
     def get_historical_earthquakes(self) -> Dict[str, float]:
         """
         Get historical earthquake data from USGS API with fallback to static data.
@@ -1018,6 +929,10 @@ class NASAAPIManager:
         Returns:
             dict: Historical earthquake magnitudes for comparison
         """
+        cached = self._historical_earthquakes
+        if cached is not None and cached[0] > time.monotonic():
+            return dict(cached[1])
+        
         try:
             # Try to fetch recent significant earthquakes from USGS
             end_time = datetime.utcnow()
@@ -1032,7 +947,7 @@ class NASAAPIManager:
                 'limit': 20
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.apis['earthquake']['base_url'],
                 params=params,
                 timeout=self.apis['earthquake']['timeout']
@@ -1070,21 +985,17 @@ class NASAAPIManager:
                         
                         earthquakes[name] = magnitude
                 
-                # Add some well-known historical earthquakes if we have room
-                well_known = {
-                    '2011 Japan': 9.1,
-                    '2004 Sumatra': 9.1,
-                    '1960 Chile': 9.5,
-                    '1964 Alaska': 9.2
-                }
-                
-                # Merge with API data, preferring API data
-                for name, mag in well_known.items():
+                # Merge well-known historical earthquakes with API data if we have room,
+                # preferring API data
+                for name, mag in _WELL_KNOWN_EARTHQUAKES:
                     if len(earthquakes) < 8:  # Keep reasonable number for comparison
                         earthquakes[name] = mag
                 
                 if earthquakes:
                     logger.info(f"Successfully fetched {len(earthquakes)} earthquakes from USGS API")
+                    self._historical_earthquakes = (
+                        time.monotonic() + HISTORICAL_EARTHQUAKES_TTL_SECONDS, dict(earthquakes)
+                    )
                     return earthquakes
             
             # If API fails, log and fall through to static data
@@ -1095,11 +1006,4 @@ class NASAAPIManager:
         
         # Fallback to static historical data
         logger.info("Using fallback static earthquake data")
-        return {
-            '2011 Japan': 9.1,
-            '2004 Sumatra': 9.1,
-            '1906 San Francisco': 7.9,
-            '2010 Haiti': 7.0,
-            '1994 Northridge': 6.7,
-            '1960 Chile': 9.5
-        }
\ No newline at end of file
+        return dict(_FALLBACK_EARTHQUAKES)
\ No newline at end of file
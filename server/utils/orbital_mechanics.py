@@ -5,25 +5,14 @@ Implements proper orbital mechanics for asteroid trajectory and position predict
 
 import math
 import logging
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Tuple
 
-# Conditional numpy import for Railway deployment
-try:
-    import numpy as np
-except ImportError:
-    # Fallback for when numpy is not available
-    class MockNumpy:
-        def array(self, data):
-            return data
-        def linalg(self):
-            return self
-        def norm(self, data):
-            # Simple 3D distance calculation
-            if len(data) == 3:
-                return (data[0]**2 + data[1]**2 + data[2]**2)**0.5
-            return sum(x**2 for x in data)**0.5
-    np = MockNumpy()
+import numpy as np
+
+from utils._orbital_kernels import rotation_coefficients, solve_kepler
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +22,57 @@ AU = 149597870.7  # km
 GM_SUN = 1.32712440018e11  # km³/s²
 CLOSE_APPROACH_THRESHOLD = 100_000  # 100,000 km - reasonable for "close approach"
 
+# Impact risk categories by diameter (km): level i covers [bounds[i-1], bounds[i])
+_RISK_DIAMETER_BOUNDS_KM = (0.01, 0.1, 1, 10)
+_RISK_LEVELS = ("Minimal Risk", "Local Damage", "Local Catastrophe",
+                "Regional Devastation", "Global Catastrophe")
+_RISK_EFFECTS = ("Likely burns up in atmosphere", "Building-scale damage",
+                 "City-scale destruction", "Continental damage, climate effects",
+                 "Mass extinction event, global winter")
+
+# J2000 reference epoch
+J2000 = datetime(2000, 1, 1, 12, 0, 0)
+J2000_JD = 2451545.0
+
+
+def _julian_date(date: datetime) -> float:
+    """Julian date of a naive datetime."""
+    return J2000_JD + (date - J2000).total_seconds() / 86400.0
+
+
+@lru_cache(maxsize=256)
+def _rotation_for(Omega: float, omega: float, i: float) -> Tuple[float, ...]:
+    """Rotation coefficients for an orbit, reused across every position along it."""
+    return rotation_coefficients(Omega, omega, i)
+
+
+def _solve_kepler_vector(M, e: float, tolerance: float = 1e-6):
+    """
+    Solve Kepler's equation for an array of mean anomalies with Newton-Raphson.
+    
+    Each element follows the same steps as _solve_kepler_equation: it stops once its
+    own update is below the tolerance (or the derivative vanishes), so the results match
+    the scalar solver point for point.
+    """
+    E = np.array(M, dtype=np.float64)  # Initial guess
+    active = np.arange(E.shape[0])
+    for _ in range(50):  # Max iterations
+        if active.size == 0:
+            break
+        E_active = E[active]
+        f = E_active - e * np.sin(E_active) - M[active]
+        f_prime = 1 - e * np.cos(E_active)
+        
+        # Avoid division by zero - those points keep their current estimate
+        keep = np.abs(f_prime) >= 1e-12
+        active, E_active, f, f_prime = active[keep], E_active[keep], f[keep], f_prime[keep]
+        
+        E_new = E_active - f / f_prime
+        E[active] = E_new
+        active = active[np.abs(E_new - E_active) >= tolerance]
+    
+    return E
+
 class RealisticOrbitalMechanics:
     """Real Keplerian orbital mechanics - no shortcuts"""
     
@@ -44,84 +84,107 @@ class RealisticOrbitalMechanics:
     def calculate_position(self, orbital_elements: Dict, target_date: datetime) -> Dict:
         """Calculate asteroid position using proper Keplerian mechanics"""
         try:
-            # Extract elements
-            a = orbital_elements['semi_major_axis'] * self.AU  # Convert to km
-            e = orbital_elements['eccentricity']
-            i = math.radians(orbital_elements['inclination'])
-            Omega = math.radians(orbital_elements['ascending_node'])
-            omega = math.radians(orbital_elements['argument_perihelion'])
-            M0 = math.radians(orbital_elements['mean_anomaly'])
-            epoch = orbital_elements.get('epoch', 2451545.0)
-            
-            # Time since epoch
-            j2000 = datetime(2000, 1, 1, 12, 0, 0)
-            current_jd = 2451545.0 + (target_date - j2000).total_seconds() / 86400.0
-            dt_days = current_jd - epoch
-            
-            # Mean motion
-            n = math.sqrt(self.GM_SUN / a**3)  # rad/s
-            n_per_day = n * 86400  # rad/day
-            
-            # Current mean anomaly
-            M = M0 + n_per_day * dt_days
-            M = M % (2 * math.pi)
-            
-            # Solve Kepler's equation
-            E = self._solve_kepler_equation(M, e)
-            
-            # True anomaly
-            nu = 2.0 * math.atan2(
-                math.sqrt(1 + e) * math.sin(E / 2),
-                math.sqrt(1 - e) * math.cos(E / 2)
-            )
-            
-            # Distance
-            r = a * (1 - e * math.cos(E))
-            
-            # Position in orbital plane
-            x_orb = r * math.cos(nu)
-            y_orb = r * math.sin(nu)
-            z_orb = 0.0
-            
-            # Transform to heliocentric coordinates
-            cos_Omega, sin_Omega = math.cos(Omega), math.sin(Omega)
-            cos_i, sin_i = math.cos(i), math.sin(i)
-            cos_omega, sin_omega = math.cos(omega), math.sin(omega)
-            
-            # Rotation matrices
-            x = (cos_Omega * cos_omega - sin_Omega * sin_omega * cos_i) * x_orb + \
-                (-cos_Omega * sin_omega - sin_Omega * cos_omega * cos_i) * y_orb
-            
-            y = (sin_Omega * cos_omega + cos_Omega * sin_omega * cos_i) * x_orb + \
-                (-sin_Omega * sin_omega + cos_Omega * cos_omega * cos_i) * y_orb
-            
-            z = (sin_omega * sin_i) * x_orb + (cos_omega * sin_i) * y_orb
-            
-            # Velocity (simplified)
-            v_mag = math.sqrt(self.GM_SUN * (2/r - 1/a)) / 1000  # km/s
-            v_x = -y/r * v_mag
-            v_y = x/r * v_mag
-            v_z = 0.0
+            current_jd = _julian_date(target_date)
+        except Exception as e:
+            logger.error(f"Error calculating asteroid position: {str(e)}")
+            return {'success': False, 'error': str(e)}
+        return self.calculate_position_jd(orbital_elements, current_jd)
+    
+    def calculate_position_jd(self, orbital_elements: Dict, current_jd: float) -> Dict:
+        """Calculate asteroid position at a Julian date (calculate_position without the datetime math)"""
+        try:
+            state = self.calculate_positions(orbital_elements, [current_jd])
             
             return {
                 'success': True,
-                'position_km': [x, y, z],
-                'velocity_km_s': [v_x, v_y, v_z],
-                'distance_au': r / self.AU,
-                'true_anomaly_deg': math.degrees(nu),
-                'eccentric_anomaly_deg': math.degrees(E),
-                'mean_anomaly_deg': math.degrees(M)
+                'position_km': state['position_km'][0].tolist(),
+                'velocity_km_s': state['velocity_km_s'][0].tolist(),
+                'distance_au': float(state['distance_au'][0]),
+                'true_anomaly_deg': float(state['true_anomaly_deg'][0]),
+                'eccentric_anomaly_deg': float(state['eccentric_anomaly_deg'][0]),
+                'mean_anomaly_deg': float(state['mean_anomaly_deg'][0])
             }
             
         except Exception as e:
             logger.error(f"Error calculating asteroid position: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    def calculate_positions(self, orbital_elements: Dict, jds) -> Dict:
+        """
+        Calculate asteroid positions at many times at once (vectorized calculate_position).
+        
+        Args:
+            orbital_elements (dict): Keplerian elements as used by calculate_position
+            jds (np.ndarray): Julian dates
+            
+        Returns:
+            dict: (N, 3) position_km and velocity_km_s arrays plus per-point distance_au
+                  and true/eccentric/mean anomaly arrays in degrees
+        """
+        a = orbital_elements['semi_major_axis'] * self.AU  # Convert to km
+        e = orbital_elements['eccentricity']
+        i = math.radians(orbital_elements['inclination'])
+        Omega = math.radians(orbital_elements['ascending_node'])
+        omega = math.radians(orbital_elements['argument_perihelion'])
+        M0 = math.radians(orbital_elements['mean_anomaly'])
+        epoch = orbital_elements.get('epoch', 2451545.0)
+        
+        # Mean motion
+        n_per_day = math.sqrt(self.GM_SUN / a**3) * 86400  # rad/day
+        
+        # Mean anomaly at every time, then Kepler's equation for all of them
+        M = (M0 + n_per_day * (np.asarray(jds, dtype=np.float64) - epoch)) % (2 * math.pi)
+        E = _solve_kepler_vector(M, e)
+        
+        # True anomaly and distance
+        nu = 2.0 * np.arctan2(math.sqrt(1 + e) * np.sin(E / 2), math.sqrt(1 - e) * np.cos(E / 2))
+        r = a * (1 - e * np.cos(E))
+        
+        # Position in orbital plane
+        x_orb = r * np.cos(nu)
+        y_orb = r * np.sin(nu)
+        
+        # Transform to heliocentric coordinates
+        p11, p12, p21, p22, p31, p32 = _rotation_for(Omega, omega, i)
+        position = np.empty((M.shape[0], 3))
+        position[:, 0] = p11 * x_orb + p12 * y_orb
+        position[:, 1] = p21 * x_orb + p22 * y_orb
+        position[:, 2] = p31 * x_orb + p32 * y_orb
+        
+        # Velocity: orbital-plane derivative of the position, through the same rotation
+        v_scale = math.sqrt(self.GM_SUN * a) / r  # km/s
+        vx_orb = -v_scale * np.sin(E)
+        vy_orb = v_scale * math.sqrt(1 - e * e) * np.cos(E)
+        velocity = np.empty_like(position)
+        velocity[:, 0] = p11 * vx_orb + p12 * vy_orb
+        velocity[:, 1] = p21 * vx_orb + p22 * vy_orb
+        velocity[:, 2] = p31 * vx_orb + p32 * vy_orb
+        
+        return {
+            'position_km': position,
+            'velocity_km_s': velocity,
+            'distance_au': r / self.AU,
+            'true_anomaly_deg': np.degrees(nu),
+            'eccentric_anomaly_deg': np.degrees(E),
+            'mean_anomaly_deg': np.degrees(M)
+        }
+    
+    def calculate_earth_positions(self, jds) -> np.ndarray:
+        """Earth positions (km) at many Julian dates as an (N, 3) array (simplified circular orbit)"""
+        days = np.asarray(jds, dtype=np.float64) - J2000_JD
+        
+        # Earth's mean longitude
+        L_rad = np.radians((100.464 + 0.9856076686 * days) % 360.0)
+        
+        position = np.zeros((days.shape[0], 3))
+        position[:, 0] = self.AU * np.cos(L_rad)
+        position[:, 1] = self.AU * np.sin(L_rad)
+        return position
+    
     def calculate_earth_position(self, target_date: datetime) -> Dict:
         """Calculate Earth position (simplified circular orbit)"""
         try:
-            j2000 = datetime(2000, 1, 1, 12, 0, 0)
-            days = (target_date - j2000).total_seconds() / 86400.0
+            days = (target_date - J2000).total_seconds() / 86400.0
             
             # Earth's mean longitude
             L = 100.464 + 0.9856076686 * days
@@ -154,40 +217,53 @@ class RealisticOrbitalMechanics:
             start_date = datetime.now()
             time_step = days / points
             
+            # Solve every trajectory point in one vectorized pass over evenly spaced Julian dates
+            jds = _julian_date(start_date) + np.arange(max(points, 0)) * time_step
+            try:
+                ast_states = self.calculate_positions(orbital_elements, jds)
+            except Exception as e:
+                # Invalid elements fail every point alike, leaving an empty trajectory
+                logger.error(f"Error calculating asteroid position: {str(e)}")
+                ast_states = None
+            
             trajectory_points = []
             closest_approach = {'distance': float('inf'), 'date': None, 'index': None}
             
-            for i in range(points):
-                check_date = start_date + timedelta(days=i * time_step)
+            if ast_states is not None and jds.size:
+                earth_positions = self.calculate_earth_positions(jds)
                 
-                # Calculate positions
-                ast_state = self.calculate_position(orbital_elements, check_date)
-                earth_state = self.calculate_earth_position(check_date)
+                # Distance from Earth at every point
+                diffs = ast_states['position_km'] - earth_positions
+                distances_km = np.sqrt((diffs * diffs).sum(axis=1))
                 
-                if ast_state.get('success') and earth_state.get('success'):
-                    # Calculate distance from Earth
-                    ast_pos = np.array(ast_state['position_km'])
-                    earth_pos = np.array(earth_state['position_km'])
-                    distance_km = np.linalg.norm(ast_pos - earth_pos)
-                    
-                    # Track closest approach
-                    if distance_km < closest_approach['distance']:
-                        closest_approach = {
-                            'distance': distance_km,
-                            'date': check_date,
-                            'index': i
-                        }
-                    
-                    trajectory_points.append({
-                        'date': check_date.isoformat(),
-                        'asteroid_position_km': ast_state['position_km'],
-                        'asteroid_velocity_km_s': ast_state['velocity_km_s'],
-                        'earth_position_km': earth_state['position_km'],
+                # Calendar dates are only needed for the output
+                trajectory_points = [
+                    {
+                        'date': (start_date + timedelta(days=index * time_step)).isoformat(),
+                        'asteroid_position_km': ast_position,
+                        'asteroid_velocity_km_s': ast_velocity,
+                        'earth_position_km': earth_position,
                         'distance_from_earth_km': distance_km,
                         'distance_from_earth_au': distance_km / self.AU,
                         'distance_from_earth_radii': distance_km / self.EARTH_RADIUS,
-                        'true_anomaly_deg': ast_state['true_anomaly_deg']
-                    })
+                        'true_anomaly_deg': true_anomaly
+                    }
+                    for index, (ast_position, ast_velocity, earth_position, distance_km, true_anomaly) in enumerate(zip(
+                        ast_states['position_km'].tolist(),
+                        ast_states['velocity_km_s'].tolist(),
+                        earth_positions.tolist(),
+                        distances_km.tolist(),
+                        ast_states['true_anomaly_deg'].tolist()
+                    ))
+                ]
+                
+                # Track closest approach
+                index = int(np.argmin(distances_km))
+                closest_approach = {
+                    'distance': float(distances_km[index]),
+                    'date': start_date + timedelta(days=index * time_step),
+                    'index': index
+                }
             
             return {
                 'success': True,
@@ -241,21 +317,9 @@ class RealisticOrbitalMechanics:
             kinetic_energy_mt = kinetic_energy_j / (4.184e15)  # Convert to megatons TNT
             
             # Determine risk category
-            if diameter_km >= 10:
-                risk_level = "Global Catastrophe"
-                effects = "Mass extinction event, global winter"
-            elif diameter_km >= 1:
-                risk_level = "Regional Devastation"
-                effects = "Continental damage, climate effects"
-            elif diameter_km >= 0.1:
-                risk_level = "Local Catastrophe"
-                effects = "City-scale destruction"
-            elif diameter_km >= 0.01:
-                risk_level = "Local Damage"
-                effects = "Building-scale damage"
-            else:
-                risk_level = "Minimal Risk"
-                effects = "Likely burns up in atmosphere"
+            level = bisect_right(_RISK_DIAMETER_BOUNDS_KM, diameter_km)
+            risk_level = _RISK_LEVELS[level]
+            effects = _RISK_EFFECTS[level]
             
             return {
                 'success': True,
@@ -279,44 +343,58 @@ class RealisticOrbitalMechanics:
             logger.error(f"Error assessing impact risk: {str(e)}")
             return {'success': False, 'error': str(e)}
     
-    def _solve_kepler_equation(self, M: float, e: float, tolerance: float = 1e-6) -> float:
-        """Solve Kepler's equation using Newton-Raphson method"""
-        E = M  # Initial guess
-        for _ in range(50):  # Max iterations
-            f = E - e * math.sin(E) - M
-            f_prime = 1 - e * math.cos(E)
-            if abs(f_prime) < 1e-12:  # Avoid division by zero
-                break
-            E_new = E - f / f_prime
-            
-            if abs(E_new - E) < tolerance:
-                return E_new
-            E = E_new
+    def assess_impact_risk_batch(self, semi_major_axis_au, eccentricity, diameter_km) -> Dict:
+        """
+        Vectorized assess_impact_risk over arrays of orbits and diameters.
         
-        return E  # Return best approximation
-    
-    def _orbital_to_ecliptic(self, x_orb: float, y_orb: float, z_orb: float,
-                           omega: float, i: float, w: float) -> Tuple[float, float, float]:
-        """Transform from orbital plane to ecliptic coordinates"""
-        # Rotation matrices for orbital element transformation
-        cos_omega = math.cos(omega)
-        sin_omega = math.sin(omega)
-        cos_i = math.cos(i)
-        sin_i = math.sin(i)
-        cos_w = math.cos(w)
-        sin_w = math.sin(w)
+        Useful for sweep studies (e.g. risk over a grid of diameters) where calling
+        assess_impact_risk per asteroid would dominate the run time.
+        
+        Args:
+            semi_major_axis_au: Semi-major axes in AU (array-like)
+            eccentricity: Eccentricities (array-like, broadcastable)
+            diameter_km: Diameters in km (array-like, broadcastable)
+            
+        Returns:
+            dict: Same quantities as assess_impact_risk with arrays in place of scalars;
+                  'risk_index' indexes the shared risk level/effects tables
+        """
+        a, e, diameter = np.broadcast_arrays(
+            np.asarray(semi_major_axis_au, dtype=np.float64),
+            np.asarray(eccentricity, dtype=np.float64),
+            np.asarray(diameter_km, dtype=np.float64)
+        )
         
-        # Combined transformation matrix elements
-        p11 = cos_omega * cos_w - sin_omega * sin_w * cos_i
-        p12 = -cos_omega * sin_w - sin_omega * cos_w * cos_i
-        p21 = sin_omega * cos_w + cos_omega * sin_w * cos_i
-        p22 = -sin_omega * sin_w + cos_omega * cos_w * cos_i
-        p31 = sin_w * sin_i
-        p32 = cos_w * sin_i
+        perihelion = a * (1 - e)
+        aphelion = a * (1 + e)
         
-        # Transform coordinates
-        x_ecl = p11 * x_orb + p12 * y_orb
-        y_ecl = p21 * x_orb + p22 * y_orb
-        z_ecl = p31 * x_orb + p32 * y_orb
+        # Same mass/energy model as assess_impact_risk: 2500 kg/m³ at 20 km/s
+        impact_velocity_ms = 20000
+        mass_kg = (4/3) * math.pi * (diameter * 500) ** 3 * 2500
+        kinetic_energy_mt = 0.5 * mass_kg * impact_velocity_ms ** 2 / 4.184e15
         
-        return x_ecl, y_ecl, z_ecl
\ No newline at end of file
+        risk_index = np.searchsorted(_RISK_DIAMETER_BOUNDS_KM, diameter, side='right')
+        
+        return {
+            'success': True,
+            'crosses_earth_orbit': (perihelion < 1.0) & (aphelion > 1.0),
+            'minimum_distance_au': np.where(perihelion > 1.0, np.abs(1.0 - perihelion),
+                                            np.abs(aphelion - 1.0)),
+            'diameter_km': diameter,
+            'estimated_mass_kg': mass_kg,
+            'impact_velocity_km_s': impact_velocity_ms / 1000,
+            'kinetic_energy_megatons': kinetic_energy_mt,
+            'risk_index': risk_index,
+            'risk_level': np.asarray(_RISK_LEVELS)[risk_index],
+            'potential_effects': np.asarray(_RISK_EFFECTS)[risk_index],
+            'orbital_info': {
+                'semi_major_axis_au': a,
+                'eccentricity': e,
+                'perihelion_au': perihelion,
+                'aphelion_au': aphelion
+            }
+        }
+    
+    def _solve_kepler_equation(self, M: float, e: float, tolerance: float = 1e-6) -> float:
+        """Solve Kepler's equation using Newton-Raphson method"""
+        return solve_kepler(M, e, tolerance)
@@ -0,0 +1,113 @@
+"""
+📋 Request Schemas
+NASA Space Apps 2024
+
+Typed request payloads for the scenario and tsunami endpoints.
+Each schema parses a decoded JSON body once, converts values to their final
+types and raises SchemaError with a client-facing message when it is invalid.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+
+class SchemaError(ValueError):
+    """Raised when a request payload does not match its schema."""
+
+
+@dataclass(frozen=True)
+class TsunamiAssessRequest:
+    """Body of POST /api/tsunami/assess (and each point of /assess-batch)."""
+
+    latitude: float
+    longitude: float
+    diameter_m: float
+    search_radius_km: float = 1000.0
+
+    REQUIRED_FIELDS = ('latitude', 'longitude', 'diameter_m')
+
+    def __post_init__(self):
+        if not (-90 <= self.latitude <= 90):
+            raise SchemaError('Latitude must be between -90 and 90 degrees')
+        if not (-180 <= self.longitude <= 180):
+            raise SchemaError('Longitude must be between -180 and 180 degrees')
+        if not self.diameter_m > 0:
+            raise SchemaError('Asteroid diameter must be positive')
+        if not (0 < self.search_radius_km <= 5000):
+            raise SchemaError('Search radius must be between 0 and 5000 km')
+
+    @classmethod
+    def parse_fields(cls, data: Any) -> Tuple[float, float, float, float]:
+        """
+        Check presence and types of the payload fields without range checks.
+
+        Args:
+            data: Decoded JSON payload
+
+        Returns:
+            tuple: (latitude, longitude, diameter_m, search_radius_km)
+        """
+        if not isinstance(data, dict):
+            raise SchemaError('Point must be an object')
+
+        missing_fields = [field for field in cls.REQUIRED_FIELDS if field not in data]
+        if missing_fields:
+            raise SchemaError(f'Missing required fields: {", ".join(missing_fields)}')
+
+        try:
+            return (
+                float(data['latitude']),
+                float(data['longitude']),
+                float(data['diameter_m']),
+                float(data.get('search_radius_km', 1000))
+            )
+        except (TypeError, ValueError) as e:
+            raise SchemaError(f'Invalid parameter values: {str(e)}')
+
+    @classmethod
+    def from_json(cls, data: Any) -> 'TsunamiAssessRequest':
+        """Parse and fully validate a single assessment payload."""
+        if not data:
+            raise SchemaError('Request body is required')
+        return cls(*cls.parse_fields(data))
+
+
+@dataclass(frozen=True)
+class CompareScenariosRequest:
+    """Body of POST /api/scenarios/compare."""
+
+    scenario_names: List[str]
+
+    @classmethod
+    def from_json(cls, data: Any) -> 'CompareScenariosRequest':
+        """Parse a scenario comparison payload."""
+        if not isinstance(data, dict) or 'scenario_names' not in data:
+            raise SchemaError('Missing required parameter: scenario_names')
+
+        scenario_names = data['scenario_names']
+        if not isinstance(scenario_names, list) or len(scenario_names) < 2:
+            raise SchemaError('scenario_names must be a list with at least 2 scenarios')
+
+        return cls(scenario_names)
+
+
+@dataclass(frozen=True)
+class SearchScenariosRequest:
+    """Body of POST /api/scenarios/search."""
+
+    query: str
+
+    @classmethod
+    def from_json(cls, data: Any) -> 'SearchScenariosRequest':
+        """Parse a scenario search payload, stripping the query."""
+        if not isinstance(data, dict) or 'query' not in data:
+            raise SchemaError('Missing required parameter: query')
+
+        if not isinstance(data['query'], str):
+            raise SchemaError('Query must be a string')
+
+        query = data['query'].strip()
+        if not query:
+            raise SchemaError('Query cannot be empty')
+
+        return cls(query)
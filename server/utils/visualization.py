@@ -7,29 +7,65 @@ Includes shake map generation, impact zone visualization, and chart data prepara
 """
 
 import json
-import base64
 import io
 import math
+import threading
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for server environment
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from models.asteroid_impact import AsteroidImpact
 
+# SIMD base64 encoder for chart images when available, stdlib otherwise
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# pyplot, imported and styled on the first rendered chart so JSON-only workers skip it
+_plt = None
+_plt_lock = threading.Lock()
+
+
+def _pyplot():
+    """Import matplotlib's pyplot with the server backend and chart style, once."""
+    global _plt
+    if _plt is None:
+        with _plt_lock:
+            if _plt is None:
+                import matplotlib
+                matplotlib.use('Agg')  # Use non-interactive backend for server environment
+                import matplotlib.pyplot as plt
+                import seaborn as sns
+                
+                # Set matplotlib style
+                plt.style.use('default')
+                sns.set_palette("husl")
+                plt.rcParams['figure.figsize'] = (12, 8)
+                plt.rcParams['font.size'] = 10
+                _plt = plt
+    return _plt
+
 
 class VisualizationManager:
     """Manager for creating visualizations and maps for asteroid impacts."""
     
+    # Shake map crater popup: diameter (km), depth (m)
+    _CRATER_POPUP = "🕳️ Crater<br>Diameter: {:.2f} km<br>Depth: {:.0f} m"
+    
+    # Shake map blast zones: (range key, zone type, color key, fill opacity, line weight, popup)
+    _BLAST_ZONE_SPEC = (
+        ('20_psi_km', 'severe_damage', 'severe', 0.3, 2,
+         "💥 Severe Destruction Zone<br>20 psi overpressure<br>Radius: {:.1f} km"),
+        ('5_psi_km', 'heavy_damage', 'heavy', 0.2, 2,
+         "🏢 Heavy Damage Zone<br>5 psi overpressure<br>Radius: {:.1f} km"),
+        ('1_psi_km', 'light_damage', 'light', 0.1, 2,
+         "🪟 Light Damage Zone<br>1 psi overpressure<br>Radius: {:.1f} km"),
+        ('thermal_3rd_degree_km', 'thermal', 'thermal', 0.1, 1,
+         "🔥 Thermal Radiation Zone<br>3rd degree burns<br>Radius: {:.1f} km")
+    )
+    
     def __init__(self, nasa_api_manager=None):
-        """Initialize visualization settings."""
-        # Set matplotlib style
-        plt.style.use('default')
-        sns.set_palette("husl")
-        plt.rcParams['figure.figsize'] = (12, 8)
-        plt.rcParams['font.size'] = 10
-        
+        """Initialize visualization settings (matplotlib is set up on the first chart)."""
         # Define colors for different zones
         self.zone_colors = {
             'crater': '#8B0000',           # Dark red for crater
@@ -41,6 +77,29 @@ class VisualizationManager:
         
         # Store reference to NASA API manager for earthquake data
         self.nasa_api_manager = nasa_api_manager
+        
+        # Per-thread 2x2 figure reused by generate_matplotlib_chart
+        self._fig_pool = threading.local()
+    
+    def _comprehensive_figure(self):
+        """This thread's 2x2 chart figure, created on first use and cleared for reuse after."""
+        plt = _pyplot()
+        fig = getattr(self._fig_pool, 'fig', None)
+        if fig is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            # Built outside pyplot's figure manager so it is freed with its thread
+            fig = Figure(figsize=(16, 12), dpi=150)
+            FigureCanvasAgg(fig)
+            self._fig_pool.fig, self._fig_pool.axes = fig, fig.subplots(2, 2)
+        else:
+            for ax in fig.axes:
+                ax.clear()
+            # tight_layout must start from the default spacing to lay out like a new figure
+            fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}']
+                                   for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+        return fig, self._fig_pool.axes
     
     def create_shake_map_data(self, impact_lat: float, impact_lon: float, 
                              asteroid_impact: AsteroidImpact, title: str = "Asteroid Impact") -> Dict[str, Any]:
@@ -56,11 +115,12 @@ class VisualizationManager:
         Returns:
             dict: Map data structure with impact zones and markers
         """
-        # Get impact analysis
-        blast_ranges = asteroid_impact.calculate_air_blast()
-        crater = asteroid_impact.calculate_crater_size()
-        energy = asteroid_impact.calculate_kinetic_energy()
-        seismic = asteroid_impact.calculate_seismic_magnitude()
+        # Get impact analysis (shared with the chart methods)
+        analysis = asteroid_impact.get_comprehensive_analysis()
+        blast_ranges = analysis['air_blast_ranges']
+        crater = analysis['crater']
+        energy = analysis['energy']
+        seismic = analysis['seismic']
         
         # Create base map configuration
         map_data = {
@@ -79,7 +139,7 @@ class VisualizationManager:
                     'crater_diameter_km': round(crater['diameter_km'], 2),
                     'crater_depth_m': round(crater['depth_m'], 0),
                     'asteroid_diameter_m': asteroid_impact.diameter,
-                    'impact_velocity_km_s': round(asteroid_impact.velocity / 1000, 1)
+                    'impact_velocity_km_s': round(asteroid_impact.velocity_km_s, 1)
                 }
             },
             'zones': [],
@@ -100,58 +160,25 @@ class VisualizationManager:
                 'color': self.zone_colors['crater'],
                 'fillOpacity': 0.7,
                 'weight': 3,
-                'popup': f"🕳️ Crater<br>Diameter: {crater['diameter_km']:.2f} km<br>Depth: {crater['depth_m']:.0f} m"
+                'popup': self._CRATER_POPUP.format(crater['diameter_km'], crater['depth_m'])
             })
         
-        # Add blast effect zones
+        # Add blast effect zones, innermost first
         if blast_ranges:
-            # Severe damage zone (20 psi)
-            if '20_psi_km' in blast_ranges and blast_ranges['20_psi_km'] > 0:
-                map_data['zones'].append({
-                    'type': 'severe_damage',
-                    'center': {'lat': impact_lat, 'lng': impact_lon},
-                    'radius_m': blast_ranges['20_psi_km'] * 1000,
-                    'color': self.zone_colors['severe'],
-                    'fillOpacity': 0.3,
-                    'weight': 2,
-                    'popup': f"💥 Severe Destruction Zone<br>20 psi overpressure<br>Radius: {blast_ranges['20_psi_km']:.1f} km"
-                })
-            
-            # Heavy damage zone (5 psi)
-            if '5_psi_km' in blast_ranges and blast_ranges['5_psi_km'] > 0:
-                map_data['zones'].append({
-                    'type': 'heavy_damage',
-                    'center': {'lat': impact_lat, 'lng': impact_lon},
-                    'radius_m': blast_ranges['5_psi_km'] * 1000,
-                    'color': self.zone_colors['heavy'],
-                    'fillOpacity': 0.2,
-                    'weight': 2,
-                    'popup': f"🏢 Heavy Damage Zone<br>5 psi overpressure<br>Radius: {blast_ranges['5_psi_km']:.1f} km"
-                })
-            
-            # Light damage zone (1 psi)
-            if '1_psi_km' in blast_ranges and blast_ranges['1_psi_km'] > 0:
-                map_data['zones'].append({
-                    'type': 'light_damage',
-                    'center': {'lat': impact_lat, 'lng': impact_lon},
-                    'radius_m': blast_ranges['1_psi_km'] * 1000,
-                    'color': self.zone_colors['light'],
-                    'fillOpacity': 0.1,
-                    'weight': 2,
-                    'popup': f"🪟 Light Damage Zone<br>1 psi overpressure<br>Radius: {blast_ranges['1_psi_km']:.1f} km"
-                })
-            
-            # Thermal radiation zone
-            if 'thermal_3rd_degree_km' in blast_ranges and blast_ranges['thermal_3rd_degree_km'] > 0:
-                map_data['zones'].append({
-                    'type': 'thermal',
-                    'center': {'lat': impact_lat, 'lng': impact_lon},
-                    'radius_m': blast_ranges['thermal_3rd_degree_km'] * 1000,
-                    'color': self.zone_colors['thermal'],
-                    'fillOpacity': 0.1,
-                    'weight': 1,
-                    'popup': f"🔥 Thermal Radiation Zone<br>3rd degree burns<br>Radius: {blast_ranges['thermal_3rd_degree_km']:.1f} km"
-                })
+            zone_colors = self.zone_colors
+            zones = map_data['zones']
+            for key, zone_type, color_key, opacity, weight, popup in self._BLAST_ZONE_SPEC:
+                radius_km = blast_ranges.get(key, 0)
+                if radius_km > 0:
+                    zones.append({
+                        'type': zone_type,
+                        'center': {'lat': impact_lat, 'lng': impact_lon},
+                        'radius_m': radius_km * 1000,
+                        'color': zone_colors[color_key],
+                        'fillOpacity': opacity,
+                        'weight': weight,
+                        'popup': popup.format(radius_km)
+                    })
         
         return map_data
     
@@ -195,6 +222,7 @@ class VisualizationManager:
         
         # Blast ranges
         blast_data = analysis['air_blast_ranges']
+        zone_colors = self.zone_colors
         
         chart_data = {
             'energy': {
@@ -225,40 +253,46 @@ class VisualizationManager:
             'blast_ranges': {
                 'title': 'Blast Effect Ranges (km)',
                 'data': [
-                    {'zone': 'Severe (20 psi)', 'range_km': blast_data.get('20_psi_km', 0), 'color': self.zone_colors['severe']},
-                    {'zone': 'Heavy (5 psi)', 'range_km': blast_data.get('5_psi_km', 0), 'color': self.zone_colors['heavy']},
-                    {'zone': 'Light (1 psi)', 'range_km': blast_data.get('1_psi_km', 0), 'color': self.zone_colors['light']},
-                    {'zone': 'Thermal Burns', 'range_km': blast_data.get('thermal_3rd_degree_km', 0), 'color': self.zone_colors['thermal']}
+                    {'zone': 'Severe (20 psi)', 'range_km': blast_data.get('20_psi_km', 0), 'color': zone_colors['severe']},
+                    {'zone': 'Heavy (5 psi)', 'range_km': blast_data.get('5_psi_km', 0), 'color': zone_colors['heavy']},
+                    {'zone': 'Light (1 psi)', 'range_km': blast_data.get('1_psi_km', 0), 'color': zone_colors['light']},
+                    {'zone': 'Thermal Burns', 'range_km': blast_data.get('thermal_3rd_degree_km', 0), 'color': zone_colors['thermal']}
                 ]
             },
             'summary': {
                 'asteroid_diameter_m': asteroid_impact.diameter,
-                'impact_velocity_km_s': asteroid_impact.velocity / 1000,
+                'impact_velocity_km_s': asteroid_impact.velocity_km_s,
                 'energy_megatons': energy_data['energy_tnt_megatons'],
                 'seismic_magnitude': seismic_data['moment_magnitude'],
                 'crater_diameter_km': crater_data['diameter_km'],
-                'max_damage_range_km': max(blast_data.values()) if blast_data else 0
+                'max_damage_range_km': max(blast_data.values(), default=0)
             }
         }
         
         return chart_data
     
     def generate_matplotlib_chart(self, asteroid_impact: AsteroidImpact, 
-                                 chart_type: str = 'comprehensive') -> str:
+                                 chart_type: str = 'comprehensive',
+                                 chart_format: str = 'png') -> str:
         """
-        Generate matplotlib chart and return as base64 encoded string.
+        Generate matplotlib chart and return it as a string.
         
         Args:
             asteroid_impact (AsteroidImpact): Impact analysis object
             chart_type (str): Type of chart to generate
+            chart_format (str): 'png' or 'webp' for a base64 encoded raster image,
+                                'svg' for SVG markup (no rasterizing or base64 step)
             
         Returns:
-            str: Base64 encoded image
+            str: Base64 encoded image, or the SVG document for 'svg'
         """
+        if chart_format not in ('png', 'webp', 'svg'):
+            raise ValueError(f"Unsupported chart format: {chart_format}")
+        
         analysis = asteroid_impact.get_comprehensive_analysis()
         
         if chart_type == 'comprehensive':
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            fig, ((ax1, ax2), (ax3, ax4)) = self._comprehensive_figure()
             fig.suptitle('🌍☄️ Asteroid Impact Analysis', fontsize=16, fontweight='bold')
             
             # 1. Energy visualization
@@ -294,7 +328,7 @@ class VisualizationManager:
                 }
             
             # Limit to 5 for chart readability
-            limited_earthquakes = dict(list(historical_earthquakes.items())[:4])
+            limited_earthquakes = dict(islice(historical_earthquakes.items(), 4))
             famous_earthquakes = {'This Impact': seismic_data['moment_magnitude']}
             famous_earthquakes.update(limited_earthquakes)
             
@@ -328,40 +362,53 @@ class VisualizationManager:
                 ax4.text(0.5, 0.5, 'No blast data available', ha='center', va='center', transform=ax4.transAxes)
                 ax4.set_title('🌊 Blast Effect Ranges')
             
-            plt.tight_layout()
+            fig.tight_layout()
         
-        # Convert plot to base64 string
+        # Convert plot to a string; the figure stays open for the next chart.
+        # tight_layout has already fitted the axes, so the output skips savefig's
+        # extra bbox_inches='tight' draw and PNGs come straight from the Agg canvas.
         buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close(fig)
+        if chart_format == 'svg':
+            fig.savefig(buffer, format='svg')
+            return buffer.getvalue().decode('utf-8')
+        
+        if chart_format == 'png':
+            fig.canvas.print_png(buffer)
+        else:
+            fig.savefig(buffer, format=chart_format)
+        # Encode straight from the buffer's memory instead of copying it out first
+        with buffer.getbuffer() as image:
+            image_base64 = base64.b64encode(image).decode('ascii')
+        buffer.close()
         
         return image_base64
     
     def create_parameter_study_chart(self, parameter: str, values: List[float], 
-                                   results: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                   metrics: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """
         Create parameter study chart data.
         
         Args:
             parameter (str): Parameter being studied
             values (list): Parameter values
-            results (list): Analysis results for each value
+            metrics (dict): Per-value metric arrays from analyze_impacts_batch
             
         Returns:
             dict: Chart data for parameter study
         """
+        energy_mt = metrics['energy_tnt_megatons']
+        energy_range = float(energy_mt.max()) / float(energy_mt.min())
+        
         chart_data = {
             'parameter': parameter,
             'title': f'Parameter Study: {parameter.title()} Effects',
             'data': {
                 'parameter_values': values,
-                'energy_mt': [r['energy']['energy_tnt_megatons'] for r in results],
-                'seismic_magnitude': [r['seismic']['moment_magnitude'] for r in results],
-                'crater_diameter_km': [r['crater']['diameter_km'] for r in results],
-                'severe_damage_km': [r['air_blast_ranges'].get('20_psi_km', 0) for r in results],
-                'light_damage_km': [r['air_blast_ranges'].get('1_psi_km', 0) for r in results]
+                'energy_mt': energy_mt.tolist(),
+                'seismic_magnitude': metrics['moment_magnitude'].tolist(),
+                'crater_diameter_km': metrics['crater_diameter_km'].tolist(),
+                'severe_damage_km': metrics['20_psi_km'].tolist(),
+                'light_damage_km': metrics['1_psi_km'].tolist()
             },
             'charts': [
                 {
@@ -370,7 +417,7 @@ class VisualizationManager:
                     'y_label': 'Energy (Megatons TNT)',
                     'data_key': 'energy_mt',
                     'color': 'red',
-                    'scale': 'log' if max([r['energy']['energy_tnt_megatons'] for r in results]) / min([r['energy']['energy_tnt_megatons'] for r in results]) > 100 else 'linear'
+                    'scale': 'log' if energy_range > 100 else 'linear'
                 },
                 {
                     'title': 'Seismic Magnitude vs ' + parameter.title(),